@@ -0,0 +1,536 @@
+"""
+An in-process fake Rubrik cluster used to measure the throughput and latency of the SDK without a real cluster.
+
+`FakeCDM` serves the endpoints used by the SDK over HTTPS with keep-alive connections, so every API call goes through the
+real transport, serialization and job polling code of `_common_api()`. Its objects come from a `SyntheticInventory` of
+configurable size, generated from a seed so every run sees the same inventory, and a fixed or per-endpoint latency can be
+injected into each response. Run from the root of the repository to serve an inventory until interrupted:
+
+    python -m benchmarks.fake_cdm --vms 10000 --hosts 500 --latency 0.005 --port 8443
+
+and connect to it with `rubrik_cdm.Connect("127.0.0.1:8443", "admin", "password")`. The certificate is self-signed and
+generated with the `openssl` command unless `certfile` and `keyfile` are provided.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer  # Python 3+
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, unquote, urlparse
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer  # Python 2.X
+    from SocketServer import ThreadingMixIn
+    from urllib import unquote
+    from urlparse import parse_qs, urlparse
+
+CLUSTER_ID = "00000000-0000-0000-0000-000000000000"
+
+# The GraphQL connections served by the fake cluster and the inventory collection each one reads from
+GRAPHQL_CONNECTIONS = {"hostConnection": "hosts", "nasShareConnection": "shares"}
+
+_GRAPHQL_FIELD = re.compile(r"(?:(\w+)\s*:\s*)?\b({})\s*(?:\(([^)]*)\))?".format("|".join(GRAPHQL_CONNECTIONS)))
+_GRAPHQL_ARGUMENT = re.compile(r'(\w+)\s*:\s*(\$\w+|"[^"]*"|-?\d+|\w+)')
+
+
+def _object_id(prefix, index, kind):
+    return "{}:::{:08x}-{}-0000-0000-{:012d}".format(prefix, index, kind, index)
+
+
+class SyntheticInventory(object):
+    """A deterministic inventory of SLA Domains, vSphere VMs, physical hosts, MSSQL instances and databases and NAS shares. The
+    same arguments always generate the same objects, names, IDs and SLA Domain assignments.
+
+    Keyword Arguments:
+        vms {int} -- The number of vSphere VMs. (default: {1000})
+        hosts {int} -- The number of physical hosts. Every second host runs Windows with one MSSQL instance. (default: {100})
+        slas {int} -- The number of SLA Domains. (default: {10})
+        databases_per_instance {int} -- The number of databases in each MSSQL instance. (default: {5})
+        shares {int} -- The number of NAS shares. (default: {100})
+        seed {int} -- The seed used to assign objects to SLA Domains. (default: {0})
+    """
+
+    def __init__(self, vms=1000, hosts=100, slas=10, databases_per_instance=5, shares=100, seed=0):
+        generator = random.Random(seed)
+
+        self.slas = [{
+            "id": _object_id("SlaDomain", index, "0001"),
+            "name": "sla{:03d}".format(index),
+            "primaryClusterId": CLUSTER_ID,
+            "numVms": 0,
+        } for index in range(slas)]
+
+        def protection():
+            if not self.slas or generator.random() < 0.1:
+                return {"configuredSlaDomainId": "INHERIT", "effectiveSlaDomainId": "UNPROTECTED", "effectiveSlaDomainName": "Unprotected"}
+            sla = generator.choice(self.slas)
+            return {"configuredSlaDomainId": sla["id"], "effectiveSlaDomainId": sla["id"], "effectiveSlaDomainName": sla["name"]}
+
+        self.hosts = []
+        for index in range(hosts):
+            hostname = "host{:05d}.example.com".format(index)
+            host = {
+                "id": _object_id("Host", index, "0002"),
+                "name": hostname,
+                "hostname": hostname,
+                "operatingSystemType": "Windows" if index % 2 else "Linux",
+                "status": "Connected",
+                "primaryClusterId": CLUSTER_ID,
+            }
+            host.update(protection())
+            self.hosts.append(host)
+
+        self.vms = []
+        for index in range(vms):
+            vm = {
+                "id": _object_id("VirtualMachine", index, "0003"),
+                "name": "vm{:06d}".format(index),
+                "hostId": _object_id("VmwareHost", index % 50, "0004"),
+                "ipAddress": "10.{}.{}.{}".format(index // 65536 % 256, index // 256 % 256, index % 256),
+                "isRelic": False,
+                "primaryClusterId": CLUSTER_ID,
+                "moid": "vm-{}".format(index),
+            }
+            vm.update(protection())
+            self.vms.append(vm)
+
+        self.mssql_instances = []
+        self.mssql_dbs = []
+        for host in self.hosts:
+            if host["operatingSystemType"] != "Windows":
+                continue
+            instance_index = len(self.mssql_instances)
+            instance = {
+                "id": _object_id("MssqlInstance", instance_index, "0005"),
+                "name": "MSSQLSERVER",
+                "rootProperties": {"rootId": host["id"], "rootName": host["hostname"], "rootType": "Host"},
+                "primaryClusterId": CLUSTER_ID,
+            }
+            instance.update(protection())
+            self.mssql_instances.append(instance)
+            for database_index in range(databases_per_instance):
+                database = {
+                    "id": _object_id("MssqlDatabase", instance_index * databases_per_instance + database_index, "0006"),
+                    "name": "db{:02d}".format(database_index),
+                    "instanceId": instance["id"],
+                    "instanceName": instance["name"],
+                    "rootProperties": instance["rootProperties"],
+                    "isRelic": False,
+                    "primaryClusterId": CLUSTER_ID,
+                }
+                database.update(protection())
+                self.mssql_dbs.append(database)
+
+        self.shares = []
+        for index in range(shares):
+            host = self.hosts[index % len(self.hosts)] if self.hosts else {"id": None, "hostname": None}
+            share = {
+                "id": _object_id("HostShare", index, "0007"),
+                "exportPoint": "/export/share{:05d}".format(index),
+                "shareType": "NFS",
+                "hostId": host["id"],
+                "hostname": host["hostname"],
+                "primaryClusterId": CLUSTER_ID,
+            }
+            share.update(protection())
+            self.shares.append(share)
+
+        self.by_id = {}
+        for collection in [self.slas, self.hosts, self.vms, self.mssql_instances, self.mssql_dbs, self.shares]:
+            for item in collection:
+                self.by_id[item["id"]] = item
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    """A threaded HTTP server that performs the TLS handshake of each connection in the thread that serves it."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, handler, context, cdm):
+        HTTPServer.__init__(self, address, handler)
+        self.context = context
+        self.cdm = cdm
+
+    def get_request(self):
+        connection, address = self.socket.accept()
+        # Send each response as soon as it is written instead of waiting for the client to acknowledge the headers
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return self.context.wrap_socket(connection, server_side=True, do_handshake_on_connect=False), address
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Dispatches each request to the `FakeCDM` that owns the server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, response = self.server.cdm.handle(self.command, self.path, self.headers, body)
+
+        content = json.dumps(response).encode("utf-8") if response is not None else b""
+        self.send_response(status)
+        if response is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeCDM(object):
+    """An in-process HTTPS server that implements the Rubrik CDM endpoints used by the SDK on top of a `SyntheticInventory`.
+
+    Keyword Arguments:
+        inventory {SyntheticInventory} -- The objects served by the fake cluster. By default a `SyntheticInventory()` is generated. (default: {None})
+        latency {float or callable} -- The number of seconds added to each response, or a function that receives the HTTP method and path of the request and returns that number. (default: {0})
+        job_polls {int} -- The number of times a job is reported as `RUNNING` before it succeeds. `job_status()` waits 10 seconds between those polls. (default: {0})
+        version {str} -- The Rubrik CDM version reported by the fake cluster. (default: {"5.3.0-p1"})
+        host {str} -- The address the server listens on. (default: {"127.0.0.1"})
+        port {int} -- The port the server listens on. By default a free port is chosen. (default: {0})
+        certfile {str} -- The PEM certificate of the server. By default a self-signed certificate is generated. (default: {None})
+        keyfile {str} -- The PEM private key of `certfile`. (default: {None})
+    """
+
+    def __init__(self, inventory=None, latency=0, job_polls=0, version="5.3.0-p1", host="127.0.0.1", port=0, certfile=None, keyfile=None):
+        self.inventory = inventory if inventory is not None else SyntheticInventory()
+        self.latency = latency
+        self.job_polls = job_polls
+        self.version = version
+        self.host = host
+        self.port = port
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.requests = 0
+        self.sessions = 0
+        self.jobs = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._certificate_directory = None
+        self._routes = [
+            ("POST", r"/api/v1/session", self._create_session),
+            ("DELETE", r"/api/v1/session/me", self._delete_session),
+            ("GET", r"/api/v1/cluster/me", self._cluster),
+            ("GET", r"/api/v1/cluster/me/version", self._cluster_version),
+            ("GET", r"/api/internal/cluster/me/node", self._cluster_nodes),
+            ("GET", r"/api/v[12]/sla_domain", self._list("slas")),
+            ("GET", r"/api/v1/vmware/vm", self._list("vms")),
+            ("GET", r"/api/v1/vmware/vm/(?P<id>[^/]+)", self._detail),
+            ("PATCH", r"/api/v1/vmware/vm/(?P<id>[^/]+)", self._update),
+            ("POST", r"/api/v1/vmware/vm/(?P<id>[^/]+)/snapshot", self._snapshot("vmware/vm", "CREATE_VMWARE_SNAPSHOT")),
+            ("GET", r"/api/v1/host", self._list("hosts")),
+            ("GET", r"/api/v1/host/(?P<id>[^/]+)", self._detail),
+            ("GET", r"/api/internal/host/share", self._list("shares")),
+            ("GET", r"/api/v1/mssql/instance", self._list("mssql_instances")),
+            ("GET", r"/api/v1/mssql/instance/(?P<id>[^/]+)", self._detail),
+            ("PATCH", r"/api/v1/mssql/instance/(?P<id>[^/]+)", self._update),
+            ("GET", r"/api/v1/mssql/db", self._list("mssql_dbs")),
+            ("GET", r"/api/v1/mssql/db/(?P<id>[^/]+)", self._detail),
+            ("PATCH", r"/api/v1/mssql/db/(?P<id>[^/]+)", self._update),
+            ("POST", r"/api/v1/mssql/db/(?P<id>[^/]+)/snapshot", self._snapshot("mssql", "MSSQL_DB_BACKUP")),
+            ("POST", r"/api/internal/sla_domain/(?P<id>[^/]+)/assign", self._assign),
+            ("GET", r"/api/v1/(?P<path>[\w/]+)/request/(?P<id>[^/]+)", self._job_status),
+            ("POST", r"/api/internal/graphql", self._graphql),
+        ]
+
+    @property
+    def node_ip(self):
+        """The `node_ip` to connect to the fake cluster with (ex. 127.0.0.1:8443)."""
+
+        return "{}:{}".format(self.host, self.port)
+
+    def start(self):
+        """Start serving requests from a background thread.
+
+        Returns:
+            FakeCDM -- The fake cluster.
+        """
+
+        certfile, keyfile = self.certfile, self.keyfile
+        if certfile is None:
+            self._certificate_directory = tempfile.mkdtemp(prefix="fake_cdm-")
+            certfile, keyfile = _self_signed_certificate(self._certificate_directory, self.host)
+
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(certfile, keyfile)
+
+        self._server = _Server((self.host, self.port), _Handler, context, self)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake_cdm-FakeCDM")
+        self._thread.daemon = True
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Stop serving requests and remove the generated certificate."""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+        if self._certificate_directory is not None:
+            shutil.rmtree(self._certificate_directory, ignore_errors=True)
+            self._certificate_directory = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def handle(self, method, path, headers, body):
+        """Route a request to the endpoint that implements it.
+
+        Arguments:
+            method {str} -- The HTTP method of the request.
+            path {str} -- The path and query string of the request.
+            headers {dict} -- The headers of the request.
+            body {bytes} -- The body of the request.
+
+        Returns:
+            tuple -- The HTTP status code and the JSON response body, or `None` for an empty body.
+        """
+
+        with self._lock:
+            self.requests += 1
+
+        url = urlparse(path)
+        query = dict((key, values[0]) for key, values in parse_qs(url.query).items())
+
+        latency = self.latency(method, url.path) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+
+        if not headers.get("Authorization"):
+            return 401, {"errorType": "user_error", "message": "The request is not authenticated."}
+
+        try:
+            config = json.loads(body.decode("utf-8")) if body else None
+        except ValueError:
+            return 400, {"errorType": "user_error", "message": "The request body is not valid JSON."}
+
+        for route_method, pattern, endpoint in self._routes:
+            match = re.match(pattern + "$", url.path)
+            if route_method == method and match is not None:
+                arguments = dict((key, unquote(value)) for key, value in match.groupdict().items())
+                return endpoint(query=query, config=config, **arguments)
+
+        return 404, {"errorType": "user_error", "message": "The fake Rubrik cluster does not implement {} {}.".format(method, url.path)}
+
+    def _create_session(self, query, config):
+        with self._lock:
+            self.sessions += 1
+            session = self.sessions
+        return 200, {"id": "session{}".format(session), "token": "token{}".format(session), "userId": "admin"}
+
+    def _delete_session(self, query, config):
+        return 204, None
+
+    def _cluster(self, query, config):
+        return 200, {"id": CLUSTER_ID, "name": "fake-cdm", "version": self.version, "apiVersion": "1", "timezone": {"timezone": "UTC"}}
+
+    def _cluster_version(self, query, config):
+        return 200, {"version": self.version}
+
+    def _cluster_nodes(self, query, config):
+        return 200, {"hasMore": False, "total": 1, "data": [{"id": "RVM000000000001", "ipAddress": self.node_ip, "status": "OK"}]}
+
+    def _list(self, collection):
+        """Return the endpoint that lists a collection of the inventory, filtered and paginated by the query parameters."""
+
+        def endpoint(query, config):
+            items = [item for item in getattr(self.inventory, collection) if _matches(item, query)]
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", len(items)))
+            page = items[offset:offset + limit]
+            return 200, {"hasMore": offset + len(page) < len(items), "total": len(items), "data": page}
+
+        return endpoint
+
+    def _detail(self, query, config, id):
+        item = self.inventory.by_id.get(id)
+        if item is None:
+            return 404, {"errorType": "user_error", "message": "The object '{}' was not found.".format(id)}
+        return 200, item
+
+    def _update(self, query, config, id):
+        item = self.inventory.by_id.get(id)
+        if item is None:
+            return 404, {"errorType": "user_error", "message": "The object '{}' was not found.".format(id)}
+        with self._lock:
+            item.update(config or {})
+        return 200, item
+
+    def _assign(self, query, config, id):
+        sla = self.inventory.by_id.get(id, {"id": id, "name": id})
+        with self._lock:
+            for managed_id in (config or {}).get("managedIds", []):
+                item = self.inventory.by_id.get(managed_id)
+                if item is not None:
+                    item.update({"configuredSlaDomainId": id, "effectiveSlaDomainId": id, "effectiveSlaDomainName": sla["name"]})
+        return 204, None
+
+    def _snapshot(self, path, job_type):
+        """Return the endpoint that starts an on-demand snapshot job of an object."""
+
+        def endpoint(query, config, id):
+            if id not in self.inventory.by_id:
+                return 404, {"errorType": "user_error", "message": "The object '{}' was not found.".format(id)}
+            with self._lock:
+                job_id = "{}_{}:::{}".format(job_type, id, len(self.jobs))
+                self.jobs[job_id] = 0
+            href = "https://{}/api/v1/{}/request/{}".format(self.node_ip, path, job_id)
+            return 202, {"id": job_id, "status": "QUEUED", "progress": 0, "links": [{"href": href, "rel": "self"}]}
+
+        return endpoint
+
+    def _job_status(self, query, config, path, id):
+        with self._lock:
+            if id not in self.jobs:
+                return 404, {"errorType": "user_error", "message": "The job '{}' was not found.".format(id)}
+            polls = self.jobs[id]
+            self.jobs[id] += 1
+
+        if polls < self.job_polls:
+            return 200, {"id": id, "status": "RUNNING", "progress": 100.0 * polls / self.job_polls}
+        return 200, {"id": id, "status": "SUCCEEDED", "progress": 100.0, "endTime": "2020-01-01T00:00:00.000Z"}
+
+    def _graphql(self, query, config):
+        """Serve the `hostConnection` and `nasShareConnection` GraphQL connections with `first`/`after` cursors. Every connection in
+        the query is served, under its alias when it has one, so batched queries are supported."""
+
+        document = (config or {}).get("query") or ""
+        variables = (config or {}).get("variables") or {}
+        data = {}
+
+        for alias, connection, arguments in _GRAPHQL_FIELD.findall(document):
+            values = {}
+            for name, value in _GRAPHQL_ARGUMENT.findall(arguments):
+                if value.startswith("$"):
+                    values[name] = variables.get(value[1:])
+                elif value.startswith('"'):
+                    values[name] = value[1:-1]
+                else:
+                    values[name] = int(value) if value.lstrip("-").isdigit() else value
+            data[alias or connection] = self._connection(GRAPHQL_CONNECTIONS[connection], values)
+
+        if not data:
+            return 200, {"data": None, "errors": [{"message": "The fake Rubrik cluster only serves the {} connections.".format(sorted(GRAPHQL_CONNECTIONS))}]}
+
+        return 200, {"data": data}
+
+    def _connection(self, collection, arguments):
+        filters = {
+            "effectiveSlaDomainId": lambda item, value: item.get("effectiveSlaDomainId") == value,
+            "status": lambda item, value: item.get("status") == value,
+            "operatingSystemType": lambda item, value: (item.get("operatingSystemType") == "Windows") == (value == "Windows"),
+        }
+
+        items = [item for item in getattr(self.inventory, collection)
+                 if all(filters[name](item, value) for name, value in arguments.items() if name in filters and value is not None)]
+
+        offset = int(arguments["after"]) if arguments.get("after") else 0
+        first = arguments.get("first") or len(items)
+        page = items[offset:offset + first]
+        end = offset + len(page)
+
+        return {
+            "count": len(items),
+            "nodes": page,
+            "pageInfo": {"endCursor": str(end), "hasNextPage": end < len(items)},
+        }
+
+
+# The list endpoint query parameters understood by the fake cluster and the item field each one filters on
+_FILTERS = {
+    "name": lambda item, value: value.lower() in (item.get("name") or "").lower(),
+    "hostname": lambda item, value: value.lower() in (item.get("hostname") or "").lower(),
+    "export_point": lambda item, value: item.get("exportPoint") == value,
+    "host_id": lambda item, value: item.get("hostId") == value,
+    "share_type": lambda item, value: item.get("shareType") == value,
+    "effective_sla_domain_id": lambda item, value: item.get("effectiveSlaDomainId") == value,
+    "operating_system_type": lambda item, value: item.get("operatingSystemType") == value,
+    "root_id": lambda item, value: item.get("rootProperties", {}).get("rootId") == value,
+    "instance_id": lambda item, value: item.get("instanceId") == value,
+    "is_relic": lambda item, value: item.get("isRelic", False) == (value == "true"),
+}
+
+
+def _matches(item, query):
+    return all(_FILTERS[name](item, value) for name, value in query.items() if name in _FILTERS)
+
+
+def _self_signed_certificate(directory, host):
+    """Generate a self-signed certificate for `host` with the `openssl` command.
+
+    Arguments:
+        directory {str} -- The directory the certificate and its private key are written to.
+        host {str} -- The address the certificate is issued to.
+
+    Returns:
+        tuple -- The paths of the certificate and its private key.
+    """
+
+    certfile = os.path.join(directory, "cert.pem")
+    keyfile = os.path.join(directory, "key.pem")
+
+    try:
+        with open(os.devnull, "w") as devnull:
+            subprocess.check_call([
+                "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                "-keyout", keyfile, "-out", certfile, "-subj", "/CN={}".format(host)], stdout=devnull, stderr=devnull)
+    except (OSError, subprocess.CalledProcessError):
+        raise RuntimeError("A self-signed certificate could not be generated with the openssl command. Provide a certfile and keyfile instead.")
+
+    return certfile, keyfile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vms", type=int, default=1000, help="The number of vSphere VMs in the inventory.")
+    parser.add_argument("--hosts", type=int, default=100, help="The number of physical hosts in the inventory.")
+    parser.add_argument("--slas", type=int, default=10, help="The number of SLA Domains in the inventory.")
+    parser.add_argument("--shares", type=int, default=100, help="The number of NAS shares in the inventory.")
+    parser.add_argument("--seed", type=int, default=0, help="The seed used to generate the inventory.")
+    parser.add_argument("--latency", type=float, default=0, help="The number of seconds added to each response.")
+    parser.add_argument("--job-polls", type=int, default=0, help="The number of times a job is reported as running.")
+    parser.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    parser.add_argument("--port", type=int, default=8443, help="The port to listen on.")
+    arguments = parser.parse_args()
+
+    inventory = SyntheticInventory(arguments.vms, arguments.hosts, arguments.slas, shares=arguments.shares, seed=arguments.seed)
+    cdm = FakeCDM(inventory, latency=arguments.latency, job_polls=arguments.job_polls, host=arguments.host, port=arguments.port)
+
+    with cdm:
+        print("Serving a fake Rubrik cluster on {} (press Ctrl+C to stop)".format(cdm.node_ip))
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+    print("Served {} requests".format(cdm.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Compare the time taken to decode a large `/v1/vmware/vm` page with each installed JSON codec.
+
+The `previous` row decodes the response three times, as `_common_api()` did before the response body was decoded once
+and reused. Run from the root of the repository:
+
+    python -m benchmarks.json_codec --vms 50000
+"""
+
+import argparse
+import json
+import timeit
+
+import requests
+
+from rubrik_cdm.json_codec import JSON_CODECS, get_json_codec
+from rubrik_cdm.exceptions import RubrikException
+
+
+def vmware_vm_page(vms):
+    """Build the body of a `/v1/vmware/vm` response that contains `vms` virtual machines."""
+
+    return json.dumps({
+        "hasMore": False,
+        "total": vms,
+        "data": [{
+            "id": "VirtualMachine:::{0:08d}-0000-0000-0000-000000000000-vm-{0}".format(index),
+            "name": "vm{:06d}".format(index),
+            "configuredSlaDomainId": "INHERIT",
+            "configuredSlaDomainName": "Inherit",
+            "effectiveSlaDomainId": "UNPROTECTED",
+            "effectiveSlaDomainName": "Unprotected",
+            "effectiveSlaSourceObjectId": "VmwareHost:::{:04d}".format(index % 100),
+            "ipAddress": "10.{}.{}.{}".format(index // 65536 % 256, index // 256 % 256, index % 256),
+            "isRelic": False,
+            "moid": "vm-{}".format(index),
+            "powerStatus": "poweredOn",
+            "slaAssignment": "Derived",
+            "vcenterId": "Vcenter:::00000000-0000-0000-0000-000000000000",
+        } for index in range(vms)],
+    }).encode("utf-8")
+
+
+def response(body):
+    api_request = requests.Response()
+    api_request.status_code = 200
+    api_request._content = body
+    api_request.encoding = "utf-8"
+    return api_request
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vms", type=int, default=50000, help="The number of virtual machines in the page.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of times each decode is timed.")
+    arguments = parser.parse_args()
+
+    body = vmware_vm_page(arguments.vms)
+    api_request = response(body)
+    print("Decoding a {:.1f} MB /v1/vmware/vm page with {} virtual machines".format(len(body) / 1e6, arguments.vms))
+
+    results = [("previous (json x3)", min(timeit.repeat(lambda: [api_request.json() for _ in range(3)], number=1, repeat=arguments.repeat)))]
+
+    for name in JSON_CODECS:
+        try:
+            codec = get_json_codec(name)
+        except RubrikException:
+            print("{} is not installed, skipping".format(name))
+            continue
+        results.append((name, min(timeit.repeat(lambda: codec.decode_response(api_request), number=1, repeat=arguments.repeat))))
+
+    baseline = results[0][1]
+    for name, seconds in results:
+        print("{:<20} {:>8.1f} ms {:>6.1f}x".format(name, seconds * 1000, baseline / seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Compare the time taken by `object_id()` to look up a vSphere host in a synthetic inventory of 50,000 hosts.
+
+The `previous` row downloads every page of `/v1/vmware/host` and scans it, as `object_id()` did before the name filter
+was sent to the Rubrik cluster. The `unfiltered` row is a Rubrik cluster that ignores the name filter, where every page
+is still read to rule out a duplicate name. Run from the root of the repository:
+
+    python -m benchmarks.object_id --hosts 50000
+"""
+
+import argparse
+import json
+import timeit
+
+import requests
+
+try:
+    from urllib.parse import parse_qs, urlparse  # Python 3+
+except ImportError:
+    from urlparse import parse_qs, urlparse  # Python 2.X
+
+from rubrik_cdm import Connect
+
+
+class FakeCluster(object):
+    """Serves paginated `/v1/vmware/host` responses from an in-memory inventory."""
+
+    def __init__(self, hosts, filter_by_name=True):
+        self.hosts = [{
+            "id": "VmwareHost:::{:08d}-0000-0000-0000-000000000000".format(index),
+            "name": "esx{:06d}.example.com".format(index),
+            "configuredSlaDomainId": "INHERIT",
+            "effectiveSlaDomainId": "UNPROTECTED",
+            "primaryClusterId": "00000000-0000-0000-0000-000000000000",
+            "datacenterId": "DataCenter:::{:04d}".format(index % 100),
+        } for index in range(hosts)]
+        self.filter_by_name = filter_by_name
+        self.requests = 0
+        self.bytes = 0
+
+    def request(self, method, url, **kwargs):
+        query = dict((key, values[0]) for key, values in parse_qs(urlparse(url).query).items())
+        hosts = self.hosts
+        if self.filter_by_name and "name" in query:
+            hosts = [host for host in hosts if query["name"].lower() in host["name"].lower()]
+
+        offset = int(query.get("offset", 0))
+        limit = int(query.get("limit", len(hosts)))
+        page = hosts[offset:offset + limit]
+
+        api_request = requests.Response()
+        api_request.status_code = 200
+        api_request._content = json.dumps({
+            "hasMore": offset + len(page) < len(hosts),
+            "total": len(hosts),
+            "data": page,
+        }).encode("utf-8")
+        api_request.encoding = "utf-8"
+
+        self.requests += 1
+        self.bytes += len(api_request._content)
+        return api_request
+
+
+def previous_object_id(rubrik, name):
+    api_request = rubrik._get_all_pages("v1", "/vmware/host?primary_cluster_id=local")
+    return rubrik._object_id_from_response(api_request, name, "vmware_host")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=50000, help="The number of vSphere hosts in the inventory.")
+    parser.add_argument("--repeat", type=int, default=5, help="The number of times each lookup is timed.")
+    arguments = parser.parse_args()
+
+    rubrik = Connect("10.0.1.1", "user", "password")
+    # Look up a host in the middle of the inventory
+    name = "esx{:06d}.example.com".format(arguments.hosts // 2)
+
+    scenarios = [
+        ("previous", FakeCluster(arguments.hosts, filter_by_name=False), previous_object_id),
+        ("unfiltered", FakeCluster(arguments.hosts, filter_by_name=False), lambda rubrik, name: rubrik.object_id(name, "vmware_host")),
+        ("filtered", FakeCluster(arguments.hosts), lambda rubrik, name: rubrik.object_id(name, "vmware_host")),
+    ]
+
+    print("Looking up one vSphere host in an inventory of {} hosts".format(arguments.hosts))
+
+    results = []
+    for label, cluster, lookup in scenarios:
+        rubrik._session.request = cluster.request
+        seconds = min(timeit.repeat(lambda: lookup(rubrik, name), number=1, repeat=arguments.repeat))
+        results.append((label, seconds, cluster.requests // arguments.repeat, cluster.bytes / arguments.repeat))
+
+    baseline = results[0][1]
+    for label, seconds, api_calls, transferred in results:
+        print("{:<12} {:>9.1f} ms {:>8.1f}x {:>6} API calls {:>9.2f} MB".format(
+            label, seconds * 1000, baseline / seconds, api_calls, transferred / 1e6))
+
+    rubrik.close()
+
+
+if __name__ == "__main__":
+    main()
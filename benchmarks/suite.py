@@ -0,0 +1,353 @@
+"""
+Measure the hot paths of the SDK against a local `FakeCDM` and store the results as JSON.
+
+Each benchmark is timed for at least `--min-rounds` rounds and until `--max-time` seconds have passed, after one warmup
+round. Benchmarks that depend on the size of the inventory run once per `--sizes` entry, each against its own fake
+cluster. Save the results of one SDK version with `--output` and compare another version against them with `--compare`,
+which exits with status 1 when the median of a benchmark regressed by more than `--threshold`. Run from the root of the
+repository:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --compare before.json --output after.json
+"""
+
+import argparse
+import datetime
+import json
+import math
+import platform
+import re
+import subprocess
+import sys
+import timeit
+import warnings
+from itertools import cycle
+
+from benchmarks.fake_cdm import FakeCDM, SyntheticInventory
+
+# The version of the JSON results, increased whenever a field changes meaning
+RESULTS_VERSION = 1
+
+BENCHMARKS = []
+
+
+class Benchmark(object):
+    """A registered benchmark.
+
+    Arguments:
+        name {str} -- The name of the benchmark.
+        group {str} -- The group the benchmark is reported in.
+        setup {callable} -- A function that receives the connection and the fake cluster and returns the function to time.
+        sized {bool} -- Flag that determines whether the benchmark runs once per inventory size.
+        cluster {bool} -- Flag that determines whether the benchmark needs a fake cluster.
+        measured {bool} -- Flag that determines whether the timed function returns its own duration in seconds.
+    """
+
+    def __init__(self, name, group, setup, sized, cluster, measured):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.sized = sized
+        self.cluster = cluster
+        self.measured = measured
+
+
+def benchmark(group, sized=False, cluster=True, measured=False):
+    """Register the decorated function as a benchmark. The function receives the connection and the fake cluster and returns
+    the function to time, which may return the number of items it processed."""
+
+    def register(setup):
+        BENCHMARKS.append(Benchmark(setup.__name__, group, setup, sized, cluster, measured))
+        return setup
+
+    return register
+
+
+@benchmark("api")
+def get(rubrik, cdm):
+    return lambda: rubrik.get("v1", "/cluster/me/version")
+
+
+@benchmark("api")
+def post(rubrik, cdm):
+    sla_id = cdm.inventory.slas[0]["id"]
+    return lambda: rubrik.post("internal", "/sla_domain/{}/assign".format(sla_id), {"managedIds": []})
+
+
+@benchmark("object_id", sized=True)
+def object_id(rubrik, cdm):
+    name = cdm.inventory.vms[len(cdm.inventory.vms) // 2]["name"]
+    return lambda: rubrik.object_id(name, "vmware")
+
+
+@benchmark("get_sla_objects", sized=True)
+def get_sla_objects_vmware(rubrik, cdm):
+    sla = cdm.inventory.slas[0]["name"]
+    return lambda: len(rubrik.get_sla_objects(sla, "vmware", page_size=1000))
+
+
+@benchmark("get_sla_objects", sized=True)
+def get_sla_objects_graphql(rubrik, cdm):
+    sla = cdm.inventory.slas[0]["name"]
+    return lambda: len(rubrik.get_sla_objects(sla, "linux_and_unix_host", page_size=1000))
+
+
+@benchmark("flows")
+def assign_sla(rubrik, cdm):
+    vm = cdm.inventory.vms[0]["name"]
+    # Alternate between two SLA Domains so every call changes the assignment
+    slas = cycle([cdm.inventory.slas[0]["name"], cdm.inventory.slas[1]["name"]])
+    return lambda: rubrik.assign_sla(vm, next(slas), "vmware")
+
+
+@benchmark("flows")
+def on_demand_snapshot(rubrik, cdm):
+    vm = cdm.inventory.vms[0]["name"]
+    return lambda: rubrik.on_demand_snapshot(vm, "vmware")
+
+
+@benchmark("flows")
+def job_status(rubrik, cdm):
+    _, job_status_url = rubrik.on_demand_snapshot(cdm.inventory.vms[0]["name"], "vmware")
+    return lambda: rubrik.job_status(job_status_url)
+
+
+@benchmark("pagination", sized=True)
+def paginate(rubrik, cdm):
+    return lambda: sum(1 for _ in rubrik.paginate("v1", "/vmware/vm", page_size=1000))
+
+
+@benchmark("pagination", sized=True)
+def paginate_stream(rubrik, cdm):
+    return lambda: sum(1 for _ in rubrik.paginate("v1", "/vmware/vm", page_size=1000, stream=True))
+
+
+@benchmark("import", cluster=False, measured=True)
+def import_time(rubrik, cdm):
+
+    def measure():
+        # Each line of -X importtime is "import time: self [us] | cumulative [us] | module"
+        output = subprocess.check_output([sys.executable, "-X", "importtime", "-c", "import rubrik_cdm"], stderr=subprocess.STDOUT)
+        for line in output.decode("utf-8").splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == "rubrik_cdm":
+                return int(fields[1]) / 1e6
+        raise RuntimeError("The import time of rubrik_cdm was not reported.")
+
+    return measure
+
+
+def statistics(samples):
+    """Summarize the duration of each round of a benchmark.
+
+    Arguments:
+        samples {list} -- The number of seconds each round took.
+
+    Returns:
+        dict -- The `min`, `max`, `mean`, `stddev`, `median` and `p95` number of seconds, the number of `rounds` and the `ops` per second.
+    """
+
+    ordered = sorted(samples)
+    rounds = len(ordered)
+    mean = sum(ordered) / rounds
+    middle = rounds // 2
+    median = ordered[middle] if rounds % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
+    return {
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": mean,
+        "stddev": math.sqrt(sum((sample - mean) ** 2 for sample in ordered) / (rounds - 1)) if rounds > 1 else 0.0,
+        "median": median,
+        "p95": ordered[min(rounds - 1, int(math.ceil(0.95 * rounds)) - 1)],
+        "rounds": rounds,
+        "ops": 1 / mean if mean else None,
+    }
+
+
+def measure(function, measured=False, min_rounds=5, max_time=1.0):
+    """Time `function` after one warmup round.
+
+    Arguments:
+        function {callable} -- The function to time.
+
+    Keyword Arguments:
+        measured {bool} -- Flag that determines whether `function` returns its own duration in seconds. (default: {False})
+        min_rounds {int} -- The minimum number of rounds. (default: {5})
+        max_time {float} -- The number of seconds after which no further round is started once `min_rounds` is reached. (default: {1.0})
+
+    Returns:
+        tuple -- The number of seconds each round took and the value returned by the last round.
+    """
+
+    result = function()
+
+    samples = []
+    started = timeit.default_timer()
+    while len(samples) < min_rounds or timeit.default_timer() - started < max_time:
+        before = timeit.default_timer()
+        result = function()
+        samples.append(result if measured else timeit.default_timer() - before)
+
+    return samples, result
+
+
+def run(benchmarks=None, sizes=(1000, 10000, 100000), min_rounds=5, max_time=1.0, latency=0, name_filter=None):
+    """Run the benchmarks and return their results.
+
+    Keyword Arguments:
+        benchmarks {list} -- The benchmarks to run. By default every registered benchmark is run. (default: {None})
+        sizes {tuple} -- The number of vSphere VMs in each inventory that sized benchmarks run against. The smallest inventory is used by the other benchmarks. (default: {(1000, 10000, 100000)})
+        min_rounds {int} -- The minimum number of rounds of each benchmark. (default: {5})
+        max_time {float} -- The number of seconds each benchmark is repeated for once `min_rounds` is reached. (default: {1.0})
+        latency {float} -- The number of seconds the fake cluster adds to each response. (default: {0})
+        name_filter {str} -- A regular expression that the name of a benchmark must match to run. (default: {None})
+
+    Returns:
+        list -- The `name`, `group`, `params`, `stats` and `extra_info` of each benchmark.
+    """
+
+    import rubrik_cdm
+
+    benchmarks = [item for item in (benchmarks if benchmarks is not None else BENCHMARKS)
+                  if name_filter is None or re.search(name_filter, item.name)]
+    sizes = sorted(sizes)
+    results = []
+
+    def record(item, size, rubrik=None, cdm=None):
+        name = "{}[{}]".format(item.name, size) if item.sized else item.name
+        function = item.setup(rubrik, cdm)
+        requests = cdm.requests if cdm is not None else 0
+
+        samples, result = measure(function, item.measured, min_rounds, max_time)
+
+        stats = statistics(samples)
+        extra_info = {}
+        if cdm is not None:
+            # Every round and the warmup round make the same API calls
+            extra_info["api_calls"] = (cdm.requests - requests) / float(len(samples) + 1)
+        if isinstance(result, int) and not isinstance(result, bool) and not item.measured:
+            extra_info["items"] = result
+            extra_info["items_per_second"] = result / stats["median"] if stats["median"] else None
+
+        results.append({
+            "name": name,
+            "group": item.group,
+            "params": {"inventory_size": size} if item.sized else {},
+            "stats": stats,
+            "extra_info": extra_info,
+        })
+        print("{:<36} {:>10.3f} ms median {:>10.3f} ms p95 {:>6} rounds".format(name, stats["median"] * 1000, stats["p95"] * 1000, stats["rounds"]))
+
+    for item in benchmarks:
+        if not item.cluster:
+            record(item, None)
+
+    for size in sizes:
+        selected = [item for item in benchmarks if item.cluster and (item.sized or size == sizes[0])]
+        if not selected:
+            continue
+
+        inventory = SyntheticInventory(vms=size, hosts=max(size // 10, 10), slas=10, shares=max(size // 10, 10))
+        with FakeCDM(inventory, latency=latency) as cdm:
+            with warnings.catch_warnings():
+                # The fake cluster uses a self-signed certificate
+                warnings.simplefilter("ignore")
+                with rubrik_cdm.Connect(cdm.node_ip, "admin", "password") as rubrik:
+                    for item in selected:
+                        record(item, size, rubrik, cdm)
+
+    return results
+
+
+def results_document(results, options):
+    """Build the JSON document that stores the results of a run along with the SDK version and machine they were measured on."""
+
+    import rubrik_cdm
+
+    # The version is only available on a connection, which does not make an API call until it is used
+    with rubrik_cdm.Connect("127.0.0.1", "admin", "password") as rubrik:
+        sdk_version = rubrik.sdk_version
+
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.STDOUT).decode("utf-8").strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "results_version": RESULTS_VERSION,
+        "sdk_version": sdk_version,
+        "python_version": platform.python_version(),
+        "machine_info": {"platform": platform.platform(), "processor": platform.processor(), "implementation": platform.python_implementation()},
+        "commit": commit,
+        "datetime": datetime.datetime.utcnow().isoformat() + "Z",
+        "options": options,
+        "benchmarks": results,
+    }
+
+
+def compare(baseline, results, threshold=0.1):
+    """Compare the median of each benchmark with the median stored in a previous run.
+
+    Arguments:
+        baseline {dict} -- The JSON document of the previous run.
+        results {list} -- The results of the current run.
+
+    Keyword Arguments:
+        threshold {float} -- The relative increase of the median that is reported as a regression. (default: {0.1})
+
+    Returns:
+        list -- The `name`, `baseline` and `current` median, relative `change` and `regression` flag of each benchmark in both runs.
+    """
+
+    previous = dict((item["name"], item) for item in baseline.get("benchmarks", []))
+    comparison = []
+
+    for item in results:
+        if item["name"] not in previous:
+            continue
+        before = previous[item["name"]]["stats"]["median"]
+        after = item["stats"]["median"]
+        change = (after - before) / before if before else 0.0
+        comparison.append({"name": item["name"], "baseline": before, "current": after, "change": change, "regression": change > threshold})
+
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="The comma separated inventory sizes of the sized benchmarks.")
+    parser.add_argument("--min-rounds", type=int, default=5, help="The minimum number of rounds of each benchmark.")
+    parser.add_argument("--max-time", type=float, default=1.0, help="The number of seconds each benchmark is repeated for.")
+    parser.add_argument("--latency", type=float, default=0, help="The number of seconds the fake cluster adds to each response.")
+    parser.add_argument("--filter", help="A regular expression that the name of a benchmark must match to run.")
+    parser.add_argument("--output", help="The path of the JSON file the results are written to.")
+    parser.add_argument("--compare", help="The path of the JSON results of a previous run to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="The relative increase of the median reported as a regression.")
+    arguments = parser.parse_args()
+
+    sizes = [int(size) for size in arguments.sizes.split(",")]
+    options = {"sizes": sizes, "min_rounds": arguments.min_rounds, "max_time": arguments.max_time, "latency": arguments.latency, "filter": arguments.filter}
+
+    results = run(sizes=sizes, min_rounds=arguments.min_rounds, max_time=arguments.max_time, latency=arguments.latency, name_filter=arguments.filter)
+
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(results_document(results, options), output, indent=2, sort_keys=True)
+        print("Wrote the results to {}".format(arguments.output))
+
+    if arguments.compare:
+        with open(arguments.compare) as baseline_file:
+            comparison = compare(json.load(baseline_file), results, arguments.threshold)
+
+        print("\nCompared with {}".format(arguments.compare))
+        for item in comparison:
+            print("{:<36} {:>10.3f} ms {:>10.3f} ms {:>+8.1%}{}".format(
+                item["name"], item["baseline"] * 1000, item["current"] * 1000, item["change"], "  REGRESSION" if item["regression"] else ""))
+
+        if any(item["regression"] for item in comparison):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 "rubrik: A Python package for interacting with the Rubrik CDM API."
 
-from .rubrik_cdm import Connect
-from .rubrik_cdm import Bootstrap
+import importlib
+import sys
 
 import logging
 
@@ -16,3 +16,45 @@ log.addHandler(console_output_handler)
 __version__ = "2.0.10"
 __author__ = "Rubrik Build"
 __all__ = []
+
+# The public classes and the module that defines each of them. They are imported the first time they are accessed so that
+# `import rubrik_cdm` does not load requests, aiohttp or the Rubrik API subsystems until they are needed.
+_LAZY_ATTRIBUTES = {
+    "Connect": "rubrik_cdm",
+    "Bootstrap": "rubrik_cdm",
+    "JobWatcher": "job_watcher",
+    "RetryPolicy": "retry",
+}
+
+if sys.version_info >= (3, 5):
+    _LAZY_ATTRIBUTES["AsyncConnect"] = "async_rubrik_cdm"
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name in _LAZY_ATTRIBUTES:
+            value = getattr(importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__), name)
+        else:
+            # Submodules such as rubrik_cdm.cluster are also loaded on first access
+            try:
+                value = importlib.import_module("." + name, __name__)
+            except ImportError as error:
+                if getattr(error, "name", None) != "{}.{}".format(__name__, name):
+                    raise
+                raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+else:
+    # Module level __getattr__ is only supported on Python 3.7+ (PEP 562)
+    from .rubrik_cdm import Connect
+    from .rubrik_cdm import Bootstrap
+    from .job_watcher import JobWatcher
+    from .retry import RetryPolicy
+
+    if sys.version_info >= (3, 5):
+        from .async_rubrik_cdm import AsyncConnect
@@ -23,16 +23,78 @@ This module contains the Rubrik SDK API class.
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import threading
 import time
 try:
     from urllib import quote  # Python 2.X
 except ImportError:
     from urllib.parse import quote  # Python 3+
 from random import choice
+from urllib3.exceptions import ConnectTimeoutError
+from .context import FUNCTION_NAME
+from .graphql import BATCH_OPERATION_NAME, merge_operations, split_response
+from .json_stream import JsonArrayStream
+from .metrics import NULL_API_CALL
+from .node_pool import NODE_FAILURE_STATUS_CODES
+from .retry import CONNECTION_ERROR, TIMEOUT
 from .exceptions import APICallException, InvalidParameterException, RubrikException, InvalidTypeException
 import inspect
 
+# Job states reported by the Rubrik cluster for asynchronous requests
+JOB_IN_PROGRESS_STATUS = [
+    "QUEUED",
+    "RUNNING",
+    "FINISHING",
+    "TO_FINISH",
+    "TO_RETRY",
+    "ACQUIRING",
+    "TO_YIELDING",
+    "YIELDING",
+    "TO_YIELDED",
+    "YIELDED"]
+
+JOB_CANCELING_STATUS = ["CANCELING", "TO_CANCEL"]
+
+JOB_FAILING_STATUS = ["TO_UNDO", "UNDOING"]
+
+# `_common_api()` authentication value that sends the username and password even when session tokens are enabled
+BASIC_AUTHENTICATION = "basic"
+
+# The number of bytes read from a streamed response at a time
+STREAM_CHUNK_SIZE = 65536
+
+
+class _LogPayload(object):
+    """Defers converting a request body or response to a string until a log record is emitted, capping it at `limit` characters.
+
+    Arguments:
+        payload {object} -- The request body or response text to log.
+
+    Keyword Arguments:
+        limit {int} -- The maximum number of characters to log. A value of 0 redacts the payload. (default: {None})
+    """
+
+    __slots__ = ("payload", "limit")
+
+    def __init__(self, payload, limit=None):
+        self.payload = payload
+        self.limit = limit
+
+    def __str__(self):
+        if isinstance(self.payload, bytes) and not isinstance(self.payload, str):
+            # Request bodies serialized by some JSON codecs are UTF-8 encoded bytes
+            text = self.payload.decode("utf-8", "replace")
+        else:
+            text = str(self.payload)
+
+        if self.limit is None or len(text) <= self.limit:
+            return text
+        elif self.limit == 0:
+            return "<{} characters redacted>".format(len(text))
+
+        return "{}... <{} more characters>".format(text[:self.limit], len(text) - self.limit)
+
 
 class Api():
     """This class contains the base API methods that can be called independently or internally in standalone functions."""
@@ -40,7 +102,81 @@ class Api():
     def __init__(self, node_ip):
         super().__init__(node_ip)
 
-    def _common_api(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, timeout=15, authentication=True, params=None, gql_operation_name=None, gql_query=None, gql_variables=None):  # pylint: ignore
+    @property
+    def function_name(self):
+        """str -- The name of the SDK function being called in the current thread or asyncio task. It is sent to the Rubrik cluster in the `rk-integration` header."""
+
+        return FUNCTION_NAME.get()
+
+    @function_name.setter
+    def function_name(self, function_name):
+        FUNCTION_NAME.set(function_name)
+
+    def _log_payload(self, payload):
+        """Internal method used to log a request body or response within the `log_payload_size` of the connection.
+
+        Arguments:
+            payload {object} -- The request body or response text to log.
+
+        Returns:
+            _LogPayload -- The payload, formatted only when the log record is emitted.
+        """
+
+        return _LogPayload(payload, self.log_payload_size)
+
+    def _create_session(self, pool_connections=10, pool_maxsize=10, keep_alive=True):
+        """Internal method used to create the pooled HTTP session that is shared by every API call made to the Rubrik cluster.
+
+        Keyword Arguments:
+            pool_connections {int} -- The number of connection pools (one per Rubrik node) to cache. (default: {10})
+            pool_maxsize {int} -- The maximum number of connections to keep open to a single Rubrik node. (default: {10})
+            keep_alive {bool} -- Flag that determines whether connections are reused across API calls. (default: {True})
+
+        Returns:
+            requests.Session -- The pooled HTTP session.
+        """
+
+        self._validate_session_settings(pool_connections, pool_maxsize, keep_alive)
+
+        session = requests.Session()
+        session.verify = False
+        session.mount("https://", HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize))
+
+        if keep_alive is False:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    @staticmethod
+    def _validate_session_settings(pool_connections, pool_maxsize, keep_alive):
+        """Internal method used to validate the connection pool settings provided by the end user.
+
+        Arguments:
+            pool_connections {int} -- The number of connection pools (one per Rubrik node) to cache.
+            pool_maxsize {int} -- The maximum number of connections to keep open to a single Rubrik node.
+            keep_alive {bool} -- Flag that determines whether connections are reused across API calls.
+        """
+
+        if not isinstance(pool_connections, int) or not isinstance(pool_maxsize, int):
+            raise InvalidTypeException("The 'pool_connections' and 'pool_maxsize' arguments must be integers.")
+        elif pool_connections < 1 or pool_maxsize < 1:
+            raise InvalidParameterException("The 'pool_connections' and 'pool_maxsize' arguments must be greater than 0.")
+
+        if not isinstance(keep_alive, bool):
+            raise InvalidTypeException("The 'keep_alive' argument must be True or False.")
+
+    def close(self):
+        """Close the pooled HTTP session and release all open connections to the Rubrik cluster."""
+
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _common_api(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, timeout=15, authentication=True, params=None, gql_operation_name=None, gql_query=None, gql_variables=None, retry_policy=None, raw=False, stream=False):  # pylint: ignore
         """Internal method that consolidates the base API functions.
 
         Arguments:
@@ -54,151 +190,405 @@ class Api():
             job_status_url {str} -- The job status URL provided by a previous API call. (default: {None})
             timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
             authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+            retry_policy {RetryPolicy} -- The retry policy to apply to this API call instead of the policy provided when the client was created. (default: {None})
+            raw {bool} -- Flag that determines whether the undecoded response body is returned as `bytes`. (default: {False})
+            stream {bool} -- Flag that determines whether the response body is downloaded and parsed incrementally. (default: {False})
 
         Returns:
-            dict -- The full API call response for the provided endpoint.
+            dict -- The full API call response for the provided endpoint, or a `JsonArrayStream` over its `data` when `stream` is `True`.
         """
 
-        # Determine if authentication should be sent as part of the API Header
-        if authentication:
-            header = self._authorization_header()
-        elif authentication is False:
-            header = self._header()
-        else:
-            raise InvalidTypeException('"authentication" must be either True or False')
+        header = self._request_header(authentication)
+
+        if retry_policy is None:
+            retry_policy = self.retry_policy
+
+        if self._node_discovery_due(call_type):
+            self._discover_nodes(timeout)
+
+        call = self.metrics.start(call_type, api_version, api_endpoint, job_status_url, gql_operation_name) if self.metrics is not None else NULL_API_CALL
         try:
-            # Determine which call type is being used and then set the relevant
-            # variables for that call type
-            if call_type == 'GET':
-                request_url = "https://{}/api/{}{}".format(self.node_ip, api_version, api_endpoint)
-                if params is not None:
-                    request_url = request_url + "?" + '&'.join("{}={}".format(key, quote(str(val)))
-                                                               for (key, val) in params.items())
-                self.log('GET {}'.format(request_url))
-                api_request = requests.get(
-                    request_url, verify=False, headers=header, timeout=timeout)
-            elif call_type == 'POST':
-                config = json.dumps(config)
-                request_url = "https://{}/api/{}{}".format(
-                    self.node_ip, api_version, api_endpoint)
-                self.log('POST {}'.format(request_url))
-                self.log('Config: {}'.format(config))
-                api_request = requests.post(request_url, verify=False, headers=header, data=config, timeout=timeout)
-                self.log('Response: {}'.format(api_request.text))
-            elif call_type == 'PATCH':
-                config = json.dumps(config)
-                request_url = "https://{}/api/{}{}".format(
-                    self.node_ip, api_version, api_endpoint)
-                self.log('PATCH {}'.format(request_url))
-                self.log('Config: {}'.format(config))
-                api_request = requests.patch(request_url, verify=False, headers=header, data=config, timeout=timeout)
-            elif call_type == 'PUT':
-                config = json.dumps(config)
-                request_url = "https://{}/api/{}{}".format(
-                    self.node_ip, api_version, api_endpoint)
-                self.log('PUT {}'.format(request_url))
-                self.log('Config: {}'.format(config))
-                api_request = requests.put(request_url, verify=False, headers=header, data=config, timeout=timeout)
-            elif call_type == 'DELETE':
-                config = json.dumps(config)
-                request_url = "https://{}/api/{}{}".format(
-                    self.node_ip, api_version, api_endpoint)
-                if params is not None:
-                    request_url = request_url + "?" + '&'.join("{}={}".format(key, val)
-                                                               for (key, val) in params.items())
-                self.log('DELETE {}'.format(request_url))
-                api_request = requests.delete(request_url, verify=False, headers=header, data=config, timeout=timeout)
-            elif call_type == 'JOB_STATUS':
-                self.log('JOB STATUS for {}'.format(job_status_url))
-                api_request = requests.get(job_status_url, verify=False, headers=header, timeout=timeout)
-            elif call_type == 'QUERY':
-                config = json.dumps(config)
-                request_url = "https://{}/api/internal/graphql".format(self.node_ip)
-                self.log('POST {}'.format(request_url))
-                if gql_operation_name is not None:
-                    self.log('Operation Name: {}'.format(gql_operation_name))
-                self.log('Query: {}'.format(gql_query))
-                if gql_variables is not None:
-                    self.log('Variables: {}'.format(gql_variables))
-                api_request = requests.post(
-                    request_url,
-                    verify=False,
-                    headers=header,
-                    json={
-                        "operationName": gql_operation_name,
-                        "variables": gql_variables,
-                        "query": "query {}".format(gql_query)},
-                    timeout=timeout)
-            else:
-                raise InvalidParameterException('the _common_api() call_type must be one of the following: {}'.format(
-                    ['GET', 'POST', 'PATCH', 'DELETE', 'QUERY', 'JOB_STATUS']))
+            attempt = 1
+            reauthenticated = False
+            while True:
+                node_ip = self._acquire_node(call_type)
+                http_method, request_url, data = self._prepare_request(
+                    call_type, api_version, api_endpoint, config, job_status_url, params, gql_operation_name, gql_query, gql_variables, node_ip)
+                call.sent(data)
+
+                try:
+                    api_request = self._session.request(
+                        http_method, request_url, verify=False, headers=header, data=data, timeout=timeout, stream=stream)
+                except requests.exceptions.RequestException as error:
+                    call.transport_failed(error)
+                    self._release_node(node_ip, failed=True)
+                    delay = self._retry_delay(retry_policy, call_type, attempt, error=error)
+                    if delay is None:
+                        self._raise_request_exception(error)
+                else:
+                    call.received(api_request)
+                    self._release_node(node_ip, failed=api_request.status_code in NODE_FAILURE_STATUS_CODES)
+                    if api_request.status_code == 401 and not reauthenticated and self._reauthenticate(authentication, header):
+                        # The session token was rejected so send the API call once more with a new token
+                        api_request.close()
+                        header = self._request_header(authentication)
+                        reauthenticated = True
+                        continue
+
+                    delay = self._retry_delay(retry_policy, call_type, attempt, api_request=api_request)
+                    if delay is None:
+                        break
+                    # Release the connection of a streamed response before it is sent again
+                    api_request.close()
+
+                self.log('Retrying %s %s in %.2f seconds (attempt %d failed).', http_method, request_url, delay, attempt)
+                call.retried()
+                time.sleep(delay)
+                attempt += 1
+
+            if call_type == 'POST' and self._log_enabled():
+                self.log('Response: %s', self._log_payload(api_request.text))
+
+            if stream:
+                return self._stream_response(call_type, api_request)
+
+            return self._process_response(call_type, api_request, raw)
+        except Exception as error:
+            call.failed(error)
+            raise
+        finally:
+            # The latency of a streamed response is measured until its headers are received
+            call.finish()
+
+    def _node_discovery_due(self, call_type):
+        """Internal method used to determine whether the nodes of the Rubrik cluster should be discovered before an API call is sent.
 
-            self.log(str(api_request) + "\n")
-            try:
-                # request.json() will fail on a 204 (No Content) so skip the response check
-                if api_request.status_code != 204:
-                    api_response = api_request.json()
-                    # Check to see if an error message has been provided by Rubrik
-                    for key, value in api_response.items():
-                        if key == "errorType" or key == 'message':
-                            error_message = api_response['message']
-                            api_request.raise_for_status()
+        Arguments:
+            call_type {str} -- The type of API call being made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
 
-                        # Check for GQL error message in the data response
-                        if key == "error":
-                            error_message = api_response['error']
-                            api_request.raise_for_status()
+        Returns:
+            bool -- `True` when client-side load balancing is enabled and the node list is due to be refreshed.
+        """
 
-            except BaseException:
-                api_request.raise_for_status()
-        except requests.exceptions.ConnectTimeout:
-            raise APICallException("Unable to establish a connection to the Rubrik cluster.")
-        except requests.exceptions.ConnectionError:
+        return self.node_pool is not None and call_type != 'JOB_STATUS' and self.node_pool.discovery_due()
+
+    def _discover_nodes(self, timeout=15):
+        """Internal method used to refresh the nodes that API calls are load balanced across. The current nodes are kept when the
+        Rubrik cluster can not be reached.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+        """
+
+        try:
+            api_request = self._common_api('GET', 'internal', '/cluster/me/node', timeout=timeout)
+        except APICallException as error:
+            self.log('Unable to discover the Rubrik cluster nodes: %s', error)
+            return
+
+        self._update_nodes(api_request)
+
+    def _update_nodes(self, api_request):
+        """Internal method used to replace the nodes that API calls are load balanced across with the healthy nodes returned by the
+        `/cluster/me/node` endpoint.
+
+        Arguments:
+            api_request {dict} -- The response returned by the `/cluster/me/node` endpoint.
+        """
+
+        node_ips = [node["ipAddress"] for node in api_request.get("data", [])
+                    if node.get("ipAddress") and node.get("status", "OK") == "OK"]
+
+        if node_ips:
+            self.log('Load balancing API calls across the following nodes: %s', node_ips)
+            self.node_pool.update(node_ips)
+
+    def _acquire_node(self, call_type):
+        """Internal method used to select the Rubrik node an API call is sent to.
+
+        Arguments:
+            call_type {str} -- The type of API call being made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+
+        Returns:
+            str -- The IP address of the selected node, or `None` when the API call is sent to the `node_ip` of the connection.
+        """
+
+        # Job status URLs already include the node that accepted the original request
+        if self.node_pool is None or call_type == 'JOB_STATUS':
+            return None
+
+        return self.node_pool.acquire()
+
+    def _release_node(self, node_ip, failed=False):
+        """Internal method used to record the outcome of an API call sent to a node selected by `_acquire_node()`.
+
+        Arguments:
+            node_ip {str} -- The IP address returned by `_acquire_node()`.
+
+        Keyword Arguments:
+            failed {bool} -- Flag that specifies whether the node failed to respond to the API call. (default: {False})
+        """
+
+        if node_ip is not None:
+            self.node_pool.release(node_ip, failed)
+
+    @staticmethod
+    def _retry_delay(retry_policy, call_type, attempt, api_request=None, error=None):
+        """Internal method used to ask the retry policy whether a failed attempt should be sent again.
+
+        Arguments:
+            retry_policy {RetryPolicy} -- The retry policy applied to the API call, or `None` when failed attempts are not retried.
+            call_type {str} -- The type of API call that was made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            attempt {int} -- The number of the attempt that failed, starting at 1.
+
+        Keyword Arguments:
+            api_request {requests.Response} -- The response returned by the Rubrik cluster. (default: {None})
+            error {requests.exceptions.RequestException} -- The exception raised while sending the request. (default: {None})
+
+        Returns:
+            float -- The number of seconds to wait before the next attempt, or `None` when the call should not be retried.
+        """
+
+        if retry_policy is None:
+            return None
+
+        if api_request is not None:
+            if api_request.status_code < 400:
+                return None
+            return retry_policy.retry_delay(
+                call_type, attempt, status_code=api_request.status_code, retry_after=api_request.headers.get("Retry-After"))
+
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return retry_policy.retry_delay(call_type, attempt, error=CONNECTION_ERROR, request_sent=False)
+        elif isinstance(error, requests.exceptions.ConnectionError):
+            # A refused or unreachable connection never delivered the request to the Rubrik cluster
+            reason = getattr(error.args[0], "reason", None) if error.args else None
+            request_sent = not isinstance(reason, ConnectTimeoutError)
+            return retry_policy.retry_delay(call_type, attempt, error=CONNECTION_ERROR, request_sent=request_sent)
+        elif isinstance(error, requests.exceptions.ReadTimeout):
+            return retry_policy.retry_delay(call_type, attempt, error=TIMEOUT)
+
+        return None
+
+    @staticmethod
+    def _raise_request_exception(error):
+        """Internal method used to map an exception raised while sending a request to an `APICallException`.
+
+        Arguments:
+            error {requests.exceptions.RequestException} -- The exception raised while sending the request.
+        """
+
+        if isinstance(error, (requests.exceptions.ConnectTimeout, requests.exceptions.ConnectionError)):
             raise APICallException("Unable to establish a connection to the Rubrik cluster.")
-        except requests.exceptions.ReadTimeout:
+        elif isinstance(error, requests.exceptions.ReadTimeout):
             raise APICallException(
                 "The Rubrik cluster did not respond to the API request in the allotted amount of time. To fix this issue, increase the timeout value.")
+
+        raise APICallException(error)
+
+    def _reauthenticate(self, authentication, header):
+        """Internal method used to discard a session token rejected by the Rubrik cluster. Connections that do not use session
+        tokens never send an API call again after a `401 Unauthorized` response.
+
+        Arguments:
+            authentication {bool} -- The authentication used by the rejected API call.
+            header {dict} -- The header sent with the rejected API call.
+
+        Returns:
+            bool -- `True` when the API call should be sent again with a new session token.
+        """
+
+        return False
+
+    def _request_header(self, authentication):
+        """Internal method used to select the header sent with an API call.
+
+        Arguments:
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. Internal calls may also use `'basic'` to authenticate with the username and password instead of the session token.
+
+        Returns:
+            dict -- The header to send with the API call.
+        """
+
+        # Determine if authentication should be sent as part of the API Header
+        if authentication == BASIC_AUTHENTICATION:
+            return self._authorization_header(session_token=False)
+        elif authentication:
+            return self._authorization_header()
+        elif authentication is False:
+            return self._header()
+        else:
+            raise InvalidTypeException('"authentication" must be either True or False')
+
+    def _prepare_request(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, params=None, gql_operation_name=None, gql_query=None, gql_variables=None, node_ip=None):  # pylint: ignore
+        """Internal method used to translate a `_common_api()` call type into the HTTP method, URL and body that will be sent to the Rubrik cluster.
+        It does not perform any I/O so it can be shared by every HTTP transport.
+
+        Arguments:
+            call_type {str} -- The type of API call being made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+
+        Keyword Arguments:
+            config {dict} -- The specified data to send with 'DELETE', `POST`, `PATCH` and `PUT` API calls. (default: {None})
+            job_status_url {str} -- The job status URL provided by a previous API call. (default: {None})
+            params {dict} -- An optional dict containing variables in a key:value format to send with `GET` & `DELETE` API calls (default: {None})
+            node_ip {str} -- The IP address of the Rubrik node to send the API call to. When not provided the `node_ip` of the connection is used. (default: {None})
+
+        Returns:
+            tuple -- The HTTP method, the full request URL and the serialized request body. (http_method, request_url, data)
+        """
+
+        if node_ip is None:
+            node_ip = self.node_ip
+
+        # Determine which call type is being used and then set the relevant
+        # variables for that call type
+        if call_type == 'GET':
+            request_url = "https://{}/api/{}{}".format(node_ip, api_version, api_endpoint)
+            if params:
+                # The endpoint may already include a query string
+                separator = "&" if "?" in api_endpoint else "?"
+                if request_url.endswith(("?", "&")):
+                    separator = ""
+                request_url = request_url + separator + '&'.join("{}={}".format(key, quote(str(val)))
+                                                                 for (key, val) in params.items())
+            self.log('GET %s', request_url)
+            return 'GET', request_url, None
+        elif call_type in ['POST', 'PATCH', 'PUT']:
+            config = self.json_codec.dumps(config)
+            request_url = "https://{}/api/{}{}".format(
+                node_ip, api_version, api_endpoint)
+            self.log('%s %s', call_type, request_url)
+            self.log('Config: %s', self._log_payload(config))
+            return call_type, request_url, config
+        elif call_type == 'DELETE':
+            config = self.json_codec.dumps(config)
+            request_url = "https://{}/api/{}{}".format(
+                node_ip, api_version, api_endpoint)
+            if params is not None:
+                request_url = request_url + "?" + '&'.join("{}={}".format(key, val)
+                                                           for (key, val) in params.items())
+            self.log('DELETE %s', request_url)
+            return 'DELETE', request_url, config
+        elif call_type == 'JOB_STATUS':
+            self.log('JOB STATUS for %s', job_status_url)
+            return 'GET', job_status_url, None
+        elif call_type == 'QUERY':
+            request_url = "https://{}/api/internal/graphql".format(node_ip)
+            self.log('POST %s', request_url)
+            if gql_operation_name is not None:
+                self.log('Operation Name: %s', gql_operation_name)
+            self.log('Query: %s', self._log_payload(gql_query))
+            if gql_variables is not None:
+                self.log('Variables: %s', self._log_payload(gql_variables))
+            config = self.json_codec.dumps({
+                "operationName": gql_operation_name,
+                "variables": gql_variables,
+                "query": "query {}".format(gql_query)})
+            return 'POST', request_url, config
+        else:
+            raise InvalidParameterException('the _common_api() call_type must be one of the following: {}'.format(
+                ['GET', 'POST', 'PATCH', 'DELETE', 'QUERY', 'JOB_STATUS']))
+
+    def _process_response(self, call_type, api_request, raw=False):
+        """Internal method used to validate the response returned by the Rubrik cluster and map any error to an `APICallException`.
+        It does not perform any I/O so it can be shared by every HTTP transport. The response body is decoded once, with the JSON
+        codec of the connection, and reused by every check.
+
+        Arguments:
+            call_type {str} -- The type of API call that was made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            api_request {requests.Response} -- The response returned by the Rubrik cluster.
+
+        Keyword Arguments:
+            raw {bool} -- Flag that determines whether the undecoded response body is returned for successful API calls. (default: {False})
+
+        Returns:
+            dict -- The full API call response for the provided endpoint.
+        """
+
+        self.log('%s\n', api_request)
+
+        if raw and api_request.status_code < 400:
+            return api_request.content
+
+        api_response = None
+        decoded = False
+        error_message = None
+
+        # request.json() will fail on a 204 (No Content) so skip the response check
+        if api_request.status_code != 204:
+            try:
+                api_response = self.json_codec.decode_response(api_request)
+                decoded = True
+            except Exception:
+                pass
+
+        try:
+            if api_request.status_code != 204:
+                if not isinstance(api_response, dict):
+                    api_request.raise_for_status()
+                else:
+                    # Check to see if an error message has been provided by Rubrik
+                    if "errorType" in api_response or "message" in api_response:
+                        error_message = api_response.get("message")
+                        api_request.raise_for_status()
+
+                    # Check for GQL error message in the data response
+                    if "error" in api_response:
+                        error_message = api_response["error"]
+                        api_request.raise_for_status()
         except requests.exceptions.HTTPError as error:
 
             try:
-                error_message = json.loads(error.response.text)["message"]
+                error_message = api_response["message"]
             except BaseException:
                 error_message = error.response.text
 
             raise APICallException(error_message)
 
-        except requests.exceptions.RequestException as error:
-            # If "error_message" has be defined raise that message else raise the request exception error
+        if raw:
+            return api_request.content
+
+        # GQL error messages may not be flag as exceptions so we need to
+        # manually check to determine if the error has occurred to
+        # raise an error on the provided message
+        if call_type == "QUERY":
+            if error_message is not None:
+                raise APICallException(error_message)
+            elif isinstance(api_response, dict) and "data" in api_response:
+                return api_response["data"]
+
+        # request.json() will fail on a 204 (No Content), so just the response code
+        if decoded:
+            return api_response
+
+        return {'status_code': api_request.status_code}
+
+    def _stream_response(self, call_type, api_request):
+        """Internal method used to parse a streamed response incrementally. Error responses are small, so they are validated by
+        `_process_response()` before any item is returned.
+
+        Arguments:
+            call_type {str} -- The type of API call that was made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            api_request {requests.Response} -- The streamed response returned by the Rubrik cluster.
+
+        Returns:
+            JsonArrayStream -- Each item of the `data` list in the response body.
+        """
+
+        if api_request.status_code >= 400:
             try:
-                error_message
-            except NameError:
-                raise APICallException(error)
-            else:
-                raise APICallException('' + error_message)
+                self._process_response(call_type, api_request)
+            except Exception:
+                api_request.close()
+                raise
         else:
-            try:
-                # GQL error messages may not be flag as exceptions so we need to
-                # manually check to determine if the error has occurred to
-                # raise an error on the provided message
-                if call_type == "QUERY":
-                    try:
-                        error_message
-                        raise APICallException(error_message)
-                    except NameError:
-                        try:
-                            return api_request.json()["data"]
-                        except BaseException:
-                            pass
-                
-                # request.json() will fail on a 204 (No Content), so just the response code
-                if api_request.status_code != 204:
-                    return api_request.json()
-                else:
-                    return {'status_code': api_request.status_code}
-            except BaseException:
-                return {'status_code': api_request.status_code}
+            self.log('%s\n', api_request)
+
+        return JsonArrayStream(api_request.iter_content(STREAM_CHUNK_SIZE), close=api_request.close)
 
-    def get(self, api_version, api_endpoint, timeout=15, authentication=True, params=None):
+    def get(self, api_version, api_endpoint, timeout=15, authentication=True, params=None, raw=False, stream=False):
         """Send a GET request to the provided Rubrik API endpoint.
 
         Arguments:
@@ -209,14 +599,19 @@ class Api():
             params {dict} -- An optional dict containing variables in a key:value format to send with `GET` & `DELETE` API calls (default: {None})
             timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
             authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+            raw {bool} -- Flag that determines whether the undecoded response body is returned as `bytes`, so that very large responses can be decoded by the caller. (default: {False})
+            stream {bool} -- Flag that determines whether the items of the `data` list in the response body are parsed and returned one at a time as they are downloaded, so memory use does not grow with the size of the response. Once every item has been read, the rest of the response body is available through the `metadata` attribute of the returned stream. (default: {False})
 
         Returns:
-            dict -- The response body of the API call.
+            dict -- The response body of the API call, or a `JsonArrayStream` of the items in its `data` list when `stream` is `True`.
         """
 
         if self.function_name == "":
             self.function_name = inspect.currentframe().f_code.co_name
 
+        if raw and stream:
+            raise InvalidParameterException("The raw and stream arguments can not both be True.")
+
         return self._common_api(
             'GET',
             api_version,
@@ -225,7 +620,9 @@ class Api():
             job_status_url=None,
             timeout=timeout,
             authentication=authentication,
-            params=params)
+            params=params,
+            raw=raw,
+            stream=stream)
 
     def post(self, api_version, api_endpoint, config, timeout=15, authentication=True):
         """Send a POST request to the provided Rubrik API endpoint.
@@ -287,6 +684,80 @@ class Api():
             gql_query=query,
             gql_variables=variables)
 
+    def query_batch(self, operations, batch_size=25, timeout=15, authentication=True):
+        """Send many GraphQL queries to a CDM cluster in as few API calls as possible. Each API call merges up to `batch_size`
+        operations into a single query, where the variables and top-level fields of each operation are aliased so they can not
+        collide, and routes the data and errors of the response back to the operation they belong to.
+
+        Arguments:
+            operations {list} -- A dict with the `query` and, optionally, the `variables` and `operation_name` of each operation, in the same format as `query()`.
+
+        Keyword Arguments:
+            batch_size {int} -- The maximum number of operations to send in a single API call. (default: {25})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            list -- The response["data"] body of each operation, in the same order as `operations`. When an operation fails, an `APICallException` is returned in its place.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        results = []
+        for count, query, variables in self._query_batches(operations, batch_size):
+            try:
+                api_response = self._common_api(
+                    'QUERY',
+                    api_version=None,
+                    api_endpoint=None,
+                    timeout=timeout,
+                    authentication=authentication,
+                    gql_operation_name=BATCH_OPERATION_NAME,
+                    gql_query=query,
+                    gql_variables=variables,
+                    raw=True)
+            except APICallException as error:
+                results.extend([error] * count)
+            else:
+                results.extend(split_response(self.json_codec.loads(api_response), count))
+
+        return results
+
+    @staticmethod
+    def _query_batches(operations, batch_size):
+        """Internal method used to validate the operations provided to `query_batch()` and merge them into batches.
+
+        Arguments:
+            operations {list} -- A dict with the `query` and, optionally, the `variables` and `operation_name` of each operation.
+            batch_size {int} -- The maximum number of operations in a batch.
+
+        Returns:
+            list -- The number of operations, the merged query and the merged variables of each batch.
+        """
+
+        if not isinstance(operations, list):
+            raise InvalidTypeException("The operations argument must be a list of dicts.")
+
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            raise InvalidParameterException("The batch_size argument must be a positive integer.")
+
+        for operation in operations:
+            if not isinstance(operation, dict) or not isinstance(operation.get("query"), str):
+                raise InvalidTypeException("Each operation must be a dict that contains a `query` string.")
+            unknown_keys = set(operation) - set(["query", "variables", "operation_name"])
+            if unknown_keys:
+                raise InvalidParameterException("The operation keys {} are not supported. Each operation may only contain the keys {}.".format(
+                    sorted(unknown_keys), ["query", "variables", "operation_name"]))
+
+        batches = []
+        for start in range(0, len(operations), batch_size):
+            batch = operations[start:start + batch_size]
+            query, variables = merge_operations(batch)
+            batches.append((len(batch), query, variables))
+
+        return batches
+
     def patch(self, api_version, api_endpoint, config, timeout=15, authentication=True):
         """Send a PATCH request to the provided Rubrik API endpoint.
 
@@ -423,22 +894,6 @@ class Api():
 
                 job_status = api_call['status']
 
-                in_progress_status = [
-                    "QUEUED",
-                    "RUNNING",
-                    "FINISHING",
-                    "TO_FINISH",
-                    "TO_RETRY",
-                    "ACQUIRING",
-                    "TO_YIELDING",
-                    "YIELDING",
-                    "TO_YIELDED",
-                    "YIELDED"]
-
-                canceling_status = ["CANCELING", "TO_CANCEL"]
-
-                failing_status = ["TO_UNDO", "UNDOING"]
-
                 if job_status == "SUCCEEDED":
                     self.log('Job Complete\n')
                     job_status = api_call['status']
@@ -447,18 +902,18 @@ class Api():
                     self.log('Job Cancelled\n')
                     job_status = api_call['status']
                     break
-                elif job_status in in_progress_status:
-                    self.log('Job Progress {}%\n'.format(api_call['progress']))
+                elif job_status in JOB_IN_PROGRESS_STATUS:
+                    self.log('Job Progress %s%%\n', api_call['progress'])
                     job_status = api_call['status']
                     time.sleep(10)
                     continue
-                elif job_status in canceling_status:
-                    self.log('Job is being Cancelled {}%\n'.format(api_call['progress']))
+                elif job_status in JOB_CANCELING_STATUS:
+                    self.log('Job is being Cancelled %s%%\n', api_call['progress'])
                     job_status = api_call['status']
                     time.sleep(10)
                     continue
-                elif job_status in failing_status:
-                    self.log('Job Failing {}%\n'.format(api_call['progress']))
+                elif job_status in JOB_FAILING_STATUS:
+                    self.log('Job Failing %s%%\n', api_call['progress'])
                     job_status = api_call['status']
                     time.sleep(10)
                     continue
@@ -476,3 +931,323 @@ class Api():
                 timeout=timeout)
 
         return api_call
+
+    def iter_pages(self, api_version, api_endpoint, params=None, page_size=100, prefetch=False, timeout=15):
+        """Iterate over every page returned by a paginated Rubrik list endpoint. Pages are requested with `limit` and `offset` until the
+        Rubrik cluster reports that no more results are available through `hasMore` or `total`. When a page includes a `nextCursor`,
+        the next page is requested with that `cursor` instead of an offset.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /vmware/vm).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with each API call. (default: {None})
+            page_size {int} -- The number of items to request per page. (default: {100})
+            prefetch {bool} -- Flag that determines whether the next page is requested in the background while the current page is being processed. (default: {False})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            generator -- The response body of each API call.
+        """
+
+        if not isinstance(prefetch, bool):
+            raise InvalidTypeException("The prefetch argument must be True or False.")
+
+        page_params = self._first_page_params(params, page_size)
+
+        page = self.get(api_version, api_endpoint, timeout=timeout, params=page_params)
+
+        while True:
+            page_params = self._next_page_params(page_params, page)
+
+            if page_params is None:
+                yield page
+                return
+
+            if prefetch:
+                next_page = self._get_in_background(api_version, api_endpoint, page_params, timeout)
+                yield page
+                page = next_page()
+            else:
+                yield page
+                page = self.get(api_version, api_endpoint, timeout=timeout, params=page_params)
+
+    def paginate(self, api_version, api_endpoint, params=None, page_size=100, prefetch=False, timeout=15, stream=False):
+        """Iterate over every item returned by a paginated Rubrik list endpoint. Pages are only requested as the items are consumed.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /vmware/vm).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with each API call. (default: {None})
+            page_size {int} -- The number of items to request per page. (default: {100})
+            prefetch {bool} -- Flag that determines whether the next page is requested in the background while the current page is being processed. (default: {False})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            stream {bool} -- Flag that determines whether each page is parsed incrementally as it is downloaded so only one item is held in memory at a time. Can not be combined with `prefetch`. (default: {False})
+
+        Returns:
+            generator -- Each item in the `data` list of every page.
+        """
+
+        if stream:
+            if prefetch:
+                raise InvalidParameterException("The prefetch and stream arguments can not both be True.")
+            for item in self._paginate_stream(api_version, api_endpoint, params, page_size, timeout):
+                yield item
+            return
+
+        for page in self.iter_pages(api_version, api_endpoint, params, page_size, prefetch, timeout):
+            for item in page.get("data", []):
+                yield item
+
+    def _paginate_stream(self, api_version, api_endpoint, params=None, page_size=100, timeout=15):
+        """Internal method used to stream every item returned by a paginated Rubrik list endpoint. The next page is determined from
+        the number of items read and the fields that follow the `data` list in the response body.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /vmware/vm).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with each API call. (default: {None})
+            page_size {int} -- The number of items to request per page. (default: {100})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            generator -- Each item in the `data` list of every page.
+        """
+
+        page_params = self._first_page_params(params, page_size)
+
+        while page_params is not None:
+            items = self.get(api_version, api_endpoint, timeout=timeout, params=page_params, stream=True)
+            try:
+                for item in items:
+                    yield item
+            finally:
+                items.close()
+
+            page = dict(items.metadata) if isinstance(items.metadata, dict) else {}
+            # Only the number of items is needed to calculate the offset of the next page
+            page["data"] = range(items.count)
+            page_params = self._next_page_params(page_params, page)
+
+    def paginate_connection(self, query, connection, operation_name=None, variables=None, page_size=100, timeout=15):
+        """Iterate over every node of a GraphQL connection. Pages are requested with the `first` and `after` variables until the
+        `pageInfo` of the connection reports that no more nodes are available, and are only requested as the nodes are consumed. The
+        query must declare the `$first: Int` and `$after: String` variables, pass them to the connection and select
+        `pageInfo { endCursor hasNextPage }` along with the `nodes` or `edges` of the connection.
+
+        Arguments:
+            query {str} -- The main GraphQL query body, in the same format as `query()`.
+            connection {str} -- The name, or alias, of the connection in the response data. Connections nested in another field are separated by a period (ex. cluster.hostConnection).
+
+        Keyword Arguments:
+            operation_name {str} -- The name of the GraphQL operation. (default: {None})
+            variables {dict} -- The variables to pass into your query, other than `first` and `after`. (default: {None})
+            page_size {int} -- The number of nodes to request per page. (default: {100})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            generator -- Each node of the connection.
+        """
+
+        page_variables = self._first_connection_variables(variables, page_size)
+
+        while page_variables is not None:
+            page = self.query(query, operation_name, page_variables, timeout)
+            nodes, page_variables = self._next_connection_variables(page_variables, page, connection)
+            for node in nodes:
+                yield node
+
+    @staticmethod
+    def _first_connection_variables(variables, page_size):
+        """Internal method used to validate the page size and build the variables of the first page of a GraphQL connection.
+
+        Arguments:
+            variables {dict} -- The variables provided by the caller.
+            page_size {int} -- The number of nodes to request per page.
+
+        Returns:
+            dict -- The variables of the first page.
+        """
+
+        if isinstance(page_size, bool) or not isinstance(page_size, int):
+            raise InvalidTypeException("The page_size argument must be an integer.")
+        if page_size < 1:
+            raise InvalidParameterException("The page_size argument must be 1 or greater.")
+
+        page_variables = dict(variables) if variables is not None else {}
+        page_variables["first"] = page_size
+        page_variables.setdefault("after", None)
+
+        return page_variables
+
+    @staticmethod
+    def _next_connection_variables(variables, page, connection):
+        """Internal method used to read the nodes of a GraphQL connection and determine the variables of the next page.
+
+        Arguments:
+            variables {dict} -- The variables used to request the current page.
+            page {dict} -- The response data of the current page.
+            connection {str} -- The name, or alias, of the connection in the response data, with nested fields separated by a period.
+
+        Returns:
+            tuple -- The nodes of the current page and the variables of the next page, or `None` when there are no more pages.
+        """
+
+        page_connection = page
+        for field in connection.split("."):
+            if not isinstance(page_connection, dict) or page_connection.get(field) is None:
+                raise APICallException("The GraphQL response does not contain the '{}' connection.".format(connection))
+            page_connection = page_connection[field]
+
+        if "nodes" in page_connection:
+            nodes = page_connection["nodes"] or []
+        else:
+            nodes = [edge["node"] for edge in page_connection.get("edges") or []]
+
+        page_info = page_connection.get("pageInfo") or {}
+        end_cursor = page_info.get("endCursor")
+
+        # Stop when the Rubrik cluster does not move the cursor forward so a page is never requested twice
+        if not page_info.get("hasNextPage") or not nodes or end_cursor is None or end_cursor == variables.get("after"):
+            return nodes, None
+
+        next_variables = dict(variables)
+        next_variables["after"] = end_cursor
+
+        return nodes, next_variables
+
+    @staticmethod
+    def _first_page_params(params, page_size):
+        """Internal method used to validate the page size and build the query parameters of the first page.
+
+        Arguments:
+            params {dict} -- The query parameters provided by the caller.
+            page_size {int} -- The number of items to request per page.
+
+        Returns:
+            dict -- The query parameters of the first page.
+        """
+
+        if isinstance(page_size, bool) or not isinstance(page_size, int):
+            raise InvalidTypeException("The page_size argument must be an integer.")
+        if page_size < 1:
+            raise InvalidParameterException("The page_size argument must be 1 or greater.")
+
+        page_params = dict(params) if params is not None else {}
+        page_params["limit"] = page_size
+        page_params.setdefault("offset", 0)
+
+        return page_params
+
+    def _get_all_pages(self, api_version, api_endpoint, params=None, page_size=100, timeout=15):
+        """Internal method used to combine every page returned by a paginated Rubrik list endpoint into a single response.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /vmware/vm).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with each API call. (default: {None})
+            page_size {int} -- The number of items to request per page. (default: {100})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            dict -- The response body of the first API call with the `data` of every page.
+        """
+
+        response = None
+
+        for page in self.iter_pages(api_version, api_endpoint, params, page_size, timeout=timeout):
+            if response is None:
+                response = page
+                if "data" not in page:
+                    break
+                response["data"] = list(page["data"])
+            else:
+                response["data"].extend(page.get("data", []))
+
+        if "hasMore" in response:
+            response["hasMore"] = False
+        response.pop("nextCursor", None)
+
+        return response
+
+    @staticmethod
+    def _next_page_params(params, page):
+        """Internal method used to determine the query parameters of the page that follows `page`.
+
+        Arguments:
+            params {dict} -- The query parameters used to request `page`.
+            page {dict} -- The response body of the API call.
+
+        Returns:
+            dict -- The query parameters of the next page, or `None` when `page` is the last page.
+        """
+
+        if not isinstance(page, dict) or not page.get("data"):
+            return None
+
+        next_params = dict(params)
+
+        if page.get("nextCursor"):
+            next_params.pop("offset", None)
+            next_params["cursor"] = page["nextCursor"]
+            return next_params
+
+        if "cursor" in params:
+            return None
+
+        next_params["offset"] = params["offset"] + len(page["data"])
+
+        total = page.get("total")
+        if total is not None and next_params["offset"] >= total:
+            return None
+        if page.get("hasMore") is True:
+            return next_params
+        if "hasMore" not in page and total is not None:
+            return next_params
+
+        return None
+
+    def _get_in_background(self, api_version, api_endpoint, params, timeout=15):
+        """Internal method used to start a GET request on a background thread.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /vmware/vm).
+            params {dict} -- A dict containing variables in a key:value format to send with the API call.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            function -- Waits for the request to complete and returns the response body, or raises the exception of the request.
+        """
+
+        result = {}
+        function_name = self.function_name
+
+        def request():
+            # The SDK function name is not inherited by new threads
+            self.function_name = function_name
+            try:
+                result["response"] = self.get(api_version, api_endpoint, timeout=timeout, params=params)
+            except Exception as error:  # pylint: disable=broad-except
+                result["error"] = error
+
+        thread = threading.Thread(target=request)
+        thread.daemon = True
+        thread.start()
+
+        def wait():
+            thread.join()
+            if "error" in result:
+                raise result["error"]
+            return result["response"]
+
+        return wait
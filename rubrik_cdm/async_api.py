@@ -0,0 +1,560 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the Rubrik SDK AsyncApi class.
+"""
+
+import asyncio
+import requests
+from requests.structures import CaseInsensitiveDict
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+from .api import Api, JOB_IN_PROGRESS_STATUS, JOB_CANCELING_STATUS, JOB_FAILING_STATUS
+from .graphql import BATCH_OPERATION_NAME, split_response
+from .exceptions import APICallException, InvalidParameterException, RubrikException, InvalidTypeException
+from .metrics import NULL_API_CALL
+from .node_pool import NODE_FAILURE_STATUS_CODES
+from .retry import CONNECTION_ERROR, TIMEOUT
+import inspect
+
+
+class AsyncApi(Api):
+    """This class contains awaitable versions of the base API methods. Every API call is sent through a single `aiohttp` session
+    so one event loop can keep many requests to the Rubrik cluster in flight at once.
+
+    Arguments:
+        Api {class} - This class contains the base API methods that can be called independently or internally in standalone functions.
+    """
+
+    def _create_session(self, pool_connections=10, pool_maxsize=10, keep_alive=True):
+        """Internal method used to store the connection pool settings of the `aiohttp` session. The session itself is created
+        by the first API call so that it is bound to the running event loop.
+
+        Keyword Arguments:
+            pool_connections {int} -- The number of connection pools (one per Rubrik node) to cache. (default: {10})
+            pool_maxsize {int} -- The maximum number of connections to keep open to a single Rubrik node. (default: {10})
+            keep_alive {bool} -- Flag that determines whether connections are reused across API calls. (default: {True})
+        """
+
+        if aiohttp is None:
+            raise RubrikException(
+                "The aiohttp package is required to use the asynchronous Rubrik client. Install it with 'pip install rubrik_cdm[async]'.")
+
+        self._validate_session_settings(pool_connections, pool_maxsize, keep_alive)
+
+        self._session_settings = {
+            "limit": pool_connections * pool_maxsize,
+            "limit_per_host": pool_maxsize,
+            "force_close": not keep_alive
+        }
+
+        return None
+
+    def _get_session(self):
+        """Internal method used to return the `aiohttp` session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession -- The pooled HTTP session.
+        """
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=False, **self._session_settings))
+
+        return self._session
+
+    async def close(self):
+        """Close the pooled HTTP session and release all open connections to the Rubrik cluster."""
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def __enter__(self):
+        raise RubrikException("The asynchronous Rubrik client must be used with 'async with'.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @staticmethod
+    def _requests_response(response, content, request_url):
+        """Internal method used to wrap an `aiohttp` response in a `requests.Response` so the response validation in
+        `_process_response()` is shared with the synchronous client.
+
+        Arguments:
+            response {aiohttp.ClientResponse} -- The response returned by the Rubrik cluster.
+            content {bytes} -- The response body.
+            request_url {str} -- The URL the request was sent to.
+
+        Returns:
+            requests.Response -- The equivalent `requests` response.
+        """
+
+        api_request = requests.Response()
+        api_request.status_code = response.status
+        api_request.reason = response.reason
+        api_request.url = request_url
+        api_request.headers = CaseInsensitiveDict(response.headers)
+        api_request.encoding = response.charset
+        api_request._content = content
+
+        return api_request
+
+    async def _common_api(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, timeout=15, authentication=True, params=None, gql_operation_name=None, gql_query=None, gql_variables=None, retry_policy=None, raw=False):  # pylint: ignore
+        """Internal method that consolidates the base API functions.
+
+        Arguments:
+            call_type {str} -- The HTTP Method for the type of RESTful API call being made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with `GET` & `DELETE` API calls (default: {None})
+            config {dict} -- The specified data to send with 'DELETE', `POST` and `PATCH` API calls. (default: {None})
+            job_status_url {str} -- The job status URL provided by a previous API call. (default: {None})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+            retry_policy {RetryPolicy} -- The retry policy to apply to this API call instead of the policy provided when the client was created. (default: {None})
+            raw {bool} -- Flag that determines whether the undecoded response body is returned as `bytes`. (default: {False})
+
+        Returns:
+            dict -- The full API call response for the provided endpoint.
+        """
+
+        header = self._request_header(authentication)
+
+        if retry_policy is None:
+            retry_policy = self.retry_policy
+
+        if self._node_discovery_due(call_type):
+            await self._discover_nodes(timeout)
+
+        call = self.metrics.start(call_type, api_version, api_endpoint, job_status_url, gql_operation_name) if self.metrics is not None else NULL_API_CALL
+        try:
+            attempt = 1
+            while True:
+                node_ip = self._acquire_node(call_type)
+                http_method, request_url, data = self._prepare_request(
+                    call_type, api_version, api_endpoint, config, job_status_url, params, gql_operation_name, gql_query, gql_variables, node_ip)
+                call.sent(data)
+
+                try:
+                    async with self._get_session().request(
+                            http_method,
+                            request_url,
+                            headers=header,
+                            data=data,
+                            timeout=aiohttp.ClientTimeout(sock_connect=timeout, sock_read=timeout)) as response:
+                        content = await response.read()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                    call.transport_failed(error)
+                    self._release_node(node_ip, failed=True)
+                    delay = self._async_retry_delay(retry_policy, call_type, attempt, error)
+                    if delay is None:
+                        self._raise_client_exception(error)
+                else:
+                    api_request = self._requests_response(response, content, request_url)
+                    call.received(api_request)
+                    self._release_node(node_ip, failed=api_request.status_code in NODE_FAILURE_STATUS_CODES)
+                    delay = self._retry_delay(retry_policy, call_type, attempt, api_request=api_request)
+                    if delay is None:
+                        break
+
+                self.log('Retrying %s %s in %.2f seconds (attempt %d failed).', http_method, request_url, delay, attempt)
+                call.retried()
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            if call_type == 'POST' and self._log_enabled():
+                self.log('Response: %s', self._log_payload(api_request.text))
+
+            return self._process_response(call_type, api_request, raw)
+        except Exception as error:
+            call.failed(error)
+            raise
+        finally:
+            call.finish()
+
+    async def _discover_nodes(self, timeout=15):
+        """Internal method used to refresh the nodes that API calls are load balanced across. The current nodes are kept when the
+        Rubrik cluster can not be reached.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+        """
+
+        try:
+            api_request = await self._common_api('GET', 'internal', '/cluster/me/node', timeout=timeout)
+        except APICallException as error:
+            self.log('Unable to discover the Rubrik cluster nodes: %s', error)
+            return
+
+        self._update_nodes(api_request)
+
+    @staticmethod
+    def _async_retry_delay(retry_policy, call_type, attempt, error):
+        """Internal method used to ask the retry policy whether an attempt that raised an `aiohttp` exception should be sent again.
+
+        Arguments:
+            retry_policy {RetryPolicy} -- The retry policy applied to the API call, or `None` when failed attempts are not retried.
+            call_type {str} -- The type of API call that was made. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            attempt {int} -- The number of the attempt that failed, starting at 1.
+            error {Exception} -- The exception raised while sending the request.
+
+        Returns:
+            float -- The number of seconds to wait before the next attempt, or `None` when the call should not be retried.
+        """
+
+        if retry_policy is None:
+            return None
+
+        if isinstance(error, aiohttp.ClientConnectorError):
+            return retry_policy.retry_delay(call_type, attempt, error=CONNECTION_ERROR, request_sent=False)
+        elif isinstance(error, aiohttp.ServerDisconnectedError):
+            return retry_policy.retry_delay(call_type, attempt, error=CONNECTION_ERROR)
+        elif isinstance(error, asyncio.TimeoutError):
+            return retry_policy.retry_delay(call_type, attempt, error=TIMEOUT)
+
+        return None
+
+    @staticmethod
+    def _raise_client_exception(error):
+        """Internal method used to map an exception raised while sending a request to an `APICallException`.
+
+        Arguments:
+            error {Exception} -- The exception raised while sending the request.
+        """
+
+        if isinstance(error, aiohttp.ClientConnectorError):
+            raise APICallException("Unable to establish a connection to the Rubrik cluster.")
+        elif isinstance(error, asyncio.TimeoutError):
+            raise APICallException(
+                "The Rubrik cluster did not respond to the API request in the allotted amount of time. To fix this issue, increase the timeout value.")
+
+        raise APICallException(error)
+
+    async def get(self, api_version, api_endpoint, timeout=15, authentication=True, params=None, raw=False):
+        """Send a GET request to the provided Rubrik API endpoint.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with `GET` & `DELETE` API calls (default: {None})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+            raw {bool} -- Flag that determines whether the undecoded response body is returned as `bytes`, so that very large responses can be decoded by the caller. (default: {False})
+
+        Returns:
+            dict -- The response body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        self._api_validation(api_version, api_endpoint)
+
+        return await self._common_api(
+            'GET',
+            api_version,
+            api_endpoint,
+            config=None,
+            job_status_url=None,
+            timeout=timeout,
+            authentication=authentication,
+            params=params,
+            raw=raw)
+
+    async def post(self, api_version, api_endpoint, config, timeout=15, authentication=True):
+        """Send a POST request to the provided Rubrik API endpoint.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+            config {dict} -- The specified data to send with the API call.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            dict -- The response body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        self._api_validation(api_version, api_endpoint)
+
+        return await self._common_api(
+            'POST',
+            api_version,
+            api_endpoint,
+            config=config,
+            job_status_url=None,
+            timeout=timeout,
+            authentication=authentication)
+
+    async def query(self, query, operation_name=None, variables=None, timeout=15, authentication=True):
+        """Send a GraphQL query to a CDM cluster.
+
+        Arguments:
+            query {str} -- The main GraphQL query body.
+            operation_name {str} -- A meaningful and explicit name for your GraphQL operation. Think of this just like a function name in your favorite programming language. (default: {None})
+            variables {dict} -- The variables to pass into your query. (default: {None})
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            dict -- The response["data"] body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        return await self._common_api(
+            'QUERY',
+            api_version=None,
+            api_endpoint=None,
+            config=None,
+            job_status_url=None,
+            timeout=timeout,
+            authentication=authentication,
+            params=None,
+            gql_operation_name=operation_name,
+            gql_query=query,
+            gql_variables=variables)
+
+    async def query_batch(self, operations, batch_size=25, timeout=15, authentication=True):
+        """Send many GraphQL queries to a CDM cluster in as few API calls as possible. See `Api.query_batch()` for details on how the
+        operations are merged.
+
+        Arguments:
+            operations {list} -- A dict with the `query` and, optionally, the `variables` and `operation_name` of each operation, in the same format as `query()`.
+
+        Keyword Arguments:
+            batch_size {int} -- The maximum number of operations to send in a single API call. (default: {25})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            list -- The response["data"] body of each operation, in the same order as `operations`. When an operation fails, an `APICallException` is returned in its place.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        results = []
+        for count, query, variables in self._query_batches(operations, batch_size):
+            try:
+                api_response = await self._common_api(
+                    'QUERY',
+                    api_version=None,
+                    api_endpoint=None,
+                    timeout=timeout,
+                    authentication=authentication,
+                    gql_operation_name=BATCH_OPERATION_NAME,
+                    gql_query=query,
+                    gql_variables=variables,
+                    raw=True)
+            except APICallException as error:
+                results.extend([error] * count)
+            else:
+                results.extend(split_response(self.json_codec.loads(api_response), count))
+
+        return results
+
+    async def patch(self, api_version, api_endpoint, config, timeout=15, authentication=True):
+        """Send a PATCH request to the provided Rubrik API endpoint.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+            config {dict} -- The specified data to send with the API call.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            dict -- The response body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        self._api_validation(api_version, api_endpoint)
+
+        return await self._common_api(
+            'PATCH',
+            api_version,
+            api_endpoint,
+            config=config,
+            job_status_url=None,
+            timeout=timeout,
+            authentication=authentication)
+
+    async def put(self, api_version, api_endpoint, config, timeout=15, authentication=True):
+        """Send a PUT request to the provided Rubrik API endpoint.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+            config {dict} -- The specified data to send with the API call.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            dict -- The response body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        self._api_validation(api_version, api_endpoint)
+
+        return await self._common_api(
+            'PUT',
+            api_version,
+            api_endpoint,
+            config=config,
+            job_status_url=None,
+            timeout=timeout,
+            authentication=authentication)
+
+    async def delete(self, api_version, api_endpoint, timeout=15, authentication=True, config=None, params=None):
+        """Send a DELETE request to the provided Rubrik API endpoint.
+
+        Arguments:
+            api_version {str} -- The version of the Rubrik CDM API to call. (choices: {v1, v2, internal})
+            api_endpoint {str} -- The endpoint of the Rubrik CDM API to call (ex. /cluster/me).
+
+        Keyword Arguments:
+            params {dict} -- An optional dict containing variables in a key:value format to send with `GET` & `DELETE` API calls . Mutually exclusive with config (default: {None})
+            config {dict} -- The specified data to send with the API call. Mutually exclusive with params (default: {None})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            authentication {bool} -- Flag that specifies whether or not to utilize authentication when making the API call. (default: {True})
+
+        Returns:
+            dict -- The response body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        if config is not None and params is not None:
+            raise InvalidParameterException(
+                "DELETE cannot have both params and config set in the same call.")
+
+        self._api_validation(api_version, api_endpoint)
+
+        return await self._common_api(
+            'DELETE',
+            api_version,
+            api_endpoint,
+            config=config,
+            job_status_url=None,
+            timeout=timeout,
+            authentication=authentication,
+            params=params)
+
+    async def job_status(self, url, wait_for_completion=True, timeout=15):
+        """Certain Rubrik operations (on-demand snapshots, live mounts, etc.) may not complete instantaneously. In those cases we have
+        the ability to monitor the status of the job through a job status url provided in the actions API response body. This function will
+        perform a GET operation on the provided url and return the jobs status. While waiting for the job to complete, control is returned
+        to the event loop between each status check.
+
+        Arguments:
+            url {str} -- The job status URL provided by a previous API call.
+
+        Keyword Arguments:
+            wait_for_completion {bool} -- Flag that determines if the method should wait for the job to complete before exiting. (default: {True})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            dict -- The response body of the API call.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        if not isinstance(wait_for_completion, bool):
+            raise InvalidTypeException(
+                'The job_status() wait_for_completion argument must be True or False.')
+
+        if wait_for_completion:
+            self.log('Job Status: Waiting for the job to complete.')
+
+            while True:
+
+                api_call = await self._common_api(
+                    'JOB_STATUS',
+                    api_version=None,
+                    api_endpoint=None,
+                    config=None,
+                    job_status_url=url,
+                    timeout=timeout)
+
+                job_status = api_call['status']
+
+                if job_status == "SUCCEEDED":
+                    self.log('Job Complete\n')
+                    break
+                elif job_status == "CANCELED":
+                    self.log('Job Cancelled\n')
+                    break
+                elif job_status in JOB_IN_PROGRESS_STATUS:
+                    self.log('Job Progress %s%%\n', api_call['progress'])
+                    await asyncio.sleep(10)
+                    continue
+                elif job_status in JOB_CANCELING_STATUS:
+                    self.log('Job is being Cancelled %s%%\n', api_call['progress'])
+                    await asyncio.sleep(10)
+                    continue
+                elif job_status in JOB_FAILING_STATUS:
+                    self.log('Job Failing %s%%\n', api_call['progress'])
+                    await asyncio.sleep(10)
+                    continue
+                else:
+                    # Job FAILED
+                    raise RubrikException('{}'.format(str(api_call)))
+
+        else:
+            api_call = await self._common_api(
+                'JOB_STATUS',
+                api_version=None,
+                api_endpoint=None,
+                config=None,
+                job_status_url=url,
+                timeout=timeout)
+
+        return api_call
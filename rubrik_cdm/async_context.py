@@ -0,0 +1,54 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the coroutine variant of the per-call context wrapper used by the Rubrik SDK AsyncConnect class.
+"""
+
+import functools
+
+from .context import FUNCTION_NAME
+
+
+def scope_coroutine_function_name(function):
+    """Wrap a single SDK coroutine function so that it records its name as the SDK function of the current asyncio task while it runs.
+
+    Arguments:
+        function {function} -- The SDK coroutine function to wrap.
+
+    Returns:
+        function -- The wrapped coroutine function.
+    """
+
+    name = function.__name__
+
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        if FUNCTION_NAME.get() != "":
+            return await function(*args, **kwargs)
+
+        token = FUNCTION_NAME.set(name)
+        try:
+            return await function(*args, **kwargs)
+        finally:
+            FUNCTION_NAME.reset(token)
+
+    return wrapper
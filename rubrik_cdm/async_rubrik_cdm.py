@@ -0,0 +1,364 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the Rubrik SDK AsyncConnect class.
+"""
+
+import inspect
+
+from .async_api import AsyncApi
+from .rubrik_cdm import Connect
+from .cache import _monotonic
+from .capabilities import ClusterCapabilities
+from .cluster import Cluster
+from .context import scoped_function_names
+from .data_management import Data_Management
+from .exceptions import InvalidParameterException
+
+
+@scoped_function_names
+class AsyncConnect(AsyncApi):
+    """This class is the asyncio counterpart of `Connect`. It exposes awaitable versions of the base API methods along with the
+    most frequently used helper functions so that many Rubrik operations can run concurrently from a single event loop.
+
+    Arguments:
+        AsyncApi {class} -- This class contains awaitable versions of the base API methods.
+    """
+
+    def __init__(self, node_ip=None, username=None, password=None, api_token=None, enable_logging=False, logging_level="debug", pool_connections=10, pool_maxsize=10, keep_alive=True, object_id_cache_ttl=0, object_id_cache_size=1024, cluster_version_refresh=None, retry_policy=None, load_balancing=None, node_cooldown=30, node_discovery_interval=300, log_payload_size=None, json_codec="json", enable_metrics=True):
+        """Constructor for the AsyncConnect class which is used to initialize the class variables.
+
+        Keyword Arguments:
+            node_ip {str} -- The Hostname or IP Address of a node in the Rubrik cluster you wish to connect to. If a value is not provided we will check for a `rubrik_cdm_node_ip` environment variable. (default: {None})
+            username {str} -- The Username you wish to use to connect to the Rubrik cluster. If a value is not provided we will check for a `rubrik_cdm_username` environment variable. (default: {None})
+            password {str} -- The Password you wish to use to connect to the Rubrik cluster. If a value is not provided we will check for a `rubrik_cdm_password` environment variable. (default: {None})
+            api_token {str} -- The API Token you wish to use to connect to the Rubrik cluster. If populated, the `username` and `password` fields will be ignored. If a value is not provided we will check for a `rubrik_cdm_token` environment variable.  (default: {None})
+            enable_logging {bool} -- Flag to determine if logging will be enabled for the SDK. (default: {False})
+            logging_level {str} -- Sets the threshold for logging to the provided to level. Logging messages which are less severe than level will be ignored. (default: {debug}) (choices: {debug, critical, error, warning, info})
+            pool_connections {int} -- The number of connection pools (one per Rubrik node) the HTTP session will cache. (default: {10})
+            pool_maxsize {int} -- The maximum number of connections the HTTP session will keep open to a single Rubrik node. (default: {10})
+            keep_alive {bool} -- Flag that determines whether connections to the Rubrik cluster are reused across API calls. (default: {True})
+            object_id_cache_ttl {int} -- The number of seconds the IDs resolved by `object_id()` are cached for. A value of 0 disables the cache. (default: {0})
+            object_id_cache_size {int} -- The maximum number of IDs the `object_id()` cache holds before evicting the least recently used entry. (default: {1024})
+            cluster_version_refresh {int} -- The number of seconds after which the cached Rubrik cluster version is fetched again. By default the version is fetched once for the life of the connection. (default: {None})
+            retry_policy {RetryPolicy} -- The policy used to retry API calls that fail with a transient error, such as a `503 Service Unavailable` response. By default failed API calls are not retried. (default: {None})
+            load_balancing {str} -- Spread API calls across every node of the Rubrik cluster instead of only `node_ip`. The nodes are discovered through the `/cluster/me/node` endpoint. By default every API call is sent to `node_ip`. (default: {None}) (choices: {round_robin, least_outstanding})
+            node_cooldown {int} -- The number of seconds a node that fails to respond is excluded from load balancing. (default: {30})
+            node_discovery_interval {int} -- The number of seconds after which the nodes of the Rubrik cluster are discovered again. A value of 0 only discovers the nodes once. (default: {300})
+            log_payload_size {int} -- The maximum number of characters of each request body and response logged. A value of 0 redacts the payloads from the log. By default payloads are logged in full. (default: {None})
+            json_codec {str} -- The JSON library used to serialize request bodies and decode responses. `auto` selects the fastest installed library. (default: {json}) (choices: {json, orjson, ujson, auto})
+            enable_metrics {bool} -- Flag that determines whether the number of calls, latency, bytes, retries and errors of each API endpoint are recorded and returned by `stats()`. (default: {True})
+        """
+
+        Connect.__init__(
+            self,
+            node_ip=node_ip,
+            username=username,
+            password=password,
+            api_token=api_token,
+            enable_logging=enable_logging,
+            logging_level=logging_level,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            keep_alive=keep_alive,
+            object_id_cache_ttl=object_id_cache_ttl,
+            object_id_cache_size=object_id_cache_size,
+            cluster_version_refresh=cluster_version_refresh,
+            retry_policy=retry_policy,
+            load_balancing=load_balancing,
+            node_cooldown=node_cooldown,
+            node_discovery_interval=node_discovery_interval,
+            log_payload_size=log_payload_size,
+            json_codec=json_codec,
+            enable_metrics=enable_metrics)
+
+    # The request building and response parsing helpers do not perform any I/O and are shared with Connect
+    log = Connect.log
+    stats = Connect.stats
+    _log_enabled = Connect._log_enabled
+    __setattr__ = Connect.__setattr__
+    _request_headers = Connect._request_headers
+    _authorization_header = Connect._authorization_header
+    _uses_session_token = Connect._uses_session_token
+    _header = Connect._header
+    _api_validation = staticmethod(Connect._api_validation)
+    _cache_cluster_version = Cluster._cache_cluster_version
+    _platform_user_agent = Connect._platform_user_agent
+    invalidate_object_id_cache = Data_Management.invalidate_object_id_cache
+    _object_id_cache_key = staticmethod(Data_Management._object_id_cache_key)
+    _validate_object_id = Data_Management._validate_object_id
+    _object_id_api_call = Data_Management._object_id_api_call
+    _object_id_from_response = Data_Management._object_id_from_response
+    _object_id_from_items = Data_Management._object_id_from_items
+    _object_id_name_field = staticmethod(Data_Management._object_id_name_field)
+    _object_id_match = staticmethod(Data_Management._object_id_match)
+    _validate_sla_objects_type = staticmethod(Data_Management._validate_sla_objects_type)
+    _sla_objects_api_call = staticmethod(Data_Management._sla_objects_api_call)
+
+    async def cluster_version(self, timeout=15, refresh=False):
+        """Retrieves the software version of the Rubrik cluster. The version is fetched once and then reused for the life of the
+        connection, or until the `cluster_version_refresh` interval of the connection has elapsed.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            refresh {bool} -- Flag that forces the version to be fetched from the Rubrik cluster again. (default: {False})
+
+        Returns:
+            str -- The version of CDM installed on the Rubrik cluster.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        if refresh is False and self._cluster_version is not None:
+            if self._cluster_version_expires is None or self._cluster_version_expires > _monotonic():
+                return self._cluster_version
+
+        self.log(
+            'cluster_version: Getting the software version of the Rubrik cluster.')
+        version = (await self.get('v1', '/cluster/me/version', timeout=timeout))['version']
+
+        self._cache_cluster_version(version)
+
+        return version
+
+    async def cluster_capabilities(self, timeout=15):
+        """Retrieve the features available on the Rubrik cluster based on the version of CDM it is running.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            ClusterCapabilities -- The capabilities of the Rubrik cluster, including the comparable `version_tuple`.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        version = await self.cluster_version(timeout)
+
+        if self._cluster_capabilities is None or self._cluster_capabilities.version != version:
+            self._cluster_capabilities = ClusterCapabilities(version)
+
+        return self._cluster_capabilities
+
+    async def minimum_installed_cdm_version(self, cluster_version, timeout=15):
+        """Determine if the Rubrik cluster is running the provided CDM `cluster_version` or later. If the cluster is running an earlier release
+        of CDM, `False` is returned. If the cluster is running the provided `cluster_version`, or a later release, `True` is returned.
+
+        Arguments:
+            cluster_version {float} -- The minimum required version of Rubrik CDM you wish ensure is running.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        return (await self.cluster_capabilities(timeout)).minimum_version(cluster_version)
+
+    async def object_id(self, object_name, object_type, host_os=None, hostname=None, share_type=None, mssql_host=None, mssql_instance=None, timeout=15):
+        """Get the ID of a Rubrik object by providing its name.
+
+        Arguments:
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up. (choices: {vmware, sla, vmware_host, physical_host, fileset_template, managed_volume, mssql_db, mssql_instance, mssql_availability_group, vcenter, ahv, aws_native, oracle_db, oracle_host, volume_group, archival_location, share, organization, organization_role_id, organization_admin_role})
+
+        Keyword Arguments:
+            host_os {str} -- The operating system for the host. Required when object_type is 'fileset_template'. (default: {None}) (choices: {Windows, Linux})
+            hostname {str} -- The Oracle hostname, Oracle RAC cluster name, or one of the hostnames in the Oracle RAC cluster. Required when the object_type is oracle_db or share. Using the IP is not supported.
+            share_type {str} -- The type of NAS share i.e. NFS or SMB
+            mssql_host {str} -- The name of a MSSQL Host. Required when the object_type is mssql_db or mssql_instance.
+            mssql_instance {str} -- The name of a MSSQL database instance. Required when the object_type is mssql_db.
+            timeout {int} -- The number of seconds to wait to establish a connection with the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            str -- The ID of the provided Rubrik object.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        hostname = self._validate_object_id(object_name, object_type, host_os, hostname, share_type, mssql_host, mssql_instance)
+
+        if object_type == 'sla':
+            if object_name.upper() == "FOREVER" or object_name.upper() == "UNPROTECTED":
+                return "UNPROTECTED"
+
+        cache_key = self._object_id_cache_key(object_name, object_type, host_os, hostname, share_type, mssql_host, mssql_instance)
+        cached_object_id = self.object_id_cache.get(cache_key)
+        if cached_object_id is not None:
+            self.log("object_id: Using the cached object id for the %s object '%s'.", object_type, object_name)
+            return cached_object_id
+
+        host_id = None
+        filter_field_name = None
+        parent_id = None
+
+        if object_type == 'share':
+            self.log('Searching the Rubrik cluster for the host ID.')
+            host_id = parent_id = await self.object_id(
+                hostname, 'physical_host', timeout=timeout)
+        elif object_type == 'physical_host':
+            filter_field_name = (await self.cluster_capabilities(timeout)).physical_host_name_field
+        elif object_type == 'mssql_instance':
+            parent_id = await self.object_id(mssql_host, 'physical_host')
+        elif object_type == 'mssql_db':
+            parent_id = await self.object_id(
+                mssql_instance, "mssql_instance", mssql_host=mssql_host)
+        elif object_type == "organization_admin_role":
+            self.log("object_id: Getting the ID for the %s organization.", object_name)
+            parent_id = await self.object_id(
+                object_name, "organization_role_id", timeout=timeout)
+
+        api_call = self._object_id_api_call(
+            object_name, object_type, host_os, share_type, filter_field_name, parent_id)
+
+        self.log("object_id: Getting the object id for the %s object '%s'.", object_type, object_name)
+
+        api_request = await self.get(
+            api_call["api_version"],
+            api_call["api_endpoint"],
+            timeout=timeout)
+
+        object_id = self._object_id_from_response(api_request, object_name, object_type, hostname, host_id, filter_field_name)
+        self.object_id_cache.set(cache_key, object_id)
+
+        return object_id
+
+    async def on_demand_snapshot(self, object_name, object_type, sla_name='current', timeout=15):
+        """Initiate an on-demand snapshot.
+
+        Arguments:
+            object_name {str} -- The name of the Rubrik object to take a on-demand snapshot of.
+            object_type {str} -- The Rubrik object type you want to backup. (choices: {vmware, ahv})
+
+        Keyword Arguments:
+            sla_name {str} -- The SLA Domain name you want to assign the on-demand snapshot to. By default, the currently assigned SLA Domain will be used. (default: {'current'})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            tuple -- The full API response for `POST /v1/vmware/vm/{ID}/snapshot` or `POST /internal/nutanix/vm/{ID}/snapshot` and the job status URL which can be used to monitor progress of the snapshot. (api_response, job_status_url)
+        """
+
+        self.function_name = inspect.currentframe().f_code.co_name
+
+        snapshot_api = {
+            "vmware": {"api_version": "v1", "api_endpoint": "/vmware/vm/{}", "name": "vSphere VM"},
+            "ahv": {"api_version": "internal", "api_endpoint": "/nutanix/vm/{}", "name": "AHV VM"},
+        }
+
+        if object_type not in snapshot_api:
+            raise InvalidParameterException("The on_demand_snapshot() `object_type` argument must be one of the following: {}.".format(
+                sorted(snapshot_api)))
+
+        api_version = snapshot_api[object_type]["api_version"]
+        api_endpoint = snapshot_api[object_type]["api_endpoint"]
+        object_description = snapshot_api[object_type]["name"]
+
+        self.log("on_demand_snapshot: Searching the Rubrik cluster for the {} '{}'.".format(
+            object_description, object_name))
+        vm_id = await self.object_id(object_name, object_type, timeout=timeout)
+
+        if sla_name == 'current':
+            self.log(
+                "on_demand_snapshot: Searching the Rubrik cluster for the SLA Domain assigned to the {} '{}'.".format(object_description, object_name))
+
+            vm_summary = await self.get(
+                api_version, api_endpoint.format(vm_id), timeout=timeout)
+            sla_id = vm_summary['effectiveSlaDomainId']
+
+        else:
+            self.log(
+                "on_demand_snapshot: Searching the Rubrik cluster for the SLA Domain '{}'.".format(sla_name))
+            sla_id = await self.object_id(sla_name, 'sla', timeout=timeout)
+
+        config = {}
+        config['slaId'] = sla_id
+
+        self.log("on_demand_snapshot: Initiating snapshot for the {} '{}'.".format(
+            object_description, object_name))
+        api_request = await self.post(
+            api_version, "{}/snapshot".format(api_endpoint.format(vm_id)), config, timeout)
+
+        snapshot_status_url = api_request['links'][0]['href']
+
+        return (api_request, snapshot_status_url)
+
+    async def get_sla_objects(self, sla, object_type, timeout=15, page_size=100):
+        """Retrieve the name and ID of a specific object type.
+
+        Arguments:
+            sla {str} -- The name of the SLA Domain you wish to search.
+            object_type {str} -- The object type you wish to search the SLA for. (choices: {vmware, hyper-v, mssql_db, ec2_instance, oracle_db, vcd, managed_volume, ahv, nas_share, linux_and_unix_host, windows_host})
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster. (default: {15})
+            page_size {int} -- The number of objects to request per page. (default: {100})
+
+        Returns:
+            dict -- The `name:id` of each object in the provided SLA Domain.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        self._validate_sla_objects_type(object_type)
+
+        sla_id = await self.object_id(sla, "sla", timeout=timeout)
+        vm_name_id = {}
+
+        api_call = self._sla_objects_api_call(sla_id, object_type)
+
+        if "query" in api_call:
+            page_variables = self._first_connection_variables(api_call["variables"], page_size)
+
+            while page_variables is not None:
+                page = await self.query(
+                    api_call["query"], api_call["operation_name"], page_variables, timeout)
+                nodes, page_variables = self._next_connection_variables(page_variables, page, api_call["connection"])
+
+                for vm in nodes:
+                    vm_name_id[vm["hostname"]] = vm["id"]
+
+        else:
+            page_params = self._first_page_params(None, page_size)
+
+            while page_params is not None:
+                page = await self.get(
+                    api_call["api_version"],
+                    api_call["api_endpoint"],
+                    timeout=timeout,
+                    params=page_params)
+
+                for vm in page["data"]:
+                    vm_name_id[vm["name"]] = vm["id"]
+
+                page_params = self._next_page_params(page_params, page)
+
+        if bool(vm_name_id) is False:
+            raise InvalidParameterException(
+                "The SLA '{}' is currently not protecting any {} objects.".format(
+                    sla, object_type))
+
+        return vm_name_id
@@ -0,0 +1,191 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the Rubrik SDK Bulk class.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .api import Api
+from .cache import _monotonic
+from .job_watcher import JobWatcher
+from .exceptions import InvalidParameterException, InvalidTypeException
+
+
+class RateLimiter(object):
+    """Spaces out calls made from any number of threads so that no more than `rate` calls start each second.
+
+    Arguments:
+        rate {float} -- The maximum number of calls per second.
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next_call = _monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Block the calling thread until it may start its next call."""
+
+        with self._lock:
+            now = _monotonic()
+            delay = self._next_call - now
+            self._next_call = max(self._next_call, now) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Bulk(Api):
+    """This class contains methods used to run SDK functions and monitor jobs for many objects concurrently."""
+
+    def bulk(self, method_name, kwargs_list, max_workers=10, rate_limit=None):
+        """Call the SDK function `method_name` once for each dictionary of keyword arguments in `kwargs_list` using a pool of worker threads.
+        All calls share the pooled HTTP session of the connection, so `max_workers` should not exceed the `pool_maxsize` of the connection.
+
+        Arguments:
+            method_name {str} -- The name of the SDK function to call (ex. on_demand_snapshot).
+            kwargs_list {list} -- A list of dictionaries that contain the keyword arguments of each call.
+
+        Keyword Arguments:
+            max_workers {int} -- The maximum number of calls to run at the same time. (default: {10})
+            rate_limit {float} -- The maximum number of calls to start per second. By default calls are not rate limited. (default: {None})
+
+        Returns:
+            list -- The result of each call, in the same order as `kwargs_list`. When a call fails, the exception it raised is returned in its place.
+        """
+
+        results = [None] * len(kwargs_list)
+
+        for index, result in self.bulk_as_completed(method_name, kwargs_list, max_workers, rate_limit):
+            results[index] = result
+
+        return results
+
+    def bulk_as_completed(self, method_name, kwargs_list, max_workers=10, rate_limit=None):
+        """Call the SDK function `method_name` once for each dictionary of keyword arguments in `kwargs_list` using a pool of worker threads,
+        returning each result as soon as its call completes.
+
+        Arguments:
+            method_name {str} -- The name of the SDK function to call (ex. on_demand_snapshot).
+            kwargs_list {list} -- A list of dictionaries that contain the keyword arguments of each call.
+
+        Keyword Arguments:
+            max_workers {int} -- The maximum number of calls to run at the same time. (default: {10})
+            rate_limit {float} -- The maximum number of calls to start per second. By default calls are not rate limited. (default: {None})
+
+        Returns:
+            generator -- An `(index, result)` tuple for each call in the order the calls complete, where `index` is the position of the call in `kwargs_list`. When a call fails, the exception it raised is returned as the result.
+        """
+
+        method = self._bulk_validation(method_name, kwargs_list, max_workers, rate_limit)
+        rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+
+        self.log("bulk: Calling %s() %d times with %d workers.", method_name, len(kwargs_list), max_workers)
+
+        def call(kwargs):
+            if rate_limiter is not None:
+                rate_limiter.wait()
+            return method(**kwargs)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+        try:
+            for index, kwargs in enumerate(kwargs_list):
+                futures[executor.submit(call, kwargs)] = index
+
+            for future in as_completed(futures):
+                error = future.exception()
+                yield futures[future], error if error is not None else future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def watch_jobs(self, urls, deadline=None, min_interval=1, max_interval=30, timeout=15):
+        """Wait for many jobs to complete by polling their job status URLs from a single background thread. See `JobWatcher` for details
+        on how the polling interval of each job adapts to its progress.
+
+        Arguments:
+            urls {list} -- The job status URLs provided by previous API calls.
+
+        Keyword Arguments:
+            deadline {float} -- The number of seconds by which every job must complete. (default: {None})
+            min_interval {float} -- The minimum number of seconds between two polls of the same job. (default: {1})
+            max_interval {float} -- The maximum number of seconds between two polls of the same job. (default: {30})
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            list -- The final job status response body of each job, in the same order as `urls`. When a job fails or misses the deadline, the exception raised for it is returned in its place.
+        """
+
+        self.log("watch_jobs: Waiting for %d jobs to complete.", len(urls))
+
+        results = []
+
+        with JobWatcher(self, min_interval, max_interval, deadline, timeout) as watcher:
+            for future in watcher.watch_all(urls):
+                error = future.exception()
+                results.append(error if error is not None else future.result())
+
+            self.log("watch_jobs: %s", watcher.stats())
+
+        return results
+
+    def _bulk_validation(self, method_name, kwargs_list, max_workers, rate_limit):
+        """Internal method used to validate the arguments provided to `bulk()` and `bulk_as_completed()`.
+
+        Arguments:
+            method_name {str} -- The name of the SDK function to call.
+            kwargs_list {list} -- A list of dictionaries that contain the keyword arguments of each call.
+            max_workers {int} -- The maximum number of calls to run at the same time.
+            rate_limit {float} -- The maximum number of calls to start per second.
+
+        Returns:
+            function -- The bound SDK function.
+        """
+
+        if not isinstance(method_name, str):
+            raise InvalidTypeException("The bulk() method_name argument must be a string.")
+
+        method = getattr(self, method_name, None)
+        if method_name.startswith("_") or method_name.startswith("bulk") or not callable(method):
+            raise InvalidParameterException(
+                "The bulk() method_name argument '{}' is not a valid SDK function.".format(method_name))
+
+        if not isinstance(kwargs_list, list) or not all(isinstance(kwargs, dict) for kwargs in kwargs_list):
+            raise InvalidTypeException("The bulk() kwargs_list argument must be a list of dictionaries.")
+
+        if isinstance(max_workers, bool) or not isinstance(max_workers, int):
+            raise InvalidTypeException("The bulk() max_workers argument must be an integer.")
+        if max_workers < 1:
+            raise InvalidParameterException("The bulk() max_workers argument must be 1 or greater.")
+
+        if rate_limit is not None:
+            if isinstance(rate_limit, bool) or not isinstance(rate_limit, (int, float)):
+                raise InvalidTypeException("The bulk() rate_limit argument must be a number.")
+            if rate_limit <= 0:
+                raise InvalidParameterException("The bulk() rate_limit argument must be greater than 0.")
+
+        return method
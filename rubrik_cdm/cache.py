@@ -0,0 +1,150 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the Rubrik SDK TTLCache class.
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+try:
+    _monotonic = time.monotonic  # Python 3.3+
+except AttributeError:
+    _monotonic = time.time  # Python 2.X
+
+from .exceptions import InvalidParameterException, InvalidTypeException
+
+
+class TTLCache(object):
+    """A thread-safe, size bounded cache whose entries expire a fixed number of seconds after they are stored. When the cache
+    is full the least recently used entry is evicted.
+
+    Keyword Arguments:
+        ttl {int} -- The number of seconds an entry remains valid. A value of 0 disables the cache. (default: {0})
+        max_size {int} -- The maximum number of entries to hold before evicting the least recently used entry. (default: {1024})
+    """
+
+    def __init__(self, ttl=0, max_size=1024):
+
+        if isinstance(ttl, bool) or not isinstance(ttl, (int, float)):
+            raise InvalidTypeException("The cache ttl must be a number.")
+        if isinstance(max_size, bool) or not isinstance(max_size, int):
+            raise InvalidTypeException("The cache max_size must be an integer.")
+        if ttl < 0:
+            raise InvalidParameterException("The cache ttl must be 0 or greater.")
+        if max_size < 1:
+            raise InvalidParameterException("The cache max_size must be 1 or greater.")
+
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """bool -- `True` when the cache stores entries."""
+        return self.ttl > 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the cached value for `key`, or `default` when the entry is missing or has expired.
+
+        Arguments:
+            key {tuple} -- The cache key.
+
+        Keyword Arguments:
+            default {object} -- The value returned on a cache miss. (default: {None})
+
+        Returns:
+            object -- The cached value or `default`.
+        """
+
+        if not self.enabled:
+            return default
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, value = entry
+                if expires > _monotonic():
+                    # Mark the entry as the most recently used
+                    del self._entries[key]
+                    self._entries[key] = entry
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """Store `value` under `key`, evicting the least recently used entry when the cache is full.
+
+        Arguments:
+            key {tuple} -- The cache key.
+            value {object} -- The value to cache.
+        """
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (_monotonic() + self.ttl, value)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, match=None):
+        """Remove entries from the cache.
+
+        Keyword Arguments:
+            match {callable} -- A function that receives each key and returns `True` when the entry should be removed. When not provided, every entry is removed. (default: {None})
+
+        Returns:
+            int -- The number of entries removed.
+        """
+
+        with self._lock:
+            if match is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            keys = [key for key in self._entries if match(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self):
+        """Return the cache statistics.
+
+        Returns:
+            dict -- The number of `hits`, `misses` and cached entries (`size`).
+        """
+
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
@@ -0,0 +1,97 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the Rubrik SDK ClusterCapabilities class.
+"""
+
+from .exceptions import InvalidParameterException
+
+
+def parse_cdm_version(version):
+    """Convert a Rubrik CDM version into a comparable `(major, minor, patch)` tuple. The build number is ignored and missing
+    components are treated as 0, so `5.0` and `5.0.0-1280` both parse to `(5, 0, 0)`.
+
+    Arguments:
+        version {str or float} -- The CDM version (ex. 5.0.1-1280, 5.0, 5.0).
+
+    Returns:
+        tuple -- The `(major, minor, patch)` version tuple.
+    """
+
+    release = str(version).strip().split("-")[0]
+
+    try:
+        version_tuple = [int(component) for component in release.split(".")[:3]]
+    except ValueError:
+        raise InvalidParameterException("'{}' is not a valid Rubrik CDM version.".format(version))
+
+    while len(version_tuple) < 3:
+        version_tuple.append(0)
+
+    return tuple(version_tuple)
+
+
+class ClusterCapabilities(object):
+    """The features available on a Rubrik cluster, derived from the CDM version it is running.
+
+    Arguments:
+        version {str} -- The version of CDM installed on the Rubrik cluster (ex. 5.0.1-1280).
+    """
+
+    def __init__(self, version):
+        self.version = version
+        self.version_tuple = parse_cdm_version(version)
+
+    def __repr__(self):
+        return "ClusterCapabilities('{}')".format(self.version)
+
+    def minimum_version(self, version):
+        """Determine if the Rubrik cluster is running the provided CDM `version` or later.
+
+        Arguments:
+            version {str or float} -- The minimum required version of Rubrik CDM.
+
+        Returns:
+            bool -- `True` when the Rubrik cluster is running `version` or later.
+        """
+
+        return self.version_tuple >= parse_cdm_version(version)
+
+    @property
+    def api_token(self):
+        """bool -- API Token authentication is supported (CDM 5.0+)."""
+        return self.minimum_version("5.0")
+
+    @property
+    def sla_v2(self):
+        """bool -- SLA Domains are managed through the v2 API (CDM 5.0+)."""
+        return self.minimum_version("5.0")
+
+    @property
+    def physical_host_name_field(self):
+        """str -- The field that holds the name of a physical host in the `/host` API responses."""
+        return "name" if self.minimum_version("5.0") else "hostname"
+
+    @property
+    def cloud_native_protection(self):
+        """bool -- AWS native protection is supported (CDM 4.2+)."""
+        return self.minimum_version("4.2")
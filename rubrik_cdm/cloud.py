@@ -589,7 +589,7 @@ class Cloud(Api):
 
         # verify we are on cdm 4.2 or newer, required for cloud native
         # protection
-        if self.minimum_installed_cdm_version(4.2) is False:
+        if self.cluster_capabilities().cloud_native_protection is False:
             raise CDMVersionException(4.2)
 
         # check for regions and credentials in environment variables if not
@@ -690,7 +690,7 @@ class Cloud(Api):
 
         # verify we are on cdm 4.2 or newer, required for cloud native
         # protection
-        if self.minimum_installed_cdm_version(4.2) is False:
+        if self.cluster_capabilities().cloud_native_protection is False:
             raise CDMVersionException(4.2)
 
         if not isinstance(config, dict):
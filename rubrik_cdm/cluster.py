@@ -23,6 +23,8 @@ This module contains the Rubrik SDK Cluster class.
 """
 
 from .api import Api
+from .cache import _monotonic
+from .capabilities import ClusterCapabilities
 from .exceptions import InvalidParameterException, CDMVersionException, InvalidTypeException
 import inspect
 
@@ -160,11 +162,13 @@ class Cluster(Api):
 
         return self.post("internal", "/replication/target", config, timeout)
 
-    def cluster_version(self, timeout=15):
-        """Retrieves the software version of the Rubrik cluster.
+    def cluster_version(self, timeout=15, refresh=False):
+        """Retrieves the software version of the Rubrik cluster. The version is fetched once and then reused for the life of the
+        connection, or until the `cluster_version_refresh` interval of the connection has elapsed.
 
         Keyword Arguments:
             timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            refresh {bool} -- Flag that forces the version to be fetched from the Rubrik cluster again. (default: {False})
 
         Returns:
             str -- The version of CDM installed on the Rubrik cluster.
@@ -173,9 +177,50 @@ class Cluster(Api):
         if self.function_name == "":
             self.function_name = inspect.currentframe().f_code.co_name
 
+        if refresh is False and self._cluster_version is not None:
+            if self._cluster_version_expires is None or self._cluster_version_expires > _monotonic():
+                return self._cluster_version
+
         self.log(
             'cluster_version: Getting the software version of the Rubrik cluster.')
-        return self.get('v1', '/cluster/me/version', timeout=timeout)['version']
+        version = self.get('v1', '/cluster/me/version', timeout=timeout)['version']
+
+        self._cache_cluster_version(version)
+
+        return version
+
+    def _cache_cluster_version(self, version):
+        """Internal method used to store the software version of the Rubrik cluster.
+
+        Arguments:
+            version {str} -- The version of CDM installed on the Rubrik cluster.
+        """
+
+        self._cluster_version = version
+        if self.cluster_version_refresh is None:
+            self._cluster_version_expires = None
+        else:
+            self._cluster_version_expires = _monotonic() + self.cluster_version_refresh
+
+    def cluster_capabilities(self, timeout=15):
+        """Retrieve the features available on the Rubrik cluster based on the version of CDM it is running.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            ClusterCapabilities -- The capabilities of the Rubrik cluster, including the comparable `version_tuple`.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        version = self.cluster_version(timeout)
+
+        if self._cluster_capabilities is None or self._cluster_capabilities.version != version:
+            self._cluster_capabilities = ClusterCapabilities(version)
+
+        return self._cluster_capabilities
 
     def minimum_installed_cdm_version(self, cluster_version, timeout=15):
         """Determine if the Rubrik cluster is running the provided CDM `cluster_version` or later. If the cluster is running an earlier release
@@ -190,10 +235,7 @@ class Cluster(Api):
         if self.function_name == "":
             self.function_name = inspect.currentframe().f_code.co_name
 
-        if float(self.cluster_version(timeout)[:3]) < float(cluster_version):
-            return False
-
-        return True
+        return self.cluster_capabilities(timeout).minimum_version(cluster_version)
 
     def cluster_node_ip(self, timeout=15):
         """Retrieve the IP Address for each node in the Rubrik cluster.
@@ -413,7 +455,34 @@ class Cluster(Api):
         config["timezone"]["timezone"] = timezone
 
         self.log("cluster_timezone: Configuring the Rubrik cluster timezone")
-        return self.patch("v1", "/cluster/me", config, timeout)
+        api_request = self.patch("v1", "/cluster/me", config, timeout)
+
+        self._cluster_timezone = timezone
+
+        return api_request
+
+    def cluster_timezone(self, timeout=15, refresh=False):
+        """Retrieve the timezone configured on the Rubrik cluster. The timezone is fetched once and then reused for the life of the connection.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+            refresh {bool} -- Flag that forces the timezone to be fetched from the Rubrik cluster again. (default: {False})
+
+        Returns:
+            str -- The timezone of the Rubrik cluster (ex. America/Chicago).
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        if refresh is False and self._cluster_timezone is not None:
+            return self._cluster_timezone
+
+        self.log("cluster_timezone: Getting the Rubrik cluster timezone.")
+        cluster_summary = self.get("v1", "/cluster/me", timeout=timeout)
+        self._cluster_timezone = cluster_summary["timezone"]["timezone"]
+
+        return self._cluster_timezone
 
     def configure_ntp(self, ntp_server, timeout=15):
         """Configure connection information for the NTP servers used by the Rubrik cluster for time synchronization.
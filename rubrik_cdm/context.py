@@ -0,0 +1,163 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the per-call context shared by the Rubrik SDK classes.
+"""
+
+import functools
+import inspect
+import threading
+import types
+
+try:
+    from contextvars import ContextVar  # Python 3.7+
+except ImportError:
+    ContextVar = None
+
+
+class _ThreadLocalVar(object):
+    """A minimal stand-in for `contextvars.ContextVar` that stores its value per thread on Python versions without `contextvars`.
+
+    Arguments:
+        default {object} -- The value returned when the current thread has not set a value.
+    """
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, "value", self._default)
+
+    def set(self, value):
+        token = self.get()
+        self._local.value = value
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+if ContextVar is not None:
+    # Each thread and asyncio task sees its own value
+    FUNCTION_NAME = ContextVar("rubrik_cdm_function_name", default="")
+else:
+    FUNCTION_NAME = _ThreadLocalVar("")
+
+
+# Public functions that never make an API call themselves
+_UNSCOPED_FUNCTIONS = ("log", "close")
+
+
+def scoped_function_names(cls):
+    """Class decorator that wraps every public function of `cls` so that it records its name as the SDK function of the current call
+    when no other SDK function is already running in the current thread or asyncio task. The name is cleared again once the outermost
+    function returns, so it is never carried over to the next call.
+
+    Arguments:
+        cls {class} -- The SDK class to decorate.
+
+    Returns:
+        class -- The decorated class.
+    """
+
+    for name in dir(cls):
+        if name.startswith("_") or name in _UNSCOPED_FUNCTIONS:
+            continue
+
+        # Look up the raw attribute so staticmethods, classmethods and properties are left untouched
+        for klass in cls.__mro__:
+            if name in klass.__dict__:
+                function = klass.__dict__[name]
+                break
+
+        if isinstance(function, types.FunctionType):
+            setattr(cls, name, _scope_function_name(function))
+
+    return cls
+
+
+def _scope_function_name(function):
+    """Internal function used to wrap a single SDK function. See `scoped_function_names()`.
+
+    Arguments:
+        function {function} -- The SDK function to wrap.
+
+    Returns:
+        function -- The wrapped function.
+    """
+
+    name = function.__name__
+
+    if getattr(inspect, "iscoroutinefunction", None) is not None and inspect.iscoroutinefunction(function):
+        # Coroutine syntax is kept out of this module so it can still be imported on Python 2
+        from .async_context import scope_coroutine_function_name
+        return scope_coroutine_function_name(function)
+
+    if inspect.isgeneratorfunction(function):
+        return _scope_generator_function_name(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if FUNCTION_NAME.get() != "":
+            return function(*args, **kwargs)
+
+        token = FUNCTION_NAME.set(name)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            FUNCTION_NAME.reset(token)
+
+    return wrapper
+
+
+def _scope_generator_function_name(function):
+    """Internal function used to wrap a single SDK generator function. The generator only runs when it is iterated, so the name is
+    recorded around each step instead of around the call that creates the generator.
+
+    Arguments:
+        function {function} -- The SDK generator function to wrap.
+
+    Returns:
+        function -- The wrapped generator function.
+    """
+
+    name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        generator = function(*args, **kwargs)
+        try:
+            while True:
+                token = FUNCTION_NAME.set(name) if FUNCTION_NAME.get() == "" else None
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    if token is not None:
+                        FUNCTION_NAME.reset(token)
+                yield item
+        finally:
+            generator.close()
+
+    return wrapper
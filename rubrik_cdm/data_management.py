@@ -24,6 +24,14 @@ This module contains the Rubrik SDK Data_Management class.
 """
 import re
 from datetime import datetime
+try:
+    from urllib import quote  # Python 2.X
+except ImportError:
+    from urllib.parse import quote  # Python 3+
+try:
+    _string_types = basestring  # Python 2.X
+except NameError:
+    _string_types = str  # Python 3+
 from .api import Api
 from .exceptions import CDMVersionException, InvalidParameterException, InvalidTypeException, APICallException
 import inspect
@@ -325,6 +333,288 @@ class Data_Management(Api):
         if self.function_name == "":
             self.function_name = inspect.currentframe().f_code.co_name
 
+        hostname = self._validate_object_id(object_name, object_type, host_os, hostname, share_type, mssql_host, mssql_instance)
+
+        if object_type == 'sla':
+            if object_name.upper() == "FOREVER" or object_name.upper() == "UNPROTECTED":
+                return "UNPROTECTED"
+
+        cache_key = self._object_id_cache_key(object_name, object_type, host_os, hostname, share_type, mssql_host, mssql_instance)
+        cached_object_id = self.object_id_cache.get(cache_key)
+        if cached_object_id is not None:
+            self.log("object_id: Using the cached object id for the %s object '%s'.", object_type, object_name)
+            return cached_object_id
+
+        host_id = None
+        filter_field_name = None
+        parent_id = None
+
+        if object_type == 'share':
+            self.log('Searching the Rubrik cluster for the host ID.')
+            host_id = parent_id = self.object_id(
+                hostname, 'physical_host', timeout=timeout)
+        elif object_type == 'physical_host':
+            filter_field_name = self.cluster_capabilities(timeout).physical_host_name_field
+        elif object_type == 'mssql_instance':
+            # root_id is host_id in SQL speak
+            parent_id = self.object_id(mssql_host, 'physical_host')
+        elif object_type == 'mssql_db':
+            parent_id = self.object_id(
+                mssql_instance, "mssql_instance", mssql_host=mssql_host)
+        elif object_type == "organization_admin_role":
+            # When looking up the org_admin_role the user should provide the org name
+            # as the object_name. We then use that to look up the id for the org and
+            # then set that as the "object_type" for the full org_admin_role query
+            self.log("object_id: Getting the ID for the %s organization.", object_name)
+            parent_id = self.object_id(
+                object_name, "organization_role_id", timeout=timeout)
+
+        object_id = self._object_id_from_inventory(object_name, object_type, hostname, host_id, filter_field_name, parent_id)
+        if object_id is not None:
+            self.object_id_cache.set(cache_key, object_id)
+            return object_id
+
+        api_call = self._object_id_api_call(
+            object_name, object_type, host_os, share_type, filter_field_name, parent_id)
+
+        self.log("object_id: Getting the object id for the %s object '%s'.", object_type, object_name)
+
+        if object_type == "organization_admin_role":
+            api_request = self.get(api_call["api_version"], api_call["api_endpoint"], timeout=timeout)
+            object_id = self._object_id_from_response(api_request, object_name, object_type)
+        else:
+            # Pages are only requested until the object is found
+            items = self.paginate(api_call["api_version"], api_call["api_endpoint"], timeout=timeout)
+            try:
+                object_id = self._object_id_from_items(items, object_name, object_type, hostname, host_id, filter_field_name)
+            finally:
+                items.close()
+
+        self.object_id_cache.set(cache_key, object_id)
+
+        return object_id
+
+    def _object_id_from_inventory(self, object_name, object_type, hostname=None, host_id=None, filter_field_name=None, parent_id=None):
+        """Internal method used to find the ID of the requested object in the `inventory` of the connection.
+        Arguments:
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            hostname {str} -- The hostname associated with the object. (default: {None})
+            host_id {str} -- The ID of the host associated with a share object. (default: {None})
+            filter_field_name {str} -- The name of the physical host field to match on. (choices: {name, hostname}) (default: {None})
+            parent_id {str} -- The instance ID of a mssql_db object. (default: {None})
+        Returns:
+            str -- The ID of the provided Rubrik object, or `None` when the inventory is disabled, does not hold the object type or does not hold exactly one matching object.
+        """
+
+        if self.inventory is None or object_type not in ['vmware', 'sla', 'physical_host', 'managed_volume', 'mssql_db', 'share'] or not self.inventory.indexes(object_type):
+            return None
+
+        items = self.inventory.find(object_type, object_name)
+        if object_type == 'mssql_db':
+            items = [item for item in items if item.get('instanceId') == parent_id]
+
+        try:
+            object_id = self._object_id_from_items(items, object_name, object_type, hostname, host_id, filter_field_name)
+        except InvalidParameterException:
+            # The object may have been created or renamed since the inventory was refreshed
+            return None
+
+        self.log("object_id: Found the %s object '%s' in the inventory.", object_type, object_name)
+        return object_id
+
+    def object_ids(self, object_names, object_type, page_size=1000, timeout=15):
+        """Get the IDs of many Rubrik objects of the same type by providing their names. The objects are listed once, instead of calling
+        `object_id()` for each name, and names are matched case-insensitively. When the `object_id_cache_ttl` of the connection is enabled,
+        every resolved ID is also added to the `object_id()` cache, so SDK functions called afterwards for the same objects, including through
+        `bulk()`, do not look them up again.
+        Arguments:
+            object_names {list} -- The names of the Rubrik objects whose IDs you wish to lookup.
+            object_type {str} -- The object type you wish to look up. (choices: {vmware, sla, vmware_host, physical_host, managed_volume, ahv, ahv_cluster, vcenter, volume_group})
+        Keyword Arguments:
+            page_size {int} -- The number of objects to request per API call. (default: {1000})
+            timeout {int} -- The number of seconds to wait to establish a connection with the Rubrik cluster before returning a timeout error. (default: {15})
+        Returns:
+            dict -- The `ids` of every object found, as a `name:id` dict, the `missing` names that were not found and the `duplicates` names shared by more than one object, as a `name:[ids]` dict.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
+        self._validate_object_ids(object_names, object_type)
+
+        result = {"ids": {}, "missing": [], "duplicates": {}}
+
+        # The requested names, by lower case name, that are not in the object_id() cache
+        pending = {}
+        for object_name in object_names:
+            if object_type == 'sla' and object_name.upper() in ["FOREVER", "UNPROTECTED"]:
+                result["ids"][object_name] = "UNPROTECTED"
+                continue
+
+            cached_object_id = self.object_id_cache.get(self._object_id_cache_key(object_name, object_type))
+            if cached_object_id is not None:
+                result["ids"][object_name] = cached_object_id
+            else:
+                pending.setdefault(object_name.lower(), []).append(object_name)
+
+        if not pending:
+            return result
+
+        filter_field_name = None
+        if object_type == 'physical_host':
+            filter_field_name = self.cluster_capabilities(timeout).physical_host_name_field
+        name_value = self._object_id_name_field(object_type, filter_field_name)
+
+        api_call = self._object_ids_api_call(object_type)
+
+        self.log("object_ids: Getting the object ids of %d %s objects.", len(pending), object_type)
+
+        matches = {}
+        for item in self.paginate(api_call["api_version"], api_call["api_endpoint"], page_size=page_size, timeout=timeout, stream=True):
+            name = item.get(name_value)
+            if name is not None and name.lower() in pending:
+                matches.setdefault(name.lower(), []).append(item['id'])
+
+        for lower_name, names in pending.items():
+            ids = matches.get(lower_name, [])
+            for object_name in names:
+                if len(ids) == 1:
+                    result["ids"][object_name] = ids[0]
+                    self.object_id_cache.set(self._object_id_cache_key(object_name, object_type), ids[0])
+                elif len(ids) > 1:
+                    result["duplicates"][object_name] = list(ids)
+                else:
+                    result["missing"].append(object_name)
+
+        return result
+
+    @staticmethod
+    def _validate_object_ids(object_names, object_type):
+        """Internal method used to validate the arguments provided to `object_ids()`.
+        Arguments:
+            object_names {list} -- The names of the Rubrik objects whose IDs you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        """
+
+        if not isinstance(object_names, list) or not all(isinstance(object_name, _string_types) for object_name in object_names):
+            raise InvalidTypeException("The object_ids() object_names argument must be a list of strings.")
+
+        valid_object_type = ['vmware', 'sla', 'vmware_host', 'physical_host', 'managed_volume', 'ahv', 'ahv_cluster', 'vcenter', 'volume_group']
+
+        if object_type not in valid_object_type:
+            raise InvalidParameterException("The object_ids() object_type argument must be one of the following: {}.".format(
+                valid_object_type))
+
+    @staticmethod
+    def _object_ids_api_call(object_type):
+        """Internal method used to determine which API endpoint `object_ids()` should list for the provided object type.
+        Arguments:
+            object_type {str} -- The object type you wish to look up.
+        Returns:
+            dict -- The `api_version` and `api_endpoint` to query.
+        """
+
+        api_call = {
+            "vmware": {
+                "api_version": "v1",
+                "api_endpoint": "/vmware/vm?primary_cluster_id=local&is_relic=false"
+            },
+            "sla": {
+                "api_version": "v1",
+                "api_endpoint": "/sla_domain?primary_cluster_id=local"
+            },
+            "vmware_host": {
+                "api_version": "v1",
+                "api_endpoint": "/vmware/host?primary_cluster_id=local"
+            },
+            "physical_host": {
+                "api_version": "v1",
+                "api_endpoint": "/host?primary_cluster_id=local"
+            },
+            "managed_volume": {
+                "api_version": "internal",
+                "api_endpoint": "/managed_volume?is_relic=false&primary_cluster_id=local"
+            },
+            "ahv": {
+                "api_version": "internal",
+                "api_endpoint": "/nutanix/vm?primary_cluster_id=local&is_relic=false"
+            },
+            "ahv_cluster": {
+                "api_version": "internal",
+                "api_endpoint": "/nutanix/cluster?primary_cluster_id=local"
+            },
+            "vcenter": {
+                "api_version": "v1",
+                "api_endpoint": "/vmware/vcenter?primary_cluster_id=local"
+            },
+            "volume_group": {
+                "api_version": "internal",
+                "api_endpoint": "/volume_group?is_relic=false"
+            }
+        }
+
+        return api_call[object_type]
+
+    def invalidate_object_id_cache(self, object_name=None, object_type=None):
+        """Remove cached IDs from the `object_id()` cache. Call this after renaming, deleting or re-creating objects on the Rubrik cluster
+        when the `object_id_cache_ttl` of the connection is enabled.
+        Keyword Arguments:
+            object_name {str} -- Only remove the cached IDs of objects with this name. (default: {None})
+            object_type {str} -- Only remove the cached IDs of this object type. (default: {None})
+        Returns:
+            int -- The number of cached IDs removed.
+        """
+
+        self.function_name = inspect.currentframe().f_code.co_name
+
+        if object_name is None and object_type is None:
+            return self.object_id_cache.invalidate()
+
+        def match(cache_key):
+            if object_type is not None and cache_key[0] != object_type:
+                return False
+            if object_name is not None and cache_key[1] != object_name.lower():
+                return False
+            return True
+
+        return self.object_id_cache.invalidate(match)
+
+    @staticmethod
+    def _object_id_cache_key(object_name, object_type, host_os=None, hostname=None, share_type=None, mssql_host=None, mssql_instance=None):
+        """Internal method used to build the `object_id()` cache key. Object names are matched case-insensitively by `object_id()` so the
+        name is lower cased.
+        Arguments:
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            host_os {str} -- The operating system for the host. (default: {None})
+            hostname {str} -- The hostname associated with the object. (default: {None})
+            share_type {str} -- The type of NAS share. (default: {None})
+            mssql_host {str} -- The name of a MSSQL Host. (default: {None})
+            mssql_instance {str} -- The name of a MSSQL database instance. (default: {None})
+        Returns:
+            tuple -- The cache key.
+        """
+
+        return (object_type, object_name.lower(), host_os, hostname, share_type, mssql_host, mssql_instance)
+
+    def _validate_object_id(self, object_name, object_type, host_os=None, hostname=None, share_type=None, mssql_host=None, mssql_instance=None):
+        """Internal method used to validate the arguments provided to `object_id()`.
+        Arguments:
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            host_os {str} -- The operating system for the host. Required when object_type is 'fileset_template'. (default: {None})
+            hostname {str} -- The hostname associated with the object. Required when the object_type is oracle_db or share. (default: {None})
+            share_type {str} -- The type of NAS share i.e. NFS or SMB. Required when the object_type is share. (default: {None})
+            mssql_host {str} -- The name of a MSSQL Host. Required when the object_type is mssql_db or mssql_instance. (default: {None})
+            mssql_instance {str} -- The name of a MSSQL database instance. Required when the object_type is mssql_db. (default: {None})
+        Returns:
+            str -- The hostname to match the object against with any domain name removed for Oracle databases.
+        """
+
         valid_object_type = [
             'vmware',
             'sla',
@@ -361,10 +651,6 @@ class Data_Management(Api):
                 raise InvalidParameterException(
                     "The host_os must be either 'Linux' or 'Windows'.")
 
-        if object_type == 'sla':
-            if object_name.upper() == "FOREVER" or object_name.upper() == "UNPROTECTED":
-                return "UNPROTECTED"
-
         if object_type == 'oracle_db':
             if hostname is None:
                 raise InvalidParameterException(
@@ -389,10 +675,32 @@ class Data_Management(Api):
             if share_type is None:
                 raise InvalidParameterException(
                     "You must provide the 'share_type' with the NAS share object.")
-            else:
-                self.log('Searching the Rubrik cluster for the host ID.')
-                host_id = self.object_id(
-                    hostname, 'physical_host', timeout=timeout)
+
+        if object_type == 'mssql_instance':
+            if mssql_host is None:
+                raise InvalidParameterException(
+                    "You must provide a mssql_host when the object_type is mssql_instance.")
+
+        if object_type == 'mssql_db':
+            if mssql_instance is None or mssql_host is None:
+                raise InvalidParameterException(
+                    "You must provide a mssql_host and mssql_instance when the object_type is mssql_db.")
+
+        return hostname
+
+    def _object_id_api_call(self, object_name, object_type, host_os=None, share_type=None, filter_field_name=None, parent_id=None):
+        """Internal method used to determine which API endpoint `object_id()` should query for the provided object type.
+        Arguments:
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            host_os {str} -- The operating system for the fileset template. (default: {None})
+            share_type {str} -- The type of NAS share i.e. NFS or SMB. (default: {None})
+            filter_field_name {str} -- The name of the physical host field to filter on. (choices: {name, hostname}) (default: {None})
+            parent_id {str} -- The ID of the parent object. The host ID for mssql_instance and share, the instance ID for mssql_db and the organization role ID for organization_admin_role. (default: {None})
+        Returns:
+            dict -- The `api_version` and `api_endpoint` to query. The endpoint filters the results by name wherever the Rubrik API supports it.
+        """
 
         api_call = {
             "vmware": {
@@ -405,7 +713,7 @@ class Data_Management(Api):
             },
             "vmware_host": {
                 "api_version": "v1",
-                "api_endpoint": "/vmware/host?primary_cluster_id=local"
+                "api_endpoint": "/vmware/host?primary_cluster_id=local&name={}".format(quote(object_name))
             },
             "fileset_template": {
                 "api_version": "v1",
@@ -421,7 +729,7 @@ class Data_Management(Api):
             },
             "ahv_cluster": {
                 "api_version": "internal",
-                "api_endpoint": "/nutanix/cluster?primary_cluster_id=local".format(object_name)
+                "api_endpoint": "/nutanix/cluster?primary_cluster_id=local&name={}".format(quote(object_name))
             },
             "aws_native": {
                 "api_version": "internal",
@@ -429,7 +737,7 @@ class Data_Management(Api):
             },
             "vcenter": {
                 "api_version": "v1",
-                "api_endpoint": "/vmware/vcenter?primary_cluster_id=local"
+                "api_endpoint": "/vmware/vcenter?primary_cluster_id=local&name={}".format(quote(object_name))
             },
             "oracle_db": {
                 "api_version": "internal",
@@ -441,7 +749,7 @@ class Data_Management(Api):
             },
             "volume_group": {
                 "api_version": "internal",
-                "api_endpoint": "/volume_group?is_relic=false"
+                "api_endpoint": "/volume_group?is_relic=false&hostname={}".format(quote(object_name))
             },
             "archival_location": {
                 "api_version": "internal",
@@ -449,7 +757,7 @@ class Data_Management(Api):
             },
             "share": {
                 "api_version": "internal",
-                "api_endpoint": "/host/share?share_type={}".format(share_type)
+                "api_endpoint": "/host/share?share_type={}&host_id={}&export_point={}".format(share_type, parent_id, quote(object_name))
             },
             "organization": {
                 "api_version": "internal",
@@ -461,7 +769,7 @@ class Data_Management(Api):
             },
             "mssql_availability_group": {
                 "api_version": "v1",
-                "api_endpoint": "/mssql/hierarchy/root/children?has_instances=false&is_clustered=false&is_live_mount=false&limit=51&object_type=MssqlAvailabilityGroup&offset=0&primary_cluster_id=local&snappable_status=Protectable&name={}".format(object_name)
+                "api_endpoint": "/mssql/hierarchy/root/children?has_instances=false&is_clustered=false&is_live_mount=false&object_type=MssqlAvailabilityGroup&primary_cluster_id=local&snappable_status=Protectable&name={}".format(object_name)
             },
             "replication_location": {
                 "api_version": "internal",
@@ -470,108 +778,81 @@ class Data_Management(Api):
         }
 
         if object_type == 'physical_host':
-            if self.minimum_installed_cdm_version(5.0, timeout) is True:
-                filter_field_name = "name"
-            else:
-                filter_field_name = "hostname"
-
             api_call["physical_host"] = {
                 "api_version": "v1",
                 "api_endpoint": "/host?primary_cluster_id=local&{}={}".format(filter_field_name, object_name)
             }
 
         if object_type == 'mssql_instance':
-            if mssql_host is None:
-                raise InvalidParameterException(
-                    "You must provide a mssql_host when the object_type is mssql_instance.")
-            # root_id is host_id in SQL speak
-            root_id = self.object_id(mssql_host, 'physical_host')
-
             api_call["mssql_instance"] = {
                 "api_version": "v1",
-                "api_endpoint": "/mssql/instance?primary_cluster_id=local&root_id={}".format(root_id)
+                "api_endpoint": "/mssql/instance?primary_cluster_id=local&root_id={}".format(parent_id)
             }
 
         if object_type == 'mssql_db':
-            if mssql_instance is None or mssql_host is None:
-                raise InvalidParameterException(
-                    "You must provide a mssql_host and mssql_instance when the object_type is mssql_db.")
-
-            instance_id = self.object_id(
-                mssql_instance, "mssql_instance", mssql_host=mssql_host)
-
             api_call["mssql_db"] = {
                 "api_version": "v1",
-                "api_endpoint": "/mssql/db?primary_cluster_id=local&is_relic=false&name={}&instance_id={}".format(object_name, instance_id)
+                "api_endpoint": "/mssql/db?primary_cluster_id=local&is_relic=false&name={}&instance_id={}".format(object_name, parent_id)
             }
 
-        # When looking up the org_admin_role the user should provide the org name
-        # as the object_name. We then use that to look up the id for the org and
-        # then set that as the "object_type" for the full org_admin_role query
         if object_type == "organization_admin_role":
-            self.log(
-                "object_id: Getting the ID for the {} organization.".format(object_name))
-            org_role_id = self.object_id(
-                object_name, "organization_role_id", timeout=timeout)
-
             api_call["organization_admin_role"] = {
                 "api_version": "internal",
-                "api_endpoint": "/role/{}/authorization".format(org_role_id)
+                "api_endpoint": "/role/{}/authorization".format(parent_id)
             }
 
-        self.log("object_id: Getting the object id for the {} object '{}'.".format(
-            object_type, object_name))
+        return api_call[object_type]
 
-        api_request = self.get(
-            api_call[object_type]["api_version"],
-            api_call[object_type]["api_endpoint"],
-            timeout=timeout)
+    def _object_id_from_response(self, api_request, object_name, object_type, hostname=None, host_id=None, filter_field_name=None):
+        """Internal method used to find the ID of the requested object in the API response returned to `object_id()`.
+        Arguments:
+            api_request {dict} -- The API response returned by the endpoint provided by `_object_id_api_call()`.
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            hostname {str} -- The hostname associated with an oracle_db object. (default: {None})
+            host_id {str} -- The ID of the host associated with a share object. (default: {None})
+            filter_field_name {str} -- The name of the physical host field to match on. (choices: {name, hostname}) (default: {None})
+        Returns:
+            str -- The ID of the provided Rubrik object.
+        """
 
+        if object_type == "organization_admin_role":
+            return api_request["roleId"]
+
+        if api_request['total'] == 0:
+            raise InvalidParameterException("The {} object '{}' was not found on the Rubrik cluster.".format(
+                object_type, object_name))
+
+        return self._object_id_from_items(api_request['data'], object_name, object_type, hostname, host_id, filter_field_name)
+
+    def _object_id_from_items(self, items, object_name, object_type, hostname=None, host_id=None, filter_field_name=None):
+        """Internal method used to find the ID of the requested object in the items returned by a list endpoint. Items are only read until
+        the first match of an object type that identifies a single object, or until a second match reveals a duplicate name.
+        Arguments:
+            items {iterable} -- The items returned by the endpoint provided by `_object_id_api_call()`.
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            hostname {str} -- The hostname associated with an oracle_db object. (default: {None})
+            host_id {str} -- The ID of the host associated with a share object. (default: {None})
+            filter_field_name {str} -- The name of the physical host field to match on. (choices: {name, hostname}) (default: {None})
+        Returns:
+            str -- The ID of the provided Rubrik object.
+        """
+
+        name_value = self._object_id_name_field(object_type, filter_field_name)
         object_ids = []
 
-        if object_type == "organization_admin_role":
-            object_ids.append(api_request["roleId"])
-        else:
+        for item in items:
+            object_id = self._object_id_match(item, object_name, object_type, name_value, hostname, host_id)
+            if object_id is None:
+                continue
 
-            if api_request['total'] == 0:
-                raise InvalidParameterException("The {} object '{}' was not found on the Rubrik cluster.".format(
-                    object_type, object_name))
-            elif api_request['total'] > 0:
-                # Define the "object name" to search for
-                if object_type == 'physical_host':
-                    name_value = filter_field_name
-                elif object_type == "volume_group":
-                    name_value = "hostname"
-                elif object_type == 'share':
-                    name_value = "exportPoint"
-                elif object_type == "replication_location":
-                    name_value = "targetClusterName"
-                else:
-                    name_value = 'name'
-
-                for item in api_request['data']:
-                    if object_type == 'oracle_db':
-                        if 'standaloneHostName' in item.keys():
-                            if hostname == item['standaloneHostName'].split('.')[0]:
-                                object_ids.append(item['id'])
-                                break
-                        elif 'racName' in item.keys():
-                            if hostname == item['racName']:
-                                object_ids.append(item['id'])
-                                break
-                            if any(instance['hostName'] == hostname for instance in item['instances']):
-                                object_ids.append(item['id'])
-                                break
-                    elif object_type == 'share' and item[name_value] == object_name:
-                        if item['hostId'] == host_id:
-                            object_ids.append(item['id'])
-                    elif object_type == "organization_role_id" and item[name_value].lower():
-                        object_ids.append(item['roleId'])
-                    elif object_type == "replication_location" and item[name_value].lower() == object_name.lower():
-                        object_ids.append(item['targetClusterUuid'])
-
-                    elif item[name_value].lower() == object_name.lower():
-                        object_ids.append(item['id'])
+            object_ids.append(object_id)
+            # Oracle databases and shares are matched on their host so the first match is the only one
+            if object_type in ['oracle_db', 'share'] or len(object_ids) > 1:
+                break
 
         if len(object_ids) > 1:
             raise InvalidParameterException(
@@ -582,8 +863,65 @@ class Data_Management(Api):
         else:
             return object_ids[0]
 
-        raise InvalidParameterException(
-            "The {} object '{}' was not found on the Rubrik cluster.".format(object_type, object_name))
+    @staticmethod
+    def _object_id_name_field(object_type, filter_field_name=None):
+        """Internal method used to determine which field of a list endpoint item holds the name `object_id()` matches on.
+        Arguments:
+            object_type {str} -- The object type you wish to look up.
+        Keyword Arguments:
+            filter_field_name {str} -- The name of the physical host field to match on. (choices: {name, hostname}) (default: {None})
+        Returns:
+            str -- The name of the field.
+        """
+
+        if object_type == 'physical_host':
+            return filter_field_name
+        elif object_type == "volume_group":
+            return "hostname"
+        elif object_type == 'share':
+            return "exportPoint"
+        elif object_type == "replication_location":
+            return "targetClusterName"
+
+        return 'name'
+
+    @staticmethod
+    def _object_id_match(item, object_name, object_type, name_value, hostname=None, host_id=None):
+        """Internal method used to determine whether an item returned by a list endpoint is the object requested from `object_id()`.
+        Arguments:
+            item {dict} -- An item returned by the endpoint provided by `_object_id_api_call()`.
+            object_name {str} -- The name of the Rubrik object whose ID you wish to lookup.
+            object_type {str} -- The object type you wish to look up.
+            name_value {str} -- The item field that holds the name of the object.
+        Keyword Arguments:
+            hostname {str} -- The hostname associated with an oracle_db object. (default: {None})
+            host_id {str} -- The ID of the host associated with a share object. (default: {None})
+        Returns:
+            str -- The ID of the item, or `None` when it is not the requested object.
+        """
+
+        if object_type == 'oracle_db':
+            if 'standaloneHostName' in item:
+                if hostname == item['standaloneHostName'].split('.')[0]:
+                    return item['id']
+            elif 'racName' in item:
+                if hostname == item['racName'] or any(instance['hostName'] == hostname for instance in item['instances']):
+                    return item['id']
+            return None
+
+        if object_type == 'share':
+            if item[name_value] == object_name and item['hostId'] == host_id:
+                return item['id']
+            return None
+
+        if item[name_value].lower() != object_name.lower():
+            return None
+
+        if object_type == "organization_role_id":
+            return item['roleId']
+        if object_type == "replication_location":
+            return item['targetClusterUuid']
+        return item['id']
 
     def assign_sla(self, object_name, sla_name, object_type, log_backup_frequency_in_seconds=None, log_retention_hours=None, copy_only=None, windows_host=None, nas_host=None, share=None, log_backup_frequency_in_minutes=None, num_channels=4, hostname=None, timeout=30):  # pytest: ignore
         """Assign a Rubrik object to an SLA Domain.
@@ -783,10 +1121,7 @@ class Data_Management(Api):
                 timeout=timeout)
 
             # After 5.0, "hostname" is a deprecated field in the results that are returned in "current_hosts"
-            if self.minimum_installed_cdm_version(5.0):
-                current_hosts_name = "name"
-            else:
-                current_hosts_name = "hostname"
+            current_hosts_name = self.cluster_capabilities(timeout).physical_host_name_field
 
             for rubrik_host in current_hosts['data']:
                 if rubrik_host[current_hosts_name] == object_name:
@@ -1180,43 +1515,77 @@ class Data_Management(Api):
         if self.function_name == "":
             self.function_name = inspect.currentframe().f_code.co_name
 
-        from datetime import datetime
+        return self._bulk_date_time_conversion([(date, time)], timeout)[0]
+
+    def _bulk_date_time_conversion(self, date_times, timeout=30):
+        """Convert a list of date and time values from the timezone configured on the Rubrik cluster to UTC. The cluster timezone
+        is only looked up once for the entire list.
+        Arguments:
+            date_times {list} -- A list of `(date, time)` tuples where date is formated as `Month-Day-Year` (ex: 1-15-2014) and time as `Hour:Minute AM/PM` (ex: 1:30 AM).
+        Returns:
+            list -- The combined date/time values formated as `Year-Month-DayTHour:Minute` where Hour:Minute is on the 24-hour clock (ex : 2014-1-15T01:30), in the order provided.
+        """
+
+        if self.function_name == "":
+            self.function_name = inspect.currentframe().f_code.co_name
+
         import pytz
 
-        # Validate the Date formating
+        snapshot_datetimes = [self._parse_date_time(date, time) for date, time in date_times]
+
+        self.log("_date_time_conversion: Getting the Rubrik cluster timezone.")
+        timezone = self._cluster_tzinfo(timeout)
+
+        self.log("_date_time_conversion: Converting the time to UTC.\n")
+        utc_date_times = []
+        for snapshot_datetime in snapshot_datetimes:
+            snapshot_datetime = timezone.localize(snapshot_datetime).astimezone(pytz.UTC)
+            utc_date_times.append(snapshot_datetime.strftime('%Y-%m-%dT%H:%M'))
+
+        return utc_date_times
+
+    @staticmethod
+    def _parse_date_time(date, time):
+        """Internal method used to combine a date and time value into a single naive datetime.
+        Arguments:
+            date {str} -- A date value formated as `Month-Day-Year` (ex: 1-15-2014).
+            time {str} -- A time value formated as `Hour:Minute AM/PM` (ex: 1:30 AM).
+        Returns:
+            datetime -- The combined date and time.
+        """
+
+        try:
+            return datetime.strptime('{} {}'.format(date, time), '%m-%d-%Y %I:%M %p')
+        except (TypeError, ValueError):
+            pass
+
+        # Determine which of the two values is invalid
         try:
             datetime.strptime(date, '%m-%d-%Y')
-        except ValueError:
+        except (TypeError, ValueError):
             raise InvalidParameterException(
                 "The date argument '{}' must be formatd as 'Month-Date-Year' (ex: 8-9-2018).".format(date))
-        # Validate the Time formating
-        try:
-            snapshot_time = datetime.strptime(time, '%I:%M %p')
-        except ValueError:
-            raise InvalidParameterException(
-                "The time argument '{}' must be formatd as 'Hour:Minute AM/PM' (ex: 2:57 AM).".format(time))
 
-        self.log("_date_time_conversion: Getting the Rubrik cluster timezone.")
-        cluster_summary = self.get('v1', '/cluster/me', timeout=timeout)
-        cluster_timezone = cluster_summary['timezone']['timezone']
+        raise InvalidParameterException(
+            "The time argument '{}' must be formatd as 'Hour:Minute AM/PM' (ex: 2:57 AM).".format(time))
 
-        self.log(
-            "_date_time_conversion: Converting the provided time to the 24-hour clock.")
-        snapshot_time_24_hour_clock = datetime.strftime(snapshot_time, "%H:%M")
+    def _cluster_tzinfo(self, timeout=30):
+        """Internal method used to return the tzinfo object for the timezone configured on the Rubrik cluster. The object is
+        rebuilt only when the cluster timezone changes.
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster. (default: {30})
+        Returns:
+            pytz.tzinfo -- The timezone of the Rubrik cluster.
+        """
 
-        self.log("_date_time_conversion: Creating a combined date/time variable.")
-        snapshot_datetime = datetime.strptime('{} {}'.format(
-            date, snapshot_time_24_hour_clock), '%m-%d-%Y %H:%M')
+        import pytz
 
-        # Add Timezone to snapshot_datetime Variable
-        timezone = pytz.timezone(cluster_timezone)
-        snapshot_datetime = timezone.localize(snapshot_datetime)
+        cluster_timezone = self.cluster_timezone(timeout)
 
-        self.log("_date_time_conversion: Converting the time to UTC.\n")
-        utc_timezone = pytz.UTC
-        snapshot_datetime = snapshot_datetime.astimezone(utc_timezone)
+        if self._cluster_tzinfo_cache is None or self._cluster_tzinfo_cache.zone != cluster_timezone:
+            self._cluster_tzinfo_cache = pytz.timezone(cluster_timezone)
 
-        return snapshot_datetime.strftime('%Y-%m-%dT%H:%M')
+        return self._cluster_tzinfo_cache
 
     def pause_snapshots(self, object_name, object_type, timeout=180):
         """Pause all snapshot activity for the provided object.
@@ -1377,13 +1746,14 @@ class Data_Management(Api):
 
         return self.post("internal", "/managed_volume/{}/end_snapshot".format(managed_volume_id), config, timeout)
 
-    def get_sla_objects(self, sla, object_type, timeout=15):
+    def get_sla_objects(self, sla, object_type, timeout=15, page_size=100):
         """Retrieve the name and ID of a specific object type.
         Arguments:
             sla {str} -- The name of the SLA Domain you wish to search.
             object_type {str} -- The object type you wish to search the SLA for. (choices: {vmware, hyper-v, mssql_db, ec2_instance, oracle_db, vcd, managed_volume, ahv, nas_share, linux_and_unix_host, windows_host})
         Keyword Arguments:
             timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster. (default: {15})
+            page_size {int} -- The number of objects to request per page. (default: {100})
         Returns:
             dict -- The `name:id` of each object in the provided SLA Domain.
         """
@@ -1391,6 +1761,41 @@ class Data_Management(Api):
         if self.function_name == "":
             self.function_name = inspect.currentframe().f_code.co_name
 
+        self._validate_sla_objects_type(object_type)
+
+        sla_id = self.object_id(sla, "sla", timeout=timeout)
+        vm_name_id = {}
+
+        api_call = self._sla_objects_api_call(sla_id, object_type)
+
+        if "query" in api_call:
+            for vm in self.paginate_connection(
+                    api_call["query"], api_call["connection"], api_call["operation_name"], api_call["variables"], page_size, timeout):
+                vm_name_id[vm["hostname"]] = vm["id"]
+
+        elif self.inventory is not None and self.inventory.indexes(object_type):
+            for vm in self.inventory.by_sla(object_type, sla_id):
+                vm_name_id[vm["name"]] = vm["id"]
+
+        if bool(vm_name_id) is False and "query" not in api_call:
+            # An empty result may be out of date when it comes from the inventory, so ask the Rubrik cluster
+            for vm in self.paginate(api_call["api_version"], api_call["api_endpoint"], page_size=page_size, timeout=timeout):
+                vm_name_id[vm["name"]] = vm["id"]
+
+        if bool(vm_name_id) is False:
+            raise InvalidParameterException(
+                "The SLA '{}' is currently not protecting any {} objects.".format(
+                    sla, object_type))
+
+        return vm_name_id
+
+    @staticmethod
+    def _validate_sla_objects_type(object_type):
+        """Internal method used to validate the object type provided to `get_sla_objects()`.
+        Arguments:
+            object_type {str} -- The object type you wish to search the SLA for.
+        """
+
         valid_object_type = ['vmware', 'hyper-v',
                              'mssql_db', 'ec2_instance', 'oracle_db', 'vcd', 'managed_volume', 'ahv', 'nas_share', 'linux_and_unix_host', 'windows_host']
 
@@ -1398,45 +1803,56 @@ class Data_Management(Api):
             raise InvalidParameterException(
                 "The get_sla_object() object_type argument must be one of the following: {}.".format(valid_object_type))
 
-        sla_id = self.object_id(sla, "sla", timeout=timeout)
-        vm_name_id = {}
+    @staticmethod
+    def _sla_objects_api_call(sla_id, object_type):
+        """Internal method used to determine how `get_sla_objects()` should search the SLA Domain for the provided object type.
+        Arguments:
+            sla_id {str} -- The ID of the SLA Domain you wish to search.
+            object_type {str} -- The object type you wish to search the SLA for.
+        Returns:
+            dict -- The GraphQL `query`, `operation_name`, `variables` and `connection` to page through with `paginate_connection()`, or the REST `api_version` and `api_endpoint` to query.
+        """
 
         if object_type == "nas_share":
             # The REST API does not have an easy way to filter by SLA so we will use the GQL call
-            operation_name = "NasAssignedSLA"
-
             query = """
-             NasAssignedSLA($effectiveSlaDomainId: String) {
-                nasShareConnection(effectiveSlaDomainId: $effectiveSlaDomainId) {
+             NasAssignedSLA($effectiveSlaDomainId: String, $first: Int, $after: String) {
+                nasShareConnection(effectiveSlaDomainId: $effectiveSlaDomainId, first: $first, after: $after) {
                     nodes {
                     id
                     hostname
 
                     }
+                    pageInfo {
+                    endCursor
+                    hasNextPage
+                    }
                 }
                 }
             """
 
-            variables = {
-                "effectiveSlaDomainId": sla_id
+            return {
+                "operation_name": "NasAssignedSLA",
+                "query": query,
+                "variables": {
+                    "effectiveSlaDomainId": sla_id
+                },
+                "connection": "nasShareConnection"
             }
 
-            all_vms_in_sla = self.query(query, operation_name, variables)
-
-            for vm in all_vms_in_sla["nasShareConnection"]["nodes"]:
-                vm_name_id[vm["hostname"]] = vm["id"]
-
         elif object_type == "linux_and_unix_host" or object_type == "windows_host":
             # The REST API does not have an easy way to filter by SLA so we will use the GQL call
-            operation_name = "PhysicalHostSLA"
-
             query = """
-             PhysicalHostSLA($effectiveSlaDomainId: String, $operatingSystemType: String, $status: String) {
-                hostConnection(effectiveSlaDomainId: $effectiveSlaDomainId, operatingSystemType: $operatingSystemType,  status: $status) {
+             PhysicalHostSLA($effectiveSlaDomainId: String, $operatingSystemType: String, $status: String, $first: Int, $after: String) {
+                hostConnection(effectiveSlaDomainId: $effectiveSlaDomainId, operatingSystemType: $operatingSystemType,  status: $status, first: $first, after: $after) {
                     nodes {
                     id
                     hostname
                     }
+                    pageInfo {
+                    endCursor
+                    hasNextPage
+                    }
                 }
                 }
             """
@@ -1446,72 +1862,59 @@ class Data_Management(Api):
             else:
                 operatingSystemType = "Windows"
 
-            variables = {
-                "status": "Connected",
-                "effectiveSlaDomainId": sla_id,
-                "operatingSystemType": operatingSystemType,
-
-            }
+            return {
+                "operation_name": "PhysicalHostSLA",
+                "query": query,
+                "variables": {
+                    "status": "Connected",
+                    "effectiveSlaDomainId": sla_id,
+                    "operatingSystemType": operatingSystemType,
 
-            all_vms_in_sla = self.query(query, operation_name, variables)
-
-            for vm in all_vms_in_sla["hostConnection"]["nodes"]:
-                vm_name_id[vm["hostname"]] = vm["id"]
-
-        else:
-
-            api_call = {
-                "vmware": {
-                    "api_version": "v1",
-                    "api_endpoint": "/vmware/vm"
-                },
-                "hyper-v": {
-                    "api_version": "internal",
-                    "api_endpoint": "/hyperv/vm"
-                },
-                "mssql_db": {
-                    "api_version": "v1",
-                    "api_endpoint": "/mssql/db"
-                },
-                "ec2_instance": {
-                    "api_version": "internal",
-                    "api_endpoint": "/aws/ec2_instance"
-                },
-                "oracle_db": {
-                    "api_version": "internal",
-                    "api_endpoint": "/oracle/db"
-                },
-                "vcd": {
-                    "api_version": "internal",
-                    "api_endpoint": "/vcd/vapp"
-                },
-                "managed_volume": {
-                    "api_version": "internal",
-                    "api_endpoint": "/managed_volume"
-                },
-                "ahv": {
-                    "api_version": "internal",
-                    "api_endpoint": "/nutanix/vm"
                 },
-
-
+                "connection": "hostConnection"
             }
 
-            all_vms_in_sla = self.get(
-                api_call[object_type]["api_version"],
-                api_call[object_type]["api_endpoint"] +
-                "?effective_sla_domain_id={}&is_relic=false".format(sla_id),
-                timeout=timeout)
+        api_call = {
+            "vmware": {
+                "api_version": "v1",
+                "api_endpoint": "/vmware/vm"
+            },
+            "hyper-v": {
+                "api_version": "internal",
+                "api_endpoint": "/hyperv/vm"
+            },
+            "mssql_db": {
+                "api_version": "v1",
+                "api_endpoint": "/mssql/db"
+            },
+            "ec2_instance": {
+                "api_version": "internal",
+                "api_endpoint": "/aws/ec2_instance"
+            },
+            "oracle_db": {
+                "api_version": "internal",
+                "api_endpoint": "/oracle/db"
+            },
+            "vcd": {
+                "api_version": "internal",
+                "api_endpoint": "/vcd/vapp"
+            },
+            "managed_volume": {
+                "api_version": "internal",
+                "api_endpoint": "/managed_volume"
+            },
+            "ahv": {
+                "api_version": "internal",
+                "api_endpoint": "/nutanix/vm"
+            },
 
-            for vm in all_vms_in_sla["data"]:
-                vm_name_id[vm["name"]] = vm["id"]
 
-        if bool(vm_name_id) is False:
-            raise InvalidParameterException(
-                "The SLA '{}' is currently not protecting any {} objects.".format(
-                    sla, object_type))
+        }
 
-        return vm_name_id
+        return {
+            "api_version": api_call[object_type]["api_version"],
+            "api_endpoint": api_call[object_type]["api_endpoint"] + "?effective_sla_domain_id={}&is_relic=false".format(sla_id)
+        }
 
     def create_sla(self, name, hourly_frequency=None, hourly_retention=None, daily_frequency=None, daily_retention=None, monthly_frequency=None, monthly_retention=None, yearly_frequency=None, yearly_retention=None, archive_name=None, retention_on_brik_in_days=None, instant_archive=False, starttime_hour=None, starttime_min=None, duration_hours=None, replication_target=None, replication_retention_in_days=None, timeout=15):  # pylint: ignore
         """Create a new SLA Domain.
@@ -1545,7 +1948,7 @@ class Data_Management(Api):
 
         self.function_name = inspect.currentframe().f_code.co_name
 
-        v2_sla = self.minimum_installed_cdm_version("5.0", timeout=timeout)
+        v2_sla = self.cluster_capabilities(timeout).sla_v2
 
         all_params = [
             hourly_frequency,
@@ -2293,10 +2696,13 @@ class Data_Management(Api):
                 raise InvalidParameterException(
                     'The limit and offset paremeter must be an integer')
 
+        self.log("get_vsphere_vm: Get summary of all the VMs.")
+        if limit is None and offset is None:
+            return self._get_all_pages('v1', '/vmware/vm', parameters, timeout=timeout)
+
         # String joins by iterating through the key-value pairs in the parameters dictionary and concatenating it into a query
         query = '&'.join(['%s=%s' % kv for kv in parameters.items()])
 
-        self.log("get_vsphere_vm: Get summary of all the VMs.")
         return self.get('v1', '/vmware/vm?{}'.format(query), timeout)
 
     def get_vsphere_vm_snapshot(self, vm_name, timeout=15):  # pylint: ignore
@@ -2451,12 +2857,15 @@ class Data_Management(Api):
                 raise InvalidParameterException(
                     'The limit and offset paremeter must be an integer')
 
-        # String joins by iterating through the key-value pairs in the parameters dictionary and concatenating it into a query
-        query = '&'.join(['%s=%s' % kv for kv in parameters.items()])
-
         self.log(
             "get_sql_db: Get summary of all the databases returned by the query.")
-        databases = self.get('v1', '/mssql/db?{}'.format(query), timeout)
+        if limit is None and offset is None:
+            databases = self._get_all_pages('v1', '/mssql/db', parameters, timeout=timeout)
+        else:
+            # String joins by iterating through the key-value pairs in the parameters dictionary and concatenating it into a query
+            query = '&'.join(['%s=%s' % kv for kv in parameters.items()])
+
+            databases = self.get('v1', '/mssql/db?{}'.format(query), timeout)
 
         result = []
 
@@ -2668,7 +3077,7 @@ class Data_Management(Api):
         self.log(
             'get_all_hosts: Getting information for each host on the Rubrik cluster.')
 
-        return self.get('v1', '/host', timeout=timeout)
+        return self._get_all_pages('v1', '/host', timeout=timeout)
 
     def register_vm(self, name, timeout=15):
         """Register the Rubrik Backup Service on a vSphere VM.
@@ -0,0 +1,257 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the functions used to merge many GraphQL operations into a single request.
+"""
+
+import re
+
+from .exceptions import APICallException, InvalidParameterException
+
+BATCH_OPERATION_NAME = "QueryBatch"
+
+# The byte order mark is an ignored token. It is added as a unicode character because `\ufeff` is not an escape sequence of
+# the Python 2.X `re` module
+_TOKEN = re.compile(r'''
+    (?P<ignored>[\s,''' + u"\ufeff" + r''']+|\#[^\n\r]*)
+  | (?P<block_string>"""(?:\\"""|[^"]|"(?!""))*""")
+  | (?P<string>"(?:\\.|[^"\\\n\r])*")
+  | (?P<spread>\.\.\.)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+  | (?P<number>-?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?)
+  | (?P<punctuator>[!$&()\:=@\[\]{|}])
+''', re.VERBOSE)
+
+
+def _tokens(query):
+    """Internal function used to split a GraphQL document into its significant tokens.
+
+    Arguments:
+        query {str} -- The GraphQL document.
+
+    Returns:
+        list -- A `(kind, value, start, end)` tuple for each token.
+    """
+
+    tokens = []
+    position = 0
+    while position < len(query):
+        match = _TOKEN.match(query, position)
+        if match is None:
+            raise InvalidParameterException("Unexpected character '{}' in the GraphQL query.".format(query[position]))
+        if match.lastgroup != "ignored":
+            tokens.append((match.lastgroup, match.group(), match.start(), match.end()))
+        position = match.end()
+    return tokens
+
+
+def _rewrite_operation(query, prefix):
+    """Internal function used to prefix the variables and top-level fields of a single GraphQL operation, so it can share a request
+    with other operations. Top-level fields are aliased and keep their original name, or alias, after the prefix.
+
+    Arguments:
+        query {str} -- The GraphQL operation, with or without the `query` keyword and operation name (ex. `Name($id: String) { field(id: $id) { id } }`).
+        prefix {str} -- The prefix added to every variable and top-level field.
+
+    Returns:
+        tuple -- The rewritten variable definitions, without parentheses, and the rewritten top-level selections, without braces.
+    """
+
+    tokens = _tokens(query)
+    index = 0
+
+    if index < len(tokens) and tokens[index][1] == "query":
+        index += 1
+    if index < len(tokens) and tokens[index][0] == "name":
+        # The operation name is replaced by the name of the batch
+        index += 1
+
+    definitions = ""
+    if index < len(tokens) and tokens[index][1] == "(":
+        end = _matching(tokens, index, "(", ")")
+        definitions = _rewrite_range(query, tokens, index + 1, end, prefix, top_level=False)
+        index = end + 1
+
+    if index >= len(tokens) or tokens[index][1] != "{":
+        raise InvalidParameterException("The GraphQL query must contain a selection set.")
+
+    end = _matching(tokens, index, "{", "}")
+    if end != len(tokens) - 1:
+        raise InvalidParameterException("A batched GraphQL query must contain a single operation without fragment definitions.")
+
+    selections = _rewrite_range(query, tokens, index + 1, end, prefix, top_level=True)
+
+    return definitions, selections
+
+
+def _matching(tokens, index, opening, closing):
+    """Internal function used to find the token that closes the bracket opened at `index`."""
+
+    depth = 0
+    for position in range(index, len(tokens)):
+        if tokens[position][1] == opening:
+            depth += 1
+        elif tokens[position][1] == closing:
+            depth -= 1
+            if depth == 0:
+                return position
+
+    raise InvalidParameterException("The GraphQL query contains an unclosed '{}'.".format(opening))
+
+
+def _rewrite_range(query, tokens, first, last, prefix, top_level):
+    """Internal function used to rewrite the text between two tokens, renaming variables and, when `top_level` is `True`, aliasing
+    the fields of the outermost selection set.
+
+    Arguments:
+        query {str} -- The GraphQL operation.
+        tokens {list} -- The tokens of the operation.
+        first {int} -- The index of the first token to rewrite.
+        last {int} -- The index of the token that follows the range.
+        prefix {str} -- The prefix added to every variable and top-level field.
+        top_level {bool} -- Flag that determines whether the range is the outermost selection set.
+
+    Returns:
+        str -- The rewritten text.
+    """
+
+    if first >= last:
+        return ""
+
+    parts = []
+    position = tokens[first][2]
+    braces = 0
+    parentheses = 0
+
+    for index in range(first, last):
+        kind, value, start, end = tokens[index]
+        previous = tokens[index - 1][1] if index > first else None
+
+        if kind == "name" and previous == "$":
+            parts.append(query[position:start] + prefix + value)
+            position = end
+        elif top_level and braces == 0 and parentheses == 0 and kind == "spread":
+            raise InvalidParameterException("A batched GraphQL query can not select fragments at the top level.")
+        elif top_level and braces == 0 and parentheses == 0 and kind == "name" and previous not in [":", "@"]:
+            following = tokens[index + 1][1] if index + 1 < last else None
+            if following == ":":
+                # Prefix the existing alias
+                parts.append(query[position:start] + prefix + value)
+            else:
+                parts.append(query[position:start] + "{}{}: {}".format(prefix, value, value))
+            position = end
+        elif value == "{":
+            braces += 1
+        elif value == "}":
+            braces -= 1
+        elif value == "(":
+            parentheses += 1
+        elif value == ")":
+            parentheses -= 1
+
+    parts.append(query[position:tokens[last - 1][3]])
+    return "".join(parts)
+
+
+def batch_prefix(index):
+    """Return the prefix of the variables and top-level fields of the operation at `index` in a batch.
+
+    Arguments:
+        index {int} -- The position of the operation in the batch.
+
+    Returns:
+        str -- The prefix.
+    """
+
+    return "q{}_".format(index)
+
+
+def merge_operations(operations):
+    """Merge GraphQL operations into a single operation. The variables and top-level fields of each operation are prefixed with
+    `batch_prefix()` so operations that use the same variables or query the same connection do not collide.
+
+    Arguments:
+        operations {list} -- The `query`, `variables` and optional `operation_name` of each operation, as dicts.
+
+    Returns:
+        tuple -- The merged query, without the `query` keyword, and the merged variables.
+    """
+
+    definitions = []
+    selections = []
+    variables = {}
+
+    for index, operation in enumerate(operations):
+        prefix = batch_prefix(index)
+        operation_definitions, operation_selections = _rewrite_operation(operation["query"], prefix)
+        if operation_definitions.strip():
+            definitions.append(operation_definitions.strip())
+        selections.append(operation_selections.strip())
+        for name, value in (operation.get("variables") or {}).items():
+            variables[prefix + name] = value
+
+    query = BATCH_OPERATION_NAME
+    if definitions:
+        query += "({})".format(", ".join(definitions))
+    query += " {{\n{}\n}}".format("\n".join(selections))
+
+    return query, variables
+
+
+def split_response(response, count):
+    """Route the response to a merged operation back to each of the original operations.
+
+    Arguments:
+        response {dict} -- The full response body returned by the Rubrik cluster.
+        count {int} -- The number of operations in the batch.
+
+    Returns:
+        list -- The `data` of each operation, with its original top-level field names, or an `APICallException` for each operation that failed.
+    """
+
+    data = response.get("data") or {}
+    messages = [[] for _ in range(count)]
+
+    errors = list(response.get("errors") or [])
+    if response.get("error"):
+        errors.append({"message": response["error"]})
+
+    for error in errors:
+        message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+        path = error.get("path") if isinstance(error, dict) else None
+        owner = None
+        if path:
+            for index in range(count):
+                if str(path[0]).startswith(batch_prefix(index)):
+                    owner = index
+                    break
+        for index in range(count) if owner is None else [owner]:
+            messages[index].append(message)
+
+    results = []
+    for index in range(count):
+        if messages[index]:
+            results.append(APICallException("; ".join(messages[index])))
+            continue
+        prefix = batch_prefix(index)
+        results.append(dict((key[len(prefix):], value) for key, value in data.items() if key.startswith(prefix)))
+
+    return results
@@ -0,0 +1,530 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the Rubrik SDK Inventory class.
+"""
+
+import threading
+
+try:
+    _string_types = basestring  # Python 2.X
+except NameError:
+    _string_types = str  # Python 3+
+
+from .cache import _monotonic
+from .exceptions import InvalidParameterException, InvalidTypeException, RubrikException
+
+# The list endpoint of each object type an Inventory can index, the fields that hold the name of an object and the field
+# that holds the ID of the host the object belongs to
+INVENTORY_OBJECT_TYPES = {
+    "vmware": {
+        "api_version": "v1",
+        "api_endpoint": "/vmware/vm?primary_cluster_id=local&is_relic=false",
+        "name_fields": ("name",),
+        "host_field": ("hostId",),
+    },
+    "physical_host": {
+        "api_version": "v1",
+        "api_endpoint": "/host?primary_cluster_id=local",
+        "name_fields": ("name", "hostname"),
+        "host_field": None,
+    },
+    "sla": {
+        "api_version": "v1",
+        "api_endpoint": "/sla_domain?primary_cluster_id=local",
+        "name_fields": ("name",),
+        "host_field": None,
+    },
+    "fileset": {
+        "api_version": "v1",
+        "api_endpoint": "/fileset?primary_cluster_id=local&is_relic=false",
+        "name_fields": ("name",),
+        "host_field": ("hostId",),
+    },
+    "mssql_db": {
+        "api_version": "v1",
+        "api_endpoint": "/mssql/db?primary_cluster_id=local&is_relic=false",
+        "name_fields": ("name",),
+        "host_field": ("rootProperties", "rootId"),
+    },
+    "share": {
+        "api_version": "internal",
+        "api_endpoint": "/host/share",
+        "name_fields": ("exportPoint",),
+        "host_field": ("hostId",),
+    },
+    "managed_volume": {
+        "api_version": "internal",
+        "api_endpoint": "/managed_volume?is_relic=false&primary_cluster_id=local",
+        "name_fields": ("name",),
+        "host_field": None,
+    },
+}
+
+
+def _field(item, path):
+    """Internal function used to read a possibly nested field of an object.
+
+    Arguments:
+        item {dict} -- The object.
+        path {tuple} -- The keys that lead to the field.
+
+    Returns:
+        object -- The value of the field, or `None` when it is missing.
+    """
+
+    for key in path:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(key)
+    return item
+
+
+class _InventoryIndex(object):
+    """The objects of a single type held by an `Inventory`, indexed by ID, lower case name, effective SLA Domain ID and host ID."""
+
+    def __init__(self, name_fields, host_field):
+        self.name_fields = name_fields
+        self.host_field = host_field
+        self.by_id = {}
+        self.by_name = {}
+        self.by_sla = {}
+        self.by_host = {}
+        self.refreshed = None
+
+    def add(self, item):
+        """Add an object to the index, replacing the object with the same ID."""
+
+        object_id = item.get("id")
+        if object_id is None:
+            return
+
+        self.remove(object_id)
+        self.by_id[object_id] = item
+        for key, index in self._keys(item):
+            index.setdefault(key, []).append(object_id)
+
+    def remove(self, object_id):
+        """Remove an object from the index.
+
+        Returns:
+            dict -- The removed object, or `None` when the ID is not in the index.
+        """
+
+        item = self.by_id.pop(object_id, None)
+        if item is None:
+            return None
+
+        for key, index in self._keys(item):
+            ids = index.get(key)
+            if ids is not None:
+                ids.remove(object_id)
+                if not ids:
+                    del index[key]
+        return item
+
+    def lookup(self, index, key):
+        """Return the objects stored under `key` in one of the secondary indexes."""
+
+        return [self.by_id[object_id] for object_id in index.get(key, [])]
+
+    def _keys(self, item):
+        """Internal method used to list the secondary index entries of an object."""
+
+        keys = []
+        names = set()
+        for name_field in self.name_fields:
+            name = item.get(name_field)
+            if isinstance(name, _string_types) and name.lower() not in names:
+                names.add(name.lower())
+                keys.append((name.lower(), self.by_name))
+
+        sla_id = item.get("effectiveSlaDomainId")
+        if sla_id is not None:
+            keys.append((sla_id, self.by_sla))
+
+        if self.host_field is not None:
+            host_id = _field(item, self.host_field)
+            if host_id is not None:
+                keys.append((host_id, self.by_host))
+
+        return keys
+
+
+class Inventory(object):
+    """An in-process snapshot of the objects on a Rubrik cluster, indexed by ID, name, SLA Domain and host so SDK functions can answer
+    lookups without listing the objects again. Each object type is listed the first time it is used and is refreshed on its own
+    once it is older than `refresh_interval` seconds, either when it is next used or from a background thread started by `start()`.
+    A refresh streams the objects into a new index that replaces the previous one once it is complete, so lookups are never served
+    from a partial listing. SDK functions that create or delete objects update the inventory as they go.
+
+    Arguments:
+        rubrik {Connect} -- The connection used to list the objects.
+
+    Keyword Arguments:
+        object_types {list} -- The object types to index. By default every supported type is indexed. (choices: {vmware, physical_host, sla, fileset, mssql_db, share, managed_volume}) (default: {None})
+        refresh_interval {float} -- The number of seconds after which an object type is listed again. (default: {300})
+        page_size {int} -- The number of objects to request per API call. (default: {1000})
+        timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+    """
+
+    def __init__(self, rubrik, object_types=None, refresh_interval=300, page_size=1000, timeout=15):
+
+        if object_types is None:
+            object_types = sorted(INVENTORY_OBJECT_TYPES)
+        if not isinstance(object_types, list):
+            raise InvalidTypeException("The Inventory object_types argument must be a list.")
+        for object_type in object_types:
+            if object_type not in INVENTORY_OBJECT_TYPES:
+                raise InvalidParameterException("The Inventory object_types must only contain the following values: {}".format(
+                    sorted(INVENTORY_OBJECT_TYPES)))
+
+        if isinstance(refresh_interval, bool) or not isinstance(refresh_interval, (int, float)):
+            raise InvalidTypeException("The Inventory refresh_interval argument must be a number.")
+        if refresh_interval <= 0:
+            raise InvalidParameterException("The Inventory refresh_interval argument must be greater than 0.")
+
+        if isinstance(page_size, bool) or not isinstance(page_size, int):
+            raise InvalidTypeException("The Inventory page_size argument must be an integer.")
+        if page_size < 1:
+            raise InvalidParameterException("The Inventory page_size argument must be 1 or greater.")
+
+        self.rubrik = rubrik
+        self.object_types = list(object_types)
+        self.refresh_interval = refresh_interval
+        self.page_size = page_size
+        self.timeout = timeout
+
+        self._indexes = {}
+        self._lock = threading.RLock()
+        # Serializes the refreshes of each object type so concurrent lookups only list the objects once
+        self._refresh_locks = dict((object_type, threading.Lock()) for object_type in self.object_types)
+        self._stats = dict((object_type, {"refreshes": 0, "added": 0, "removed": 0, "updated": 0}) for object_type in self.object_types)
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+        # Set by invalidate() so the background thread refreshes again instead of waiting for the next interval
+        self._invalidated = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def indexes(self, object_type):
+        """Return `True` when the inventory indexes `object_type`.
+
+        Arguments:
+            object_type {str} -- The object type.
+
+        Returns:
+            bool -- `True` when SDK functions can use the inventory for this object type.
+        """
+
+        return object_type in self._refresh_locks
+
+    def refresh(self, object_type=None):
+        """List the objects of one or every indexed type now and replace their index.
+
+        Keyword Arguments:
+            object_type {str} -- The object type to refresh. By default every indexed type is refreshed. (default: {None})
+
+        Returns:
+            dict -- The number of objects `added`, `removed` and `updated` since the previous refresh of each object type.
+        """
+
+        object_types = self.object_types if object_type is None else [object_type]
+        return dict((name, self._refresh(name)) for name in object_types)
+
+    def invalidate(self, object_type=None):
+        """Mark one or every indexed type as out of date, so its objects are listed again the next time it is used.
+
+        Keyword Arguments:
+            object_type {str} -- The object type to invalidate. By default every indexed type is invalidated. (default: {None})
+        """
+
+        with self._lock:
+            for name in (self.object_types if object_type is None else [object_type]):
+                index = self._indexes.get(name)
+                if index is not None:
+                    index.refreshed = None
+
+        with self._condition:
+            self._invalidated = True
+            self._condition.notify()
+
+    def get(self, object_type, object_id):
+        """Return the object with the provided ID.
+
+        Arguments:
+            object_type {str} -- The object type.
+            object_id {str} -- The ID of the object.
+
+        Returns:
+            dict -- The object, as returned by the list endpoint of its type, or `None` when it is not in the inventory.
+        """
+
+        index = self._index(object_type)
+        with self._lock:
+            return index.by_id.get(object_id)
+
+    def find(self, object_type, name):
+        """Return every object whose name matches `name`, ignoring case.
+
+        Arguments:
+            object_type {str} -- The object type.
+            name {str} -- The name of the objects.
+
+        Returns:
+            list -- The matching objects.
+        """
+
+        index = self._index(object_type)
+        with self._lock:
+            return index.lookup(index.by_name, name.lower())
+
+    def by_sla(self, object_type, sla_id):
+        """Return every object whose effective SLA Domain is `sla_id`.
+
+        Arguments:
+            object_type {str} -- The object type.
+            sla_id {str} -- The ID of the SLA Domain.
+
+        Returns:
+            list -- The matching objects.
+        """
+
+        index = self._index(object_type)
+        with self._lock:
+            return index.lookup(index.by_sla, sla_id)
+
+    def by_host(self, object_type, host_id):
+        """Return every object that belongs to the host `host_id`.
+
+        Arguments:
+            object_type {str} -- The object type. (choices: {vmware, fileset, mssql_db, share})
+            host_id {str} -- The ID of the host.
+
+        Returns:
+            list -- The matching objects.
+        """
+
+        index = self._index(object_type)
+        with self._lock:
+            return index.lookup(index.by_host, host_id)
+
+    def items(self, object_type):
+        """Return every object of a type.
+
+        Arguments:
+            object_type {str} -- The object type.
+
+        Returns:
+            list -- The objects.
+        """
+
+        index = self._index(object_type)
+        with self._lock:
+            return list(index.by_id.values())
+
+    def add(self, object_type, item):
+        """Add or replace an object without listing its type again. Used by SDK functions that create objects.
+
+        Arguments:
+            object_type {str} -- The object type.
+            item {dict} -- The object, which must include its `id`.
+        """
+
+        with self._lock:
+            index = self._indexes.get(object_type)
+            if index is not None:
+                index.add(item)
+
+    def remove(self, object_type, object_id):
+        """Remove an object without listing its type again. Used by SDK functions that delete objects.
+
+        Arguments:
+            object_type {str} -- The object type.
+            object_id {str} -- The ID of the object.
+        """
+
+        with self._lock:
+            index = self._indexes.get(object_type)
+            if index is not None:
+                index.remove(object_id)
+
+    def start(self):
+        """Refresh every indexed type from a background thread as soon as it is older than `refresh_interval` seconds, so lookups do
+        not wait for a refresh."""
+
+        with self._condition:
+            if self._closed:
+                raise RubrikException("The Inventory has been closed.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rubrik_cdm-Inventory")
+                self._thread.daemon = True
+                self._thread.start()
+
+    def close(self):
+        """Stop the background thread started by `start()`."""
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def stats(self):
+        """Return the size and freshness of each indexed type.
+
+        Returns:
+            dict -- The number of objects, the age in seconds of the last refresh, the number of refreshes and the number of objects added, removed and updated by refreshes of each object type.
+        """
+
+        now = _monotonic()
+        with self._lock:
+            stats = {}
+            for object_type in self.object_types:
+                index = self._indexes.get(object_type)
+                stats[object_type] = dict(self._stats[object_type])
+                stats[object_type]["objects"] = len(index.by_id) if index is not None else 0
+                stats[object_type]["age"] = now - index.refreshed if index is not None and index.refreshed is not None else None
+            return stats
+
+    def _index(self, object_type):
+        """Internal method used to return the index of an object type, refreshing it first when it is out of date. While the background
+        thread is running, an index that has already been loaded is returned as is.
+
+        Arguments:
+            object_type {str} -- The object type.
+
+        Returns:
+            _InventoryIndex -- The index.
+        """
+
+        if not self.indexes(object_type):
+            raise InvalidParameterException("The Inventory does not index the {} object type.".format(object_type))
+
+        with self._lock:
+            index = self._indexes.get(object_type)
+            if index is not None and (self._thread is not None or not self._due(index)):
+                return index
+
+        self._refresh(object_type, only_if_due=True)
+        with self._lock:
+            return self._indexes[object_type]
+
+    def _due(self, index):
+        """Internal method used to determine whether an index is older than `refresh_interval` seconds."""
+
+        return index.refreshed is None or _monotonic() - index.refreshed >= self.refresh_interval
+
+    def _refresh(self, object_type, only_if_due=False):
+        """Internal method used to list the objects of a type into a new index and replace the previous index.
+
+        Arguments:
+            object_type {str} -- The object type.
+
+        Keyword Arguments:
+            only_if_due {bool} -- Flag that skips the refresh when another caller refreshed the index while this caller was waiting. (default: {False})
+
+        Returns:
+            dict -- The number of objects `added`, `removed` and `updated` by the refresh.
+        """
+
+        if not self.indexes(object_type):
+            raise InvalidParameterException("The Inventory does not index the {} object type.".format(object_type))
+
+        definition = INVENTORY_OBJECT_TYPES[object_type]
+
+        with self._refresh_locks[object_type]:
+            with self._lock:
+                previous = self._indexes.get(object_type)
+                if only_if_due and previous is not None and not self._due(previous):
+                    return {"added": 0, "removed": 0, "updated": 0}
+
+            self.rubrik.log("Inventory: Refreshing the %s objects.", object_type)
+
+            index = _InventoryIndex(definition["name_fields"], definition["host_field"])
+            for item in self.rubrik.paginate(definition["api_version"], definition["api_endpoint"], page_size=self.page_size,
+                                             timeout=self.timeout, stream=True):
+                index.add(item)
+            index.refreshed = _monotonic()
+
+            with self._lock:
+                # Objects added or removed by SDK functions during the listing are reflected by the listing itself
+                previous = self._indexes.get(object_type)
+                changes = self._changes(previous, index)
+                self._indexes[object_type] = index
+                stats = self._stats[object_type]
+                stats["refreshes"] += 1
+                for key, value in changes.items():
+                    stats[key] += value
+
+            return changes
+
+    @staticmethod
+    def _changes(previous, index):
+        """Internal method used to count the objects that differ between two indexes of the same object type."""
+
+        if previous is None:
+            return {"added": len(index.by_id), "removed": 0, "updated": 0}
+
+        added = sum(1 for object_id in index.by_id if object_id not in previous.by_id)
+        removed = sum(1 for object_id in previous.by_id if object_id not in index.by_id)
+        updated = sum(1 for object_id, item in index.by_id.items()
+                      if object_id in previous.by_id and previous.by_id[object_id] != item)
+
+        return {"added": added, "removed": removed, "updated": updated}
+
+    def _run(self):
+        """Internal method that runs on the background thread and refreshes each object type once it is due."""
+
+        self.rubrik.function_name = "inventory"
+
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+
+            now = _monotonic()
+            next_refresh = now + self.refresh_interval
+
+            for object_type in self.object_types:
+                with self._lock:
+                    index = self._indexes.get(object_type)
+                    due = index is None or self._due(index)
+                    if not due:
+                        next_refresh = min(next_refresh, index.refreshed + self.refresh_interval)
+
+                if due:
+                    try:
+                        self._refresh(object_type)
+                    except Exception as error:  # pylint: disable=broad-except
+                        # Keep serving the previous index and try again at the next interval
+                        self.rubrik.log("Inventory: Unable to refresh the %s objects: %s", object_type, error)
+
+            with self._condition:
+                if not self._closed and not self._invalidated:
+                    self._condition.wait(max(0.0, next_refresh - _monotonic()))
+                self._invalidated = False
@@ -0,0 +1,357 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+"""
+This module contains the Rubrik SDK JobWatcher class.
+"""
+
+import heapq
+import itertools
+import threading
+from concurrent.futures import Future
+
+from .api import JOB_IN_PROGRESS_STATUS, JOB_CANCELING_STATUS, JOB_FAILING_STATUS
+from .cache import _monotonic
+from .exceptions import InvalidParameterException, InvalidTypeException, RubrikException
+
+
+class _Job(object):
+    """The polling state of a single job watched by a `JobWatcher`."""
+
+    def __init__(self, url, future, started, deadline):
+        self.url = url
+        self.future = future
+        self.started = started
+        self.deadline = deadline
+        self.interval = None
+        self.progress = None
+        self.progress_time = None
+        self.polls = 0
+        self.running = False
+        self.completed = False
+
+
+class JobWatcher(object):
+    """Monitor the status of many Rubrik jobs from a single background thread. Each job is polled at an interval that adapts to the
+    `progress` it reports, so short jobs are checked often while long running jobs are checked less frequently.
+
+    Arguments:
+        rubrik {Connect} -- The connection used to poll the job status URLs.
+
+    Keyword Arguments:
+        min_interval {float} -- The minimum number of seconds between two polls of the same job. (default: {1})
+        max_interval {float} -- The maximum number of seconds between two polls of the same job. (default: {30})
+        deadline {float} -- The number of seconds, from the creation of the watcher, by which every job must complete. (default: {None})
+        timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+    """
+
+    def __init__(self, rubrik, min_interval=1, max_interval=30, deadline=None, timeout=15):
+
+        for name, value in (("min_interval", min_interval), ("max_interval", max_interval), ("deadline", deadline)):
+            if value is None and name == "deadline":
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise InvalidTypeException("The JobWatcher {} argument must be a number.".format(name))
+            if value <= 0:
+                raise InvalidParameterException("The JobWatcher {} argument must be greater than 0.".format(name))
+
+        if min_interval > max_interval:
+            raise InvalidParameterException("The JobWatcher min_interval argument must not be greater than max_interval.")
+
+        self.rubrik = rubrik
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.created = _monotonic()
+        self.deadline = self.created + deadline if deadline is not None else None
+
+        self._queue = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._closed = False
+        self._stats = {"watched": 0, "succeeded": 0, "canceled": 0, "failed": 0, "timed_out": 0, "polls": 0, "duration": 0.0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def watch(self, url, deadline=None, callback=None):
+        """Start monitoring the job status URL returned by a previous API call.
+
+        Arguments:
+            url {str} -- The job status URL provided by a previous API call.
+
+        Keyword Arguments:
+            deadline {float} -- The number of seconds by which this job must complete. (default: {None})
+            callback {function} -- A function called with the `Future` of the job once the job completes. (default: {None})
+
+        Returns:
+            concurrent.futures.Future -- Resolves to the final job status response body. When the job fails or misses its deadline, the `RubrikException` is raised by `result()`. The `Future` can only be cancelled before the job is first polled.
+        """
+
+        if deadline is not None:
+            if isinstance(deadline, bool) or not isinstance(deadline, (int, float)):
+                raise InvalidTypeException("The watch() deadline argument must be a number.")
+            if deadline <= 0:
+                raise InvalidParameterException("The watch() deadline argument must be greater than 0.")
+
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        now = _monotonic()
+        job_deadline = now + deadline if deadline is not None else None
+        if self.deadline is not None:
+            job_deadline = self.deadline if job_deadline is None else min(job_deadline, self.deadline)
+
+        with self._condition:
+            if self._closed:
+                raise RubrikException("The JobWatcher has been closed.")
+
+            self._push(_Job(url, future, now, job_deadline), now)
+            self._stats["watched"] += 1
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="rubrik_cdm-JobWatcher")
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._condition.notify()
+
+        return future
+
+    def watch_all(self, urls, deadline=None):
+        """Start monitoring each job status URL in `urls`.
+
+        Arguments:
+            urls {list} -- The job status URLs provided by previous API calls.
+
+        Keyword Arguments:
+            deadline {float} -- The number of seconds by which each job must complete. (default: {None})
+
+        Returns:
+            list -- The `Future` of each job, in the same order as `urls`.
+        """
+
+        return [self.watch(url, deadline) for url in urls]
+
+    def stats(self):
+        """Return the statistics of the jobs monitored by the watcher.
+
+        Returns:
+            dict -- The number of jobs `watched`, `pending`, `succeeded`, `canceled`, `failed` and `timed_out`, the number of `polls`, the average job `average_duration` in seconds and the `throughput` in completed jobs per minute.
+        """
+
+        with self._condition:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._queue)
+
+        completed = stats["succeeded"] + stats["canceled"] + stats["failed"] + stats["timed_out"]
+        elapsed = _monotonic() - self.created
+        stats["average_duration"] = stats.pop("duration") / completed if completed else 0.0
+        stats["throughput"] = completed * 60.0 / elapsed if elapsed > 0 else 0.0
+
+        return stats
+
+    def close(self):
+        """Stop the background thread. Jobs that have not been polled yet are cancelled and the `Future` of the other incomplete jobs
+        raises a `RubrikException`."""
+
+        with self._condition:
+            self._closed = True
+            pending = [job for _, _, job in self._queue]
+            self._queue = []
+            self._condition.notify()
+
+        for job in pending:
+            self._cancel(job)
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _push(self, job, poll_time):
+        heapq.heappush(self._queue, (poll_time, next(self._sequence), job))
+
+    def _run(self):
+        """Internal method that runs on the background thread and polls each job once its next poll time is reached."""
+
+        self.rubrik.function_name = "job_status"
+
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._queue:
+                        delay = self._queue[0][0] - _monotonic()
+                        if delay <= 0:
+                            break
+                        self._condition.wait(delay)
+                    else:
+                        self._condition.wait()
+
+                if self._closed:
+                    return
+
+                _, _, job = heapq.heappop(self._queue)
+
+            if not job.running:
+                # Once running, the Future can no longer be cancelled by the caller while the job is being polled
+                if not job.future.set_running_or_notify_cancel():
+                    self._complete(job, "canceled")
+                    continue
+                job.running = True
+
+            self._poll(job)
+
+    def _poll(self, job):
+        """Internal method used to poll a single job and either complete its `Future` or schedule its next poll.
+
+        Arguments:
+            job {_Job} -- The job to poll.
+        """
+
+        # Any error, including an unexpected job status response, only fails this job so the other jobs are still polled
+        try:
+            api_call = self.rubrik._common_api(
+                'JOB_STATUS',
+                api_version=None,
+                api_endpoint=None,
+                config=None,
+                job_status_url=job.url,
+                timeout=self.timeout)
+
+            now = _monotonic()
+            job.polls += 1
+
+            with self._condition:
+                self._stats["polls"] += 1
+
+            job_status = api_call['status']
+
+            if job_status == "SUCCEEDED":
+                self.rubrik.log('Job Complete: %s\n', job.url)
+                self._complete(job, "succeeded", result=api_call)
+            elif job_status == "CANCELED":
+                self.rubrik.log('Job Cancelled: %s\n', job.url)
+                self._complete(job, "canceled", result=api_call)
+            elif job_status in JOB_IN_PROGRESS_STATUS or job_status in JOB_CANCELING_STATUS or job_status in JOB_FAILING_STATUS:
+                self.rubrik.log('Job Progress %s%%: %s\n', api_call.get('progress'), job.url)
+
+                if job.deadline is not None and now >= job.deadline:
+                    self._complete(job, "timed_out", error=RubrikException(
+                        "The job '{}' did not complete before its deadline. Last status: {}".format(job.url, api_call)))
+                    return
+
+                next_poll = now + self._next_interval(job, api_call.get('progress'), now)
+                if job.deadline is not None:
+                    next_poll = min(next_poll, job.deadline)
+
+                with self._condition:
+                    closed = self._closed
+                    if not closed:
+                        self._push(job, next_poll)
+
+                if closed:
+                    self._cancel(job)
+            else:
+                # Job FAILED
+                self._complete(job, "failed", error=RubrikException('{}'.format(str(api_call))))
+        except Exception as error:  # pylint: disable=broad-except
+            self._complete(job, "failed", error=error)
+
+    def _next_interval(self, job, progress, now):
+        """Internal method used to determine the number of seconds to wait before the next poll of a job. When the job reports progress,
+        the interval is half of the estimated time remaining. Otherwise the previous interval is doubled.
+
+        Arguments:
+            job {_Job} -- The job that was polled.
+            progress {float} -- The progress, in percent, reported by the job.
+            now {float} -- The time of the poll.
+
+        Returns:
+            float -- The number of seconds to wait before the next poll.
+        """
+
+        interval = None
+
+        try:
+            progress = float(progress)
+        except (TypeError, ValueError):
+            progress = None
+
+        if progress is not None:
+            if job.progress is not None and progress > job.progress and now > job.progress_time:
+                rate = (progress - job.progress) / (now - job.progress_time)
+                interval = (100 - progress) / rate / 2
+            if job.progress is None or progress != job.progress:
+                job.progress = progress
+                job.progress_time = now
+
+        if interval is None:
+            interval = job.interval * 2 if job.interval is not None else self.min_interval
+
+        job.interval = max(self.min_interval, min(self.max_interval, interval))
+
+        return job.interval
+
+    def _cancel(self, job):
+        """Internal method used to cancel a job that has not completed when the watcher is closed.
+
+        Arguments:
+            job {_Job} -- The job to cancel.
+        """
+
+        if job.running:
+            # A running Future can not be cancelled so it is resolved with an error instead
+            self._complete(job, "canceled", error=RubrikException("The JobWatcher was closed before the job '{}' completed.".format(job.url)))
+        elif job.future.cancel():
+            self._complete(job, "canceled")
+
+    def _complete(self, job, outcome, result=None, error=None):
+        """Internal method used to record the outcome of a job and resolve its `Future`.
+
+        Arguments:
+            job {_Job} -- The completed job.
+            outcome {str} -- The outcome of the job. (choices: {succeeded, canceled, failed, timed_out})
+
+        Keyword Arguments:
+            result {dict} -- The final job status response body. (default: {None})
+            error {Exception} -- The exception raised for the job. (default: {None})
+        """
+
+        with self._condition:
+            # The outcome of a job is only recorded once, even when resolving its Future raised an error
+            if job.completed:
+                return
+            job.completed = True
+            self._stats[outcome] += 1
+            self._stats["duration"] += _monotonic() - job.started
+
+        # A Future cancelled by the caller before the job was polled can not be resolved
+        if job.future.cancelled():
+            return
+
+        if error is not None:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(result)
@@ -0,0 +1,174 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the JSON codecs used to serialize API requests and decode API responses.
+"""
+
+import importlib
+import json
+
+from .exceptions import InvalidParameterException, RubrikException
+
+JSON_CODECS = ["json", "orjson", "ujson"]
+
+# The order in which the "auto" codec picks an installed JSON library
+_AUTO_CODEC_ORDER = ["orjson", "ujson", "json"]
+
+
+class JsonCodec(object):
+    """Serializes request bodies and decodes response bodies with the standard library `json` module. Responses are decoded
+    through `requests.Response.json()` so the character encoding detection of `requests` is preserved.
+    """
+
+    name = "json"
+
+    def dumps(self, obj):
+        """Serialize `obj` to a JSON document that can be sent as a request body.
+
+        Arguments:
+            obj {object} -- The object to serialize.
+
+        Returns:
+            str -- The JSON document. Non-ASCII characters are escaped so the document can be sent as a `str` body. Codecs that do not
+            escape them return UTF-8 encoded `bytes` instead.
+        """
+
+        return json.dumps(obj)
+
+    def loads(self, document):
+        """Decode a JSON document.
+
+        Arguments:
+            document {bytes} -- The JSON document.
+
+        Returns:
+            object -- The decoded document.
+        """
+
+        return json.loads(document)
+
+    def decode_response(self, api_request):
+        """Decode the body of an API response.
+
+        Arguments:
+            api_request {requests.Response} -- The response returned by the Rubrik cluster.
+
+        Returns:
+            object -- The decoded response body.
+        """
+
+        return api_request.json()
+
+
+class _OrjsonCodec(JsonCodec):
+    """Serializes and decodes JSON with `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self, module):
+        self._module = module
+        self._options = module.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        # orjson does not escape non-ASCII characters so the UTF-8 encoded document is sent as is
+        return self._module.dumps(obj, option=self._options)
+
+    def loads(self, document):
+        return self._module.loads(document)
+
+    def decode_response(self, api_request):
+        return self._module.loads(api_request.content)
+
+
+class _UjsonCodec(JsonCodec):
+    """Serializes and decodes JSON with `ujson`."""
+
+    name = "ujson"
+
+    def __init__(self, module):
+        self._module = module
+
+    def dumps(self, obj):
+        return self._module.dumps(obj)
+
+    def loads(self, document):
+        return self._module.loads(document)
+
+    def decode_response(self, api_request):
+        return self._module.loads(api_request.content)
+
+
+_CODEC_CLASSES = {
+    "orjson": _OrjsonCodec,
+    "ujson": _UjsonCodec,
+}
+
+
+def _import_codec(name):
+    """Internal function used to create a codec for an optional JSON library.
+
+    Arguments:
+        name {str} -- The name of the JSON library.
+
+    Returns:
+        JsonCodec -- The codec, or `None` when the library is not installed.
+    """
+
+    if name == "json":
+        return JsonCodec()
+
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+
+    return _CODEC_CLASSES[name](module)
+
+
+def get_json_codec(name="json"):
+    """Return the codec used to serialize API requests and decode API responses.
+
+    Keyword Arguments:
+        name {str} -- The JSON library to use. `auto` selects the fastest installed library. (choices: {json, orjson, ujson, auto}) (default: {json})
+
+    Returns:
+        JsonCodec -- The codec.
+    """
+
+    if isinstance(name, JsonCodec):
+        return name
+
+    if name == "auto":
+        for candidate in _AUTO_CODEC_ORDER:
+            codec = _import_codec(candidate)
+            if codec is not None:
+                return codec
+
+    if name not in JSON_CODECS:
+        raise InvalidParameterException(
+            "The json_codec argument must be one of the following: {}".format(JSON_CODECS + ["auto"]))
+
+    codec = _import_codec(name)
+    if codec is None:
+        raise RubrikException(
+            "The {0} package is required to use the {0} JSON codec. Install it with 'pip install {0}'.".format(name))
+
+    return codec
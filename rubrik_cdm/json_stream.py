@@ -0,0 +1,229 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the Rubrik SDK JsonArrayStream class.
+"""
+
+import codecs
+import json
+
+from .exceptions import APICallException
+
+_WHITESPACE = " \t\n\r"
+_SEPARATORS = _WHITESPACE + ",]"
+
+
+class JsonArrayStream(object):
+    """Incrementally parses the array stored under `key` in a JSON response body and yields its items one at a time, so only
+    the item being parsed and the current chunk are held in memory. When the body is itself an array, its items are yielded.
+    Once every item has been read, `metadata` holds the rest of the response body (ex. `hasMore` and `total`).
+
+    Arguments:
+        chunks {iterable} -- The response body as a sequence of `bytes` chunks.
+
+    Keyword Arguments:
+        key {str} -- The key of the array to stream in the top-level JSON object. (default: {data})
+        close {callable} -- Called once the response body has been read or the stream is closed. (default: {None})
+    """
+
+    def __init__(self, chunks, key="data", close=None):
+        self.key = key
+        self.metadata = None
+        self.count = 0
+        self._chunks = iter(chunks)
+        self._close = close
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._items = self._parse()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._items)
+
+    next = __next__  # Python 2.X
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stop reading the response body and release the connection to the Rubrik cluster."""
+
+        self._items.close()
+
+    def _read(self):
+        """Internal method used to read the next chunk of the response body.
+
+        Returns:
+            str -- The decoded chunk, or `None` at the end of the response body.
+        """
+
+        for chunk in self._chunks:
+            text = self._text_decoder.decode(chunk)
+            if text:
+                return text
+
+        return None
+
+    def _parse(self):
+        """Internal generator used to parse the response body."""
+
+        try:
+            for item in self._parse_items():
+                yield item
+        finally:
+            if self._close is not None:
+                self._close()
+
+    def _parse_items(self):
+        """Internal generator used to locate the array and yield each of its items."""
+
+        prefix, buffer, index = self._find_array()
+
+        if buffer is None:
+            # The response does not contain the array
+            self.metadata = self._loads(prefix)
+            return
+
+        while True:
+            # Skip the separators between two items
+            while True:
+                while index < len(buffer) and (buffer[index] in _WHITESPACE or buffer[index] == ","):
+                    index += 1
+                if index < len(buffer):
+                    break
+                text = self._read()
+                if text is None:
+                    raise APICallException("The Rubrik cluster returned an incomplete or invalid JSON response.")
+                buffer, index = text, 0
+
+            if buffer[index] == "]":
+                break
+
+            # An item is only complete when it is followed by a separator, which also guards against numbers split across two
+            # chunks
+            try:
+                item, end = self._json_decoder.raw_decode(buffer, index)
+                complete = end < len(buffer) and buffer[end] in _SEPARATORS
+            except ValueError:
+                complete = False
+
+            if not complete:
+                text = self._read()
+                if text is None:
+                    raise APICallException("The Rubrik cluster returned an incomplete or invalid JSON response.")
+                buffer, index = buffer[index:] + text, 0
+                continue
+
+            self.count += 1
+            index = end
+            yield item
+
+        suffix = [buffer[index + 1:]]
+        while True:
+            text = self._read()
+            if text is None:
+                break
+            suffix.append(text)
+
+        if prefix is not None:
+            self.metadata = self._loads(prefix + "[]" + "".join(suffix))
+
+    def _find_array(self):
+        """Internal method used to read the response body up to the opening bracket of the array.
+
+        Returns:
+            tuple -- The response body before the array, the current chunk and the position after the opening bracket. The
+            prefix is `None` when the body is itself an array and the chunk is `None` when the array was not found.
+        """
+
+        prefix = []
+        depth = 0
+        in_string = False
+        escaped = False
+        string = []
+        last_string = None
+        expect_value = False
+
+        while True:
+            text = self._read()
+            if text is None:
+                return "".join(prefix), None, 0
+
+            for index, character in enumerate(text):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif character == "\\":
+                        escaped = True
+                    elif character == '"':
+                        in_string = False
+                        last_string = "".join(string)
+                        string = []
+                        continue
+                    if depth == 1:
+                        string.append(character)
+                    continue
+
+                if character in _WHITESPACE:
+                    continue
+
+                if expect_value:
+                    if character == "[":
+                        prefix.append(text[:index])
+                        return "".join(prefix), text, index + 1
+                    expect_value = False
+
+                if character == '"':
+                    in_string = True
+                elif character == ":":
+                    expect_value = depth == 1 and last_string == self.key
+                elif character in "{[":
+                    if depth == 0 and character == "[":
+                        return None, text, index + 1
+                    depth += 1
+                elif character in "}]":
+                    depth -= 1
+                last_string = last_string if character == ":" else None
+
+            prefix.append(text)
+
+    def _loads(self, document):
+        """Internal method used to decode the parts of the response body that are not streamed.
+
+        Arguments:
+            document {str} -- The JSON document.
+
+        Returns:
+            object -- The decoded document, or `None` when the document is empty.
+        """
+
+        if not document.strip():
+            return None
+
+        try:
+            return json.loads(document)
+        except ValueError:
+            raise APICallException("The Rubrik cluster returned an invalid JSON response.")
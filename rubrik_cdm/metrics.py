@@ -0,0 +1,371 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the Rubrik SDK MetricsRegistry class.
+"""
+
+import os
+import re
+import threading
+import time
+
+from .exceptions import InvalidParameterException, InvalidTypeException
+
+try:
+    _timer = time.perf_counter  # Python 3.3+
+except AttributeError:
+    _timer = time.time  # Python 2.X
+
+# The upper bound, in seconds, of each latency histogram bucket
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0, 30.0, 60.0, 120.0)
+
+# Path segments that identify a single object, replaced by {id} so every object shares the metrics of its endpoint
+_ID_SEGMENT = re.compile(r"(:::|^\d+$|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})")
+
+
+def endpoint_template(call_type, api_version=None, api_endpoint=None, job_status_url=None, gql_operation_name=None):
+    """Return the endpoint an API call is recorded under. The query string is removed and object IDs are replaced by `{id}`,
+    so `/vmware/vm/VirtualMachine:::1234/snapshot` is recorded as `/v1/vmware/vm/{id}/snapshot`. GraphQL queries are recorded
+    under their operation name.
+
+    Arguments:
+        call_type {str} -- The type of API call. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+
+    Keyword Arguments:
+        api_version {str} -- The version of the Rubrik CDM API called. (default: {None})
+        api_endpoint {str} -- The endpoint of the Rubrik CDM API called. (default: {None})
+        job_status_url {str} -- The job status URL polled by a `JOB_STATUS` call. (default: {None})
+        gql_operation_name {str} -- The name of the GraphQL operation sent by a `QUERY` call. (default: {None})
+
+    Returns:
+        str -- The endpoint template.
+    """
+
+    if call_type == 'QUERY':
+        return "/internal/graphql:{}".format(gql_operation_name or "anonymous")
+
+    if call_type == 'JOB_STATUS':
+        path = (job_status_url or "").split("/api", 1)[-1]
+    else:
+        path = "/{}{}".format(api_version, api_endpoint or "")
+
+    path = path.split("?", 1)[0]
+
+    return "/".join("{id}" if _ID_SEGMENT.search(segment) else segment for segment in path.split("/"))
+
+
+class _NullApiCall(object):
+    """Stands in for an `_ApiCall` when metrics are disabled so `_common_api()` does not need to check."""
+
+    def sent(self, data):
+        pass
+
+    def received(self, api_request):
+        pass
+
+    def transport_failed(self, error):
+        pass
+
+    def retried(self):
+        pass
+
+    def failed(self, error):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_API_CALL = _NullApiCall()
+
+
+class _ApiCall(object):
+    """The measurements of a single API call, including every attempt, reported to the registry by `finish()`.
+
+    Arguments:
+        registry {MetricsRegistry} -- The registry the API call is recorded in.
+        key {tuple} -- The method and endpoint template of the API call.
+    """
+
+    def __init__(self, registry, key):
+        self.registry = registry
+        self.key = key
+        self.started = _timer()
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.status_code = None
+        self.transport_error = None
+        self.error = None
+
+    def sent(self, data):
+        if data:
+            self.request_bytes += len(data)
+
+    def received(self, api_request):
+        self.status_code = api_request.status_code
+        self.transport_error = None
+        self.response_bytes += _response_size(api_request)
+
+    def transport_failed(self, error):
+        self.status_code = None
+        self.transport_error = type(error).__name__
+
+    def retried(self):
+        self.retries += 1
+
+    def failed(self, error):
+        if isinstance(self.status_code, int) and self.status_code >= 400:
+            self.error = str(self.status_code)
+        else:
+            self.error = self.transport_error or type(error).__name__
+
+    def finish(self):
+        self.registry._record(self.key, _timer() - self.started, self.request_bytes, self.response_bytes, self.retries, self.error)
+
+
+def _response_size(api_request):
+    """Internal function used to determine the size of a response body without reading a streamed body.
+
+    Arguments:
+        api_request {requests.Response} -- The response returned by the Rubrik cluster.
+
+    Returns:
+        int -- The number of bytes in the response body, or its `Content-Length` when it has not been read.
+    """
+
+    content = getattr(api_request, "_content", None)
+    if isinstance(content, bytes):
+        return len(content)
+
+    headers = getattr(api_request, "headers", None)
+    try:
+        return int(headers.get("Content-Length"))
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+class _EndpointMetrics(object):
+    """The metrics recorded for a single method and endpoint template."""
+
+    def __init__(self, buckets):
+        self.calls = 0
+        self.errors = {}
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.total_latency = 0.0
+        self.min_latency = None
+        self.max_latency = 0.0
+
+
+class MetricsRegistry(object):
+    """Records the number of calls, latency histogram, request and response bytes, retries and errors of every API call made by a
+    connection, grouped by the call type and endpoint template. Latency is measured from the first attempt until the response
+    has been validated, including the delay between retries. Histograms use fixed buckets, so memory use does not grow with the
+    number of calls and the p50, p95 and p99 latency are estimated within the bucket they fall in.
+
+    Keyword Arguments:
+        buckets {tuple} -- The upper bound, in seconds, of each latency histogram bucket, in increasing order. (default: {LATENCY_BUCKETS})
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+
+        if not isinstance(buckets, (list, tuple)) or not buckets:
+            raise InvalidTypeException("The metrics buckets must be a list of numbers.")
+        for bucket in buckets:
+            if isinstance(bucket, bool) or not isinstance(bucket, (int, float)):
+                raise InvalidTypeException("The metrics buckets must be a list of numbers.")
+        if any(lower >= upper for lower, upper in zip(buckets, buckets[1:])) or buckets[0] <= 0:
+            raise InvalidParameterException("The metrics buckets must be positive and in increasing order.")
+
+        self.buckets = tuple(float(bucket) for bucket in buckets)
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def start(self, call_type, api_version=None, api_endpoint=None, job_status_url=None, gql_operation_name=None):
+        """Start measuring an API call. See `endpoint_template()` for the arguments.
+
+        Returns:
+            _ApiCall -- The measurements of the API call, recorded once its `finish()` method is called.
+        """
+
+        return _ApiCall(self, (call_type, endpoint_template(call_type, api_version, api_endpoint, job_status_url, gql_operation_name)))
+
+    def _record(self, key, latency, request_bytes, response_bytes, retries, error):
+        """Internal method used to add the measurements of a finished API call to its endpoint."""
+
+        with self._lock:
+            metrics = self._endpoints.get(key)
+            if metrics is None:
+                metrics = self._endpoints[key] = _EndpointMetrics(self.buckets)
+
+            metrics.calls += 1
+            metrics.retries += retries
+            metrics.request_bytes += request_bytes
+            metrics.response_bytes += response_bytes
+            if error is not None:
+                metrics.errors[error] = metrics.errors.get(error, 0) + 1
+
+            index = 0
+            while index < len(self.buckets) and latency > self.buckets[index]:
+                index += 1
+            metrics.bucket_counts[index] += 1
+            metrics.total_latency += latency
+            metrics.min_latency = latency if metrics.min_latency is None else min(metrics.min_latency, latency)
+            metrics.max_latency = max(metrics.max_latency, latency)
+
+    def _quantile(self, metrics, quantile):
+        """Internal method used to estimate a latency quantile by interpolating within the histogram bucket it falls in."""
+
+        rank = quantile * metrics.calls
+        cumulative = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets + (metrics.max_latency,), metrics.bucket_counts):
+            if count and cumulative + count >= rank:
+                estimate = lower + (max(upper, lower) - lower) * (rank - cumulative) / count
+                return min(max(estimate, metrics.min_latency), metrics.max_latency)
+            cumulative += count
+            lower = upper
+
+        return metrics.max_latency
+
+    def stats(self):
+        """Return the metrics recorded for each endpoint.
+
+        Returns:
+            dict -- The `calls`, `errors`, `error_rate`, `errors_by_class`, `retries`, `request_bytes`, `response_bytes` and `latency`
+            (`mean`, `min`, `max`, `p50`, `p95` and `p99` in seconds) of each endpoint, keyed by the call type and endpoint template
+            (ex. `GET /v1/vmware/vm/{id}`). Errors are classified by HTTP status code, or by exception name when no error response was received.
+        """
+
+        with self._lock:
+            stats = {}
+            for (method, endpoint), metrics in sorted(self._endpoints.items()):
+                errors = sum(metrics.errors.values())
+                stats["{} {}".format(method, endpoint)] = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "calls": metrics.calls,
+                    "errors": errors,
+                    "error_rate": float(errors) / metrics.calls,
+                    "errors_by_class": dict(metrics.errors),
+                    "retries": metrics.retries,
+                    "request_bytes": metrics.request_bytes,
+                    "response_bytes": metrics.response_bytes,
+                    "latency": {
+                        "mean": metrics.total_latency / metrics.calls,
+                        "min": metrics.min_latency,
+                        "max": metrics.max_latency,
+                        "p50": self._quantile(metrics, 0.5),
+                        "p95": self._quantile(metrics, 0.95),
+                        "p99": self._quantile(metrics, 0.99),
+                    },
+                }
+            return stats
+
+    def reset(self):
+        """Discard every metric recorded so far."""
+
+        with self._lock:
+            self._endpoints = {}
+
+    def prometheus(self, namespace="rubrik_cdm"):
+        """Return the metrics in the Prometheus text exposition format.
+
+        Keyword Arguments:
+            namespace {str} -- The prefix of every metric name. (default: {"rubrik_cdm"})
+
+        Returns:
+            str -- The `<namespace>_api_calls_total`, `_api_errors_total`, `_api_retries_total`, `_api_request_bytes_total`,
+            `_api_response_bytes_total` and `_api_call_duration_seconds` histogram metrics, labelled by `method` and `endpoint`.
+        """
+
+        counters = [
+            ("api_calls_total", "The number of API calls sent to the Rubrik cluster.", lambda metrics: metrics.calls),
+            ("api_retries_total", "The number of times a failed API call was sent again.", lambda metrics: metrics.retries),
+            ("api_request_bytes_total", "The number of bytes sent in API call bodies.", lambda metrics: metrics.request_bytes),
+            ("api_response_bytes_total", "The number of bytes received in API response bodies.", lambda metrics: metrics.response_bytes),
+        ]
+
+        with self._lock:
+            endpoints = sorted((key, metrics) for key, metrics in self._endpoints.items())
+
+            lines = []
+            for name, description, value in counters:
+                lines.append("# HELP {}_{} {}".format(namespace, name, description))
+                lines.append("# TYPE {}_{} counter".format(namespace, name))
+                for key, metrics in endpoints:
+                    lines.append("{}_{}{{{}}} {}".format(namespace, name, _labels(key), value(metrics)))
+
+            lines.append("# HELP {}_api_errors_total The number of API calls that failed, by HTTP status code or exception name.".format(namespace))
+            lines.append("# TYPE {}_api_errors_total counter".format(namespace))
+            for key, metrics in endpoints:
+                for error, count in sorted(metrics.errors.items()):
+                    lines.append("{}_api_errors_total{{{},error=\"{}\"}} {}".format(namespace, _labels(key), _escape(error), count))
+
+            lines.append("# HELP {}_api_call_duration_seconds The number of seconds each API call took, including retries.".format(namespace))
+            lines.append("# TYPE {}_api_call_duration_seconds histogram".format(namespace))
+            for key, metrics in endpoints:
+                cumulative = 0
+                for upper, count in zip(self.buckets + (float("inf"),), metrics.bucket_counts):
+                    cumulative += count
+                    bound = "+Inf" if upper == float("inf") else repr(upper)
+                    lines.append("{}_api_call_duration_seconds_bucket{{{},le=\"{}\"}} {}".format(namespace, _labels(key), bound, cumulative))
+                lines.append("{}_api_call_duration_seconds_sum{{{}}} {!r}".format(namespace, _labels(key), metrics.total_latency))
+                lines.append("{}_api_call_duration_seconds_count{{{}}} {}".format(namespace, _labels(key), metrics.calls))
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path, namespace="rubrik_cdm"):
+        """Write the metrics in the Prometheus text exposition format to a file, such as a file read by the textfile collector of
+        the Prometheus node exporter. The file is replaced in a single step so a partially written file is never read.
+
+        Arguments:
+            path {str} -- The path of the file.
+
+        Keyword Arguments:
+            namespace {str} -- The prefix of every metric name. (default: {"rubrik_cdm"})
+        """
+
+        temporary_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temporary_path, "w") as metrics_file:
+            metrics_file.write(self.prometheus(namespace))
+
+        if hasattr(os, "replace"):
+            os.replace(temporary_path, path)  # Python 3.3+
+        else:
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(temporary_path, path)
+
+
+def _escape(value):
+    """Internal function used to escape a Prometheus label value."""
+
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(key):
+    """Internal function used to format the method and endpoint labels of a Prometheus metric."""
+
+    return "method=\"{}\",endpoint=\"{}\"".format(_escape(key[0]), _escape(key[1]))
@@ -0,0 +1,212 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the Rubrik SDK NodePool class.
+"""
+
+import threading
+
+from .cache import _monotonic
+from .exceptions import InvalidParameterException, InvalidTypeException
+
+ROUND_ROBIN = "round_robin"
+LEAST_OUTSTANDING = "least_outstanding"
+
+# HTTP status codes that indicate the node, rather than the request, is unhealthy
+NODE_FAILURE_STATUS_CODES = (502, 503, 504)
+
+
+class _Node(object):
+    """The health and load of a single Rubrik node in a `NodePool`."""
+
+    def __init__(self, ip):
+        self.ip = ip
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = None
+
+
+class NodePool(object):
+    """A thread-safe set of Rubrik node IP addresses that API calls are spread across. A node is ejected for `cooldown` seconds
+    after `max_failures` consecutive failed requests, and the node list is due to be refreshed every `discovery_interval` seconds.
+    When every node has been ejected, the node whose cooldown ends first is used.
+
+    Arguments:
+        nodes {list} -- The IP addresses of the Rubrik nodes.
+
+    Keyword Arguments:
+        strategy {str} -- How the next node is selected. (choices: {'round_robin', 'least_outstanding'}) (default: {'round_robin'})
+        cooldown {int} -- The number of seconds a failing node is ejected for. (default: {30})
+        max_failures {int} -- The number of consecutive failed requests after which a node is ejected. (default: {1})
+        discovery_interval {int} -- The number of seconds after which the node list should be discovered again. A value of 0 only discovers the nodes once. (default: {300})
+    """
+
+    def __init__(self, nodes, strategy=ROUND_ROBIN, cooldown=30, max_failures=1, discovery_interval=300):
+
+        if strategy not in [ROUND_ROBIN, LEAST_OUTSTANDING]:
+            raise InvalidParameterException(
+                "The load balancing strategy must be one of the following: {}".format([ROUND_ROBIN, LEAST_OUTSTANDING]))
+
+        for name, value in (("cooldown", cooldown), ("discovery_interval", discovery_interval)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise InvalidTypeException("The node pool {} must be a number.".format(name))
+            if value < 0:
+                raise InvalidParameterException("The node pool {} must be 0 or greater.".format(name))
+
+        if isinstance(max_failures, bool) or not isinstance(max_failures, int):
+            raise InvalidTypeException("The node pool max_failures must be an integer.")
+        if max_failures < 1:
+            raise InvalidParameterException("The node pool max_failures must be 1 or greater.")
+
+        self.strategy = strategy
+        self.cooldown = cooldown
+        self.max_failures = max_failures
+        self.discovery_interval = discovery_interval
+
+        self._lock = threading.Lock()
+        self._nodes = []
+        self._next_index = 0
+        # The first discovery is due as soon as the pool is used
+        self._next_discovery = 0
+        self.update(nodes)
+
+    @property
+    def nodes(self):
+        """list -- The IP addresses of every node in the pool, including ejected nodes."""
+        with self._lock:
+            return [node.ip for node in self._nodes]
+
+    def update(self, nodes):
+        """Replace the nodes in the pool while keeping the health and load of the nodes that remain.
+
+        Arguments:
+            nodes {list} -- The IP addresses of the Rubrik nodes.
+        """
+
+        if not isinstance(nodes, list) or len(nodes) == 0:
+            raise InvalidParameterException("The node pool requires a list that contains at least one node IP address.")
+
+        with self._lock:
+            existing = dict((node.ip, node) for node in self._nodes)
+            self._nodes = [existing.get(ip) or _Node(ip) for ip in nodes]
+
+    def discovery_due(self):
+        """Return `True`, once per `discovery_interval`, when the node list should be discovered again. The next discovery is
+        scheduled before returning so concurrent callers do not discover the nodes more than once.
+
+        Returns:
+            bool -- `True` when the caller should discover the nodes.
+        """
+
+        with self._lock:
+            if self._next_discovery is None:
+                return False
+
+            now = _monotonic()
+            if now < self._next_discovery:
+                return False
+
+            self._next_discovery = now + self.discovery_interval if self.discovery_interval > 0 else None
+            return True
+
+    def acquire(self):
+        """Select the node the next API call is sent to and count it as an outstanding request on that node.
+
+        Returns:
+            str -- The IP address of the selected node.
+        """
+
+        with self._lock:
+            now = _monotonic()
+            healthy = [node for node in self._nodes if node.ejected_until is None or node.ejected_until <= now]
+
+            if not healthy:
+                node = min(self._nodes, key=lambda candidate: candidate.ejected_until)
+            elif self.strategy == LEAST_OUTSTANDING:
+                node = min(healthy, key=lambda candidate: (candidate.outstanding, candidate.requests))
+            else:
+                node = healthy[self._next_index % len(healthy)]
+                self._next_index += 1
+
+            node.outstanding += 1
+            node.requests += 1
+            return node.ip
+
+    def release(self, ip, failed=False):
+        """Record the outcome of an API call sent to a node selected by `acquire()`.
+
+        Arguments:
+            ip {str} -- The IP address of the node.
+
+        Keyword Arguments:
+            failed {bool} -- Flag that specifies whether the node failed to respond to the API call. (default: {False})
+        """
+
+        with self._lock:
+            node = self._find(ip)
+            if node is None:
+                # The node was removed by a discovery while the API call was in flight
+                return
+
+            node.outstanding = max(0, node.outstanding - 1)
+
+            if failed:
+                node.failures += 1
+                node.consecutive_failures += 1
+                if node.consecutive_failures >= self.max_failures:
+                    node.ejected_until = _monotonic() + self.cooldown
+            else:
+                node.consecutive_failures = 0
+                node.ejected_until = None
+
+    def _find(self, ip):
+        """Internal method used to look up a node by IP address. The caller must hold the pool lock.
+
+        Arguments:
+            ip {str} -- The IP address of the node.
+
+        Returns:
+            _Node -- The node, or `None` when it is not in the pool.
+        """
+
+        for node in self._nodes:
+            if node.ip == ip:
+                return node
+        return None
+
+    def stats(self):
+        """Return the load and health of every node in the pool.
+
+        Returns:
+            dict -- The number of outstanding requests, total requests and failed requests of each node IP address, and whether
+            the node is currently ejected.
+        """
+
+        with self._lock:
+            now = _monotonic()
+            return dict((node.ip, {
+                "outstanding": node.outstanding,
+                "requests": node.requests,
+                "failures": node.failures,
+                "ejected": node.ejected_until is not None and node.ejected_until > now,
+            }) for node in self._nodes)
@@ -52,8 +52,7 @@ class Physical(Api):
         if(len(hostname) == 0):
             raise InvalidParameterException("The provided hostname list is empty.")
 
-        self.log('Searching the Rubrik cluster for the current hosts.')
-        current_hosts = self.get('v1', '/host', timeout=timeout)
+        current_hosts = self._current_physical_hosts(timeout)
 
         if isinstance(hostname, list):
 
@@ -76,7 +75,10 @@ class Physical(Api):
                     }]
 
                 self.log("Adding the following physical host(s): '{}'".format(hostname))
-                return self.post('internal', '/host/bulk', config, timeout)
+                api_request = self.post('internal', '/host/bulk', config, timeout)
+                if self.inventory is not None:
+                    self.inventory.invalidate('physical_host')
+                return api_request
             else:
                 return "No change required. All Hosts have already been added or supplied list was empty."
         else:
@@ -90,7 +92,10 @@ class Physical(Api):
             config['hasAgent'] = True
 
             self.log("Adding the host '{}' to the Rubrik cluster.".format(hostname))
-            return self.post('v1', '/host', config, timeout)
+            api_request = self.post('v1', '/host', config, timeout)
+            if self.inventory is not None and isinstance(api_request, dict) and "id" in api_request:
+                self.inventory.add('physical_host', api_request)
+            return api_request
 
     def delete_physical_host(self, hostname, timeout=120):
         """Delete a physical host from the Rubrik cluster.
@@ -108,8 +113,7 @@ class Physical(Api):
 
         self.function_name = inspect.currentframe().f_code.co_name
 
-        self.log('Searching the Rubrik cluster for the current hosts.')
-        current_hosts = self.get('v1', '/host', timeout=timeout)
+        current_hosts = self._current_physical_hosts(timeout)
 
         host_present = False
 
@@ -124,7 +128,28 @@ class Physical(Api):
                 hostname)
 
         self.log("Deleting the host '{}' from the Rubrik cluster.".format(hostname))
-        return self.delete('v1', '/host/{}'.format(host_id), timeout=timeout)
+        api_request = self.delete('v1', '/host/{}'.format(host_id), timeout=timeout)
+        if self.inventory is not None:
+            self.inventory.remove('physical_host', host_id)
+        return api_request
+
+    def _current_physical_hosts(self, timeout=15):
+        """Internal method used to list the physical hosts connected to the Rubrik cluster, from the `inventory` of the connection when
+        it holds physical hosts.
+
+        Keyword Arguments:
+            timeout {int} -- The number of seconds to wait to establish a connection the Rubrik cluster before returning a timeout error. (default: {15})
+
+        Returns:
+            dict -- The physical hosts in the `data` list of a `GET /v1/host` response.
+        """
+
+        if self.inventory is not None and self.inventory.indexes('physical_host'):
+            self.log('Searching the inventory for the current hosts.')
+            return {"data": self.inventory.items('physical_host')}
+
+        self.log('Searching the Rubrik cluster for the current hosts.')
+        return self.get('v1', '/host', timeout=timeout)
 
     def create_physical_fileset(self, name, operating_system, include, exclude, exclude_exception, follow_network_shares=False, backup_hidden_folders=False, timeout=15):  # pylint: ignore
         """Create a Fileset for a Linux or Windows machine.
@@ -0,0 +1,200 @@
+# Copyright 2020 Rubrik, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+"""
+This module contains the Rubrik SDK RetryPolicy class.
+"""
+
+from email.utils import mktime_tz, parsedate_tz
+import random
+import threading
+import time
+
+from .exceptions import InvalidParameterException, InvalidTypeException
+
+# Transport errors a RetryPolicy can retry
+CONNECTION_ERROR = "connection_error"
+TIMEOUT = "timeout"
+
+# Responses that tell the client the request was rejected before it was processed
+_NOT_PROCESSED_STATUS_CODES = (429, 503)
+
+
+class RetryPolicy(object):
+    """Decides whether a failed API call to the Rubrik cluster should be sent again and how long to wait before doing so.
+    The delay grows exponentially with each attempt (`backoff_factor * 2 ** (attempt - 1)`), is capped at `max_backoff` and,
+    when `jitter` is enabled, is randomized between half and the full delay so that many clients do not retry in lockstep.
+
+    Only idempotent calls are retried after the request may have reached the Rubrik cluster. `POST` and `PATCH` calls are
+    retried only when the cluster could not have processed them: the connection was never established, or the cluster
+    answered with `429 Too Many Requests` or `503 Service Unavailable`.
+
+    Keyword Arguments:
+        max_attempts {int} -- The maximum number of times an API call is sent, including the first attempt. A value of 1 disables retries. (default: {3})
+        backoff_factor {float} -- The number of seconds to wait before the first retry. (default: {0.5})
+        max_backoff {float} -- The maximum number of seconds to wait between two attempts, including any `Retry-After` value sent by the Rubrik cluster. (default: {30})
+        jitter {bool} -- Flag that determines whether the delay between attempts is randomized. (default: {True})
+        retry_status_codes {tuple} -- The HTTP status codes that are retried. (default: {(429, 502, 503, 504)})
+        retry_errors {tuple} -- The transport errors that are retried. (choices: {'connection_error', 'timeout'}) (default: {('connection_error', 'timeout')})
+        idempotent_call_types {tuple} -- The `_common_api()` call types that are safe to send more than once. (default: {('GET', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS')})
+        respect_retry_after {bool} -- Flag that determines whether the `Retry-After` header sent by the Rubrik cluster replaces the computed delay. (default: {True})
+    """
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=30, jitter=True, retry_status_codes=(429, 502, 503, 504),
+                 retry_errors=(CONNECTION_ERROR, TIMEOUT), idempotent_call_types=('GET', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'),
+                 respect_retry_after=True):
+
+        if isinstance(max_attempts, bool) or not isinstance(max_attempts, int):
+            raise InvalidTypeException("The retry policy max_attempts must be an integer.")
+        if max_attempts < 1:
+            raise InvalidParameterException("The retry policy max_attempts must be 1 or greater.")
+
+        for name, value in (("backoff_factor", backoff_factor), ("max_backoff", max_backoff)):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise InvalidTypeException("The retry policy {} must be a number.".format(name))
+            if value < 0:
+                raise InvalidParameterException("The retry policy {} must be 0 or greater.".format(name))
+
+        if not isinstance(jitter, bool) or not isinstance(respect_retry_after, bool):
+            raise InvalidTypeException("The retry policy jitter and respect_retry_after arguments must be True or False.")
+
+        valid_errors = [CONNECTION_ERROR, TIMEOUT]
+        for error in retry_errors:
+            if error not in valid_errors:
+                raise InvalidParameterException(
+                    "The retry policy retry_errors must only contain the following values: {}".format(valid_errors))
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_errors = frozenset(retry_errors)
+        self.idempotent_call_types = frozenset(idempotent_call_types)
+        self.respect_retry_after = respect_retry_after
+
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._retries_by_reason = {}
+        self._exhausted = 0
+        self._delay = 0.0
+
+    def backoff(self, attempt):
+        """Return the number of seconds to wait after a failed attempt, before any `Retry-After` value is applied.
+
+        Arguments:
+            attempt {int} -- The number of the attempt that failed, starting at 1.
+
+        Returns:
+            float -- The number of seconds to wait.
+        """
+
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(delay / 2.0, delay)
+        return delay
+
+    def retry_delay(self, call_type, attempt, status_code=None, error=None, request_sent=True, retry_after=None):
+        """Decide whether a failed attempt should be retried and record the decision in the retry metrics.
+
+        Arguments:
+            call_type {str} -- The `_common_api()` call type of the failed attempt. (choices: {'GET', 'POST', 'PATCH', 'PUT', 'DELETE', 'QUERY', 'JOB_STATUS'})
+            attempt {int} -- The number of the attempt that failed, starting at 1.
+
+        Keyword Arguments:
+            status_code {int} -- The HTTP status code returned by the Rubrik cluster. (default: {None})
+            error {str} -- The transport error raised while sending the request. (choices: {'connection_error', 'timeout'}) (default: {None})
+            request_sent {bool} -- Flag that specifies whether the request may have reached the Rubrik cluster. (default: {True})
+            retry_after {str} -- The value of the `Retry-After` header returned by the Rubrik cluster. (default: {None})
+
+        Returns:
+            float -- The number of seconds to wait before the next attempt, or `None` when the call should not be retried.
+        """
+
+        if status_code is not None:
+            if status_code not in self.retry_status_codes:
+                return None
+            reason = str(status_code)
+            safe = call_type in self.idempotent_call_types or status_code in _NOT_PROCESSED_STATUS_CODES
+        else:
+            if error not in self.retry_errors:
+                return None
+            reason = error
+            safe = call_type in self.idempotent_call_types or request_sent is False
+
+        if not safe:
+            return None
+
+        if attempt >= self.max_attempts:
+            with self._lock:
+                self._exhausted += 1
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and retry_after is not None:
+            requested_delay = self._parse_retry_after(retry_after)
+            if requested_delay is not None:
+                delay = min(self.max_backoff, requested_delay)
+
+        with self._lock:
+            self._retries += 1
+            self._retries_by_reason[reason] = self._retries_by_reason.get(reason, 0) + 1
+            self._delay += delay
+
+        return delay
+
+    @staticmethod
+    def _parse_retry_after(retry_after):
+        """Internal method used to convert a `Retry-After` header, sent either as a number of seconds or as an HTTP date,
+        into a number of seconds.
+
+        Arguments:
+            retry_after {str} -- The value of the `Retry-After` header.
+
+        Returns:
+            float -- The number of seconds to wait, or `None` when the header can not be parsed.
+        """
+
+        try:
+            return max(0.0, float(retry_after))
+        except (TypeError, ValueError):
+            pass
+
+        parsed_date = parsedate_tz(str(retry_after))
+        if parsed_date is None:
+            return None
+
+        return max(0.0, mktime_tz(parsed_date) - time.time())
+
+    def stats(self):
+        """Return the retry metrics recorded since the policy was created.
+
+        Returns:
+            dict -- The number of retries, the retries per status code or transport error, the number of calls that failed after
+            the last allowed attempt and the total number of seconds spent waiting between attempts.
+        """
+
+        with self._lock:
+            return {
+                "retries": self._retries,
+                "retries_by_reason": dict(self._retries_by_reason),
+                "exhausted": self._exhausted,
+                "total_delay": self._delay,
+            }
@@ -28,20 +28,36 @@ import os
 import logging
 from random import choice
 import time
+import threading
 import socket
 import sys
 import inspect
 
-from .api import Api
+from .api import Api, BASIC_AUTHENTICATION
+from .context import scoped_function_names
 from .cluster import Cluster
 from .data_management import Data_Management
 from .physical import Physical
 from .cloud import Cloud
 from .organization import Organization
+from .bulk import Bulk
+from .cache import TTLCache, _monotonic
+from .capabilities import parse_cdm_version
+from .inventory import Inventory
+from .json_codec import get_json_codec
+from .metrics import MetricsRegistry
+from .node_pool import NodePool
+from .retry import RetryPolicy, CONNECTION_ERROR
 from .exceptions import InvalidParameterException, RubrikException, APICallException, InvalidTypeException
 
+_logger = logging.getLogger(__name__)
 
-class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
+# The Connect attributes that the cached request headers are built from
+_HEADER_ATTRIBUTES = frozenset(["sdk_version", "python_version", "platform", "username", "password", "api_token"])
+
+
+@scoped_function_names
+class Connect(Cluster, Data_Management, Physical, Cloud, Organization, Bulk):
     """This class acts as the base class for the Rubrik SDK and serves as the main interaction point
     for its end users. It also contains various helper functions used throughout the SDK.
 
@@ -50,9 +66,10 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
         Data_Management {class} - This class contains methods related to backup and restore operations for the various objects managed by the Rubrik Cluster.
         Physical {class} - This class contains methods related to the management of the Physical objects in the Rubrik Cluster.
         Cloud {class} - This class contains methods for the managment of Cloud related functionality on the Rubrik cluster.
+        Bulk {class} - This class contains methods used to run SDK functions and monitor jobs for many objects concurrently.
     """
 
-    def __init__(self, node_ip=None, username=None, password=None, api_token=None, enable_logging=False, logging_level="debug"):
+    def __init__(self, node_ip=None, username=None, password=None, api_token=None, enable_logging=False, logging_level="debug", pool_connections=10, pool_maxsize=10, keep_alive=True, object_id_cache_ttl=0, object_id_cache_size=1024, cluster_version_refresh=None, retry_policy=None, load_balancing=None, node_cooldown=30, node_discovery_interval=300, log_payload_size=None, use_session_token=False, session_token_refresh=1800, json_codec="json", inventory_refresh_interval=0, inventory_object_types=None, enable_metrics=True):
         """Constructor for the Connect class which is used to initialize the class variables.
 
         Keyword Arguments:
@@ -62,6 +79,23 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
             api_token {str} -- The API Token you wish to use to connect to the Rubrik cluster. If populated, the `username` and `password` fields will be ignored. If a value is not provided we will check for a `rubrik_cdm_token` environment variable.  (default: {None})
             enable_logging {bool} -- Flag to determine if logging will be enabled for the SDK. (default: {False})
             logging_level {str} -- Sets the threshold for logging to the provided to level. Logging messages which are less severe than level will be ignored. (default: {debug}) (choices: {debug, critical, error, warning, info})
+            pool_connections {int} -- The number of connection pools (one per Rubrik node) the HTTP session will cache. (default: {10})
+            pool_maxsize {int} -- The maximum number of connections the HTTP session will keep open to a single Rubrik node. (default: {10})
+            keep_alive {bool} -- Flag that determines whether connections to the Rubrik cluster are reused across API calls. (default: {True})
+            object_id_cache_ttl {int} -- The number of seconds the IDs resolved by `object_id()` are cached for. A value of 0 disables the cache. (default: {0})
+            object_id_cache_size {int} -- The maximum number of IDs the `object_id()` cache holds before evicting the least recently used entry. (default: {1024})
+            cluster_version_refresh {int} -- The number of seconds after which the cached Rubrik cluster version is fetched again. By default the version is fetched once for the life of the connection. (default: {None})
+            retry_policy {RetryPolicy} -- The policy used to retry API calls that fail with a transient error, such as a `503 Service Unavailable` response. By default failed API calls are not retried. (default: {None})
+            load_balancing {str} -- Spread API calls across every node of the Rubrik cluster instead of only `node_ip`. The nodes are discovered through the `/cluster/me/node` endpoint. By default every API call is sent to `node_ip`. (default: {None}) (choices: {round_robin, least_outstanding})
+            node_cooldown {int} -- The number of seconds a node that fails to respond is excluded from load balancing. (default: {30})
+            node_discovery_interval {int} -- The number of seconds after which the nodes of the Rubrik cluster are discovered again. A value of 0 only discovers the nodes once. (default: {300})
+            log_payload_size {int} -- The maximum number of characters of each request body and response logged. A value of 0 redacts the payloads from the log. By default payloads are logged in full. (default: {None})
+            use_session_token {bool} -- Flag that determines whether the username and password are exchanged once for a session token that is sent with every API call instead of the credentials. The session token is released by `close()`. (default: {False})
+            session_token_refresh {int} -- The number of seconds after which a new session token is created. (default: {1800})
+            json_codec {str} -- The JSON library used to serialize request bodies and decode responses. `auto` selects the fastest installed library. (default: {json}) (choices: {json, orjson, ujson, auto})
+            inventory_refresh_interval {int} -- The number of seconds after which each object type held by the `inventory` is listed again. A value of 0 disables the inventory. (default: {0})
+            inventory_object_types {list} -- The object types held by the `inventory`. By default every supported type is held. (default: {None}) (choices: {vmware, physical_host, sla, fileset, mssql_db, share, managed_volume})
+            enable_metrics {bool} -- Flag that determines whether the number of calls, latency, bytes, retries and errors of each API endpoint are recorded and returned by `stats()`. (default: {True})
         """
 
         set_logging = {
@@ -78,6 +112,13 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
 
         # Enable logging for the SDK
         self.logging_level = logging_level
+        self._log_level = set_logging[logging_level]
+        if log_payload_size is not None:
+            if isinstance(log_payload_size, bool) or not isinstance(log_payload_size, int):
+                raise InvalidTypeException("The log_payload_size argument must be an integer.")
+            if log_payload_size < 0:
+                raise InvalidParameterException("The log_payload_size argument must be 0 or greater.")
+        self.log_payload_size = log_payload_size
         if enable_logging:
             logging.getLogger().setLevel(set_logging[self.logging_level])
 
@@ -191,46 +232,157 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
         # Optional value to define the Platform using the SDK (Ex. Ansible)
         self.platform = ""
 
-    def log(self, log_message):
-        """Create properly formatted debug log messages.
+        # Cache of the name to ID lookups performed by object_id()
+        self.object_id_cache = TTLCache(object_id_cache_ttl, object_id_cache_size)
+
+        if cluster_version_refresh is not None:
+            if isinstance(cluster_version_refresh, bool) or not isinstance(cluster_version_refresh, (int, float)):
+                raise InvalidTypeException("The cluster_version_refresh argument must be a number.")
+            if cluster_version_refresh < 0:
+                raise InvalidParameterException("The cluster_version_refresh argument must be 0 or greater.")
+
+        # Version of CDM installed on the Rubrik cluster, populated by cluster_version()
+        self.cluster_version_refresh = cluster_version_refresh
+        self._cluster_version = None
+        self._cluster_version_expires = None
+        self._cluster_capabilities = None
+        # Timezone configured on the Rubrik cluster, populated by cluster_timezone()
+        self._cluster_timezone = None
+        self._cluster_tzinfo_cache = None
+
+        if retry_policy is not None and not isinstance(retry_policy, RetryPolicy):
+            raise InvalidTypeException("The retry_policy argument must be a RetryPolicy.")
+        self.retry_policy = retry_policy
+
+        # Nodes that API calls are load balanced across, discovered by the first API call
+        if load_balancing is not None:
+            self.node_pool = NodePool([self.node_ip], load_balancing, node_cooldown, discovery_interval=node_discovery_interval)
+        else:
+            self.node_pool = None
+
+        if not isinstance(use_session_token, bool):
+            raise InvalidTypeException("The use_session_token argument must be True or False.")
+        if isinstance(session_token_refresh, bool) or not isinstance(session_token_refresh, (int, float)):
+            raise InvalidTypeException("The session_token_refresh argument must be a number.")
+        if session_token_refresh <= 0:
+            raise InvalidParameterException("The session_token_refresh argument must be greater than 0.")
+
+        # Session token exchanged for the username and password, created by the first API call
+        self.use_session_token = use_session_token
+        self.session_token_refresh = session_token_refresh
+        self._session_token = None
+        self._session_token_expires = None
+        self._session_token_lock = threading.Lock()
+
+        self.json_codec = get_json_codec(json_codec)
+
+        if isinstance(inventory_refresh_interval, bool) or not isinstance(inventory_refresh_interval, (int, float)):
+            raise InvalidTypeException("The inventory_refresh_interval argument must be a number.")
+        if inventory_refresh_interval < 0:
+            raise InvalidParameterException("The inventory_refresh_interval argument must be 0 or greater.")
+
+        # Indexed snapshot of the objects on the Rubrik cluster, listed the first time each object type is used
+        if inventory_refresh_interval > 0:
+            self.inventory = Inventory(self, inventory_object_types, inventory_refresh_interval)
+        else:
+            self.inventory = None
+
+        if not isinstance(enable_metrics, bool):
+            raise InvalidTypeException("The enable_metrics argument must be True or False.")
+
+        # Per-endpoint metrics of every API call, returned by stats()
+        if enable_metrics:
+            self.metrics = MetricsRegistry()
+        else:
+            self.metrics = None
+
+        # Pooled HTTP session shared by every API call
+        self._session = self._create_session(pool_connections, pool_maxsize, keep_alive)
+
+    def close(self):
+        """Stop the background refresh of the inventory, release the session token, when one has been created, and close the pooled
+        HTTP session."""
+
+        if self.inventory is not None:
+            self.inventory.close()
+
+        if self._session_token is not None and _monotonic() < self._session_token_expires:
+            try:
+                self._common_api('DELETE', 'v1', '/session/me')
+            except APICallException as error:
+                self.log("Unable to release the session token: %s", error)
+            self._session_token = None
+
+        super(Connect, self).close()
+
+    def stats(self):
+        """Retrieve the metrics recorded for each API endpoint called through this connection. Object IDs in the endpoint are replaced
+        by `{id}` so every object of a type shares the metrics of its endpoint. Use `metrics.prometheus()` to export the same metrics
+        in the Prometheus text format.
+
+        Returns:
+            dict -- The `calls`, `errors`, `error_rate`, `errors_by_class`, `retries`, `request_bytes`, `response_bytes` and `latency` (`mean`, `min`, `max`, `p50`, `p95` and `p99` in seconds) of each endpoint keyed by the call type and endpoint (ex. `GET /v1/vmware/vm/{id}`), or an empty dict when `enable_metrics` is `False`.
+        """
+
+        if self.metrics is None:
+            return {}
+
+        return self.metrics.stats()
+
+    def log(self, log_message, *args):
+        """Create properly formatted debug log messages. The message is only formatted when the `logging_level` of the connection
+        is enabled.
 
         Arguments:
             log_message {str} -- The message to pass to the debug log.
+            args {tuple} -- Optional values merged into `log_message` with %-style formatting.
         """
 
-        log = logging.getLogger(__name__)
+        if _logger.isEnabledFor(self._log_level):
+            _logger.log(self._log_level, log_message, *args)
 
-        set_logging = {
-            "debug": log.debug,
-            "critical": log.critical,
-            "error": log.error,
-            "warning": log.warning,
-            "info": log.info
+    def _log_enabled(self):
+        """Internal method used to skip building expensive log messages that would not be emitted.
 
-        }
-        set_logging[self.logging_level](log_message)
+        Returns:
+            bool -- `True` when messages logged through `log()` are emitted.
+        """
 
-    def _authorization_header(self):
-        """Internal method used to create the authorization header used in the API calls.
+        return _logger.isEnabledFor(self._log_level)
+
+    def __setattr__(self, name, value):
+        # Rebuild the cached request headers the next time they are used
+        if name in _HEADER_ATTRIBUTES:
+            self.__dict__["_cached_headers"] = None
+        object.__setattr__(self, name, value)
+
+    def _request_headers(self):
+        """Internal method used to build the request headers that do not change between API calls. They are built once and only
+        rebuilt after the `platform` or the credentials of the connection change.
 
         Returns:
-            dict -- The authorization header that utilizes Basic authentication.
+            tuple -- The header without authorization and the header with authorization. (header, authorization_header)
         """
 
+        cached_headers = self.__dict__.get("_cached_headers")
+        if cached_headers is not None:
+            return cached_headers
+
         user_agent = "RubrikPythonSDK--{}--{}".format(
             self.sdk_version, self.python_version)
         if self.platform != "":
             user_agent = user_agent + '--' + self.platform
 
-        self.log("User Agent: {}".format(user_agent))
+        self.log("User Agent: %s", user_agent)
 
-        authorization_header = {
+        header = {
             'Content-Type': 'application/json',
             'Accept': 'application/json',
             'User-Agent': user_agent,
-            'rk-integration': self.function_name
         }
 
+        authorization_header = dict(header)
+
         if self.api_token is None:
             credentials = '{}:{}'.format(self.username, self.password)
 
@@ -247,8 +399,86 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
             authorization_header["Authorization"] = 'Bearer {}'.format(
                 self.api_token)
 
+        # Requests sent directly through the pooled session also carry the static headers
+        session = self.__dict__.get("_session")
+        if isinstance(session, requests.Session):
+            session.headers.update(header)
+
+        cached_headers = (header, authorization_header)
+        self.__dict__["_cached_headers"] = cached_headers
+        return cached_headers
+
+    def _authorization_header(self, session_token=True):
+        """Internal method used to create the authorization header used in the API calls.
+
+        Keyword Arguments:
+            session_token {bool} -- Flag that determines whether the session token is sent, when session tokens are enabled, instead of the username and password. (default: {True})
+
+        Returns:
+            dict -- The authorization header that utilizes Basic authentication.
+        """
+
+        authorization_header = dict(self._request_headers()[1])
+        authorization_header['rk-integration'] = self.function_name
+
+        if session_token and self._uses_session_token():
+            authorization_header["Authorization"] = 'Bearer {}'.format(self._valid_session_token())
+
         return authorization_header
 
+    def _uses_session_token(self):
+        """Internal method used to determine whether API calls authenticate with a session token.
+
+        Returns:
+            bool -- `True` when `use_session_token` is enabled and the connection authenticates with a username and password.
+        """
+
+        return self.use_session_token and self.api_token is None
+
+    def _valid_session_token(self):
+        """Internal method used to return the current session token, creating a new one when none exists or the
+        `session_token_refresh` interval has elapsed.
+
+        Returns:
+            str -- The session token.
+        """
+
+        session_token = self._session_token
+        if session_token is not None and _monotonic() < self._session_token_expires:
+            return session_token
+
+        with self._session_token_lock:
+            # Another thread may have created the session token while this one was waiting
+            if self._session_token is None or _monotonic() >= self._session_token_expires:
+                self.log("Creating a new session token.")
+                api_request = self._common_api('POST', 'v1', '/session', config={}, authentication=BASIC_AUTHENTICATION)
+                self._session_token = api_request["token"]
+                self._session_token_expires = _monotonic() + self.session_token_refresh
+
+            return self._session_token
+
+    def _reauthenticate(self, authentication, header):
+        """Internal method used to discard a session token rejected by the Rubrik cluster.
+
+        Arguments:
+            authentication {bool} -- The authentication used by the rejected API call.
+            header {dict} -- The header sent with the rejected API call.
+
+        Returns:
+            bool -- `True` when the API call should be sent again with a new session token.
+        """
+
+        if authentication is not True or not self._uses_session_token():
+            return False
+
+        with self._session_token_lock:
+            # Only discard the token when another thread has not already replaced it
+            if header.get("Authorization") == 'Bearer {}'.format(self._session_token):
+                self.log("The session token was rejected by the Rubrik cluster.")
+                self._session_token = None
+
+        return True
+
     def _header(self):
         """Internal method used to create the a header without authorization used in the API calls.
 
@@ -256,20 +486,10 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
             dict -- The header that does not include any authorization.
         """
 
-        user_agent = "RubrikPythonSDK--{}--{}".format(
-            self.sdk_version, self.python_version)
-        if self.platform != "":
-            user_agent = user_agent + '--' + self.platform
+        header = dict(self._request_headers()[0])
+        header['rk-integration'] = self.function_name
 
-        header = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'User-Agent': user_agent,
-            'rk-integration': self.function_name
-
-        }
-
-        self.log("Header: {}".format(header))
+        self.log("Header: %s", header)
         return header
 
     @staticmethod
@@ -320,6 +540,7 @@ class Connect(Cluster, Data_Management, Physical, Cloud, Organization):
         self.platform = platform_user_agent
 
 
+@scoped_function_names
 class Bootstrap(Api):
     """This class contains all functions related to the Bootstrapping of a Rubrik Cluster.
 
@@ -327,8 +548,14 @@ class Bootstrap(Api):
         Api {class} - This class contains the base API methods that can be called independently or internally in standalone functions.
     """
 
-    def __init__(self, node_ip, interface=None, enable_logging=False):
+    def __init__(self, node_ip, interface=None, enable_logging=False, pool_connections=10, pool_maxsize=10, keep_alive=True, retry_policy=None):
         """Constructor for the Bootstrap class which is used to initialize the class variables.
+
+        Keyword Arguments:
+            pool_connections {int} -- The number of connection pools (one per Rubrik node) the HTTP session will cache. (default: {10})
+            pool_maxsize {int} -- The maximum number of connections the HTTP session will keep open to a single Rubrik node. (default: {10})
+            keep_alive {bool} -- Flag that determines whether connections to the Rubrik cluster are reused across API calls. (default: {True})
+            retry_policy {RetryPolicy} -- The policy used to retry API calls that fail with a transient error, such as a `503 Service Unavailable` response. By default failed API calls are not retried. (default: {None})
         """
         if enable_logging:
             logging.getLogger().setLevel(logging.DEBUG)
@@ -406,6 +633,17 @@ class Bootstrap(Api):
         # Optional value to define the Platform using the SDK (Ex. Ansible)
         self.platform = ""
 
+        if retry_policy is not None and not isinstance(retry_policy, RetryPolicy):
+            raise InvalidTypeException("The retry_policy argument must be a RetryPolicy.")
+        self.retry_policy = retry_policy
+        self.node_pool = None
+        self.metrics = None
+        self.log_payload_size = None
+        self.json_codec = get_json_codec()
+
+        # Pooled HTTP session shared by every API call
+        self._session = self._create_session(pool_connections, pool_maxsize, keep_alive)
+
     def setup_cluster(self, cluster_name, admin_email, admin_password, management_gateway, management_subnet_mask, node_config, enable_encryption=True, dns_search_domains=None, dns_nameservers=None, ntp_servers=None, wait_for_completion=True, management_vlan=None, ipmi_gateway=None, ipmi_subnet_mask=None, ipmi_vlan=None, node_ipmi_ips=None, data_gateway=None, data_subnet_mask=None, data_vlan=None, node_data_ips=None, timeout=30):  # pylint: ignore
         """Issues a bootstrap request to a specified Rubrik cluster: Edge, Cloud Cluster or Physical nodes
             Edge: no IPMI, no DATA and no Encryption set. One node only. IPv4 or IPv6 possible.
@@ -480,7 +718,7 @@ class Bootstrap(Api):
         bootstrap_config["dnsNameservers"] = dns_nameservers
         bootstrap_config["dnsSearchDomains"] = dns_search_domains
 
-        if float(self.get('v1', '/cluster/me/version', timeout, authentication=False)['version'][:3]) < float(5.0):
+        if parse_cdm_version(self.get('v1', '/cluster/me/version', timeout, authentication=False)['version']) < (5, 0, 0):
             bootstrap_config["ntpServers"] = ntp_servers
         else:
             bootstrap_config["ntpServerConfigs"] = []
@@ -527,38 +765,32 @@ class Bootstrap(Api):
                 if data_vlan is not None:
                     bootstrap_config["nodeConfigs"][node_name]['dataIpConfig']['vlan'] = data_vlan
 
-        number_of_attempts = 1
+        # A node that is still initializing refuses connections, so keep trying every 30 seconds before giving up. The bootstrap
+        # request is only sent again when the connection was refused and the node never received it.
+        bootstrap_retry_policy = RetryPolicy(
+            max_attempts=12, backoff_factor=30, max_backoff=30, jitter=False, retry_status_codes=(), retry_errors=(CONNECTION_ERROR,))
 
         # Get the first node IP address so we can use it to check bootstrap status if IPv6 is disabled.
         self.ipv4_addr = list(node_config.values())[0]
 
-        while True:
-
-            try:
-                self.log('bootstrap: Starting the bootstrap process.')
-                api_request = self.post(
-                    'internal',
-                    '/cluster/me/bootstrap',
-                    bootstrap_config,
-                    timeout,
-                    authentication=False)
-                break
-            except APICallException as bootstrap_error:
-                if "Failed to establish a new connection: [Errno 111] Connection refused" in str(
-                        bootstrap_error):
-                    self.log(
-                        'bootstrap: Connection refused. Waiting 30 seconds for the node to initialize before trying again.')
-                    number_of_attempts += 1
-                    time.sleep(30)
-                elif "Cannot bootstrap from an already bootstrapped node" in str(bootstrap_error):
-                    return "No change required. The Rubrik cluster is already bootstrapped."
-                else:
-                    self.log('bootstrap: Connection refused.')
-                    raise RubrikException(bootstrap_error)
-
-            if number_of_attempts == 12:
-                raise APICallException(
-                    "Unable to establish a connection to the Rubrik cluster.")
+        try:
+            self.log('bootstrap: Starting the bootstrap process.')
+            api_request = self._common_api(
+                'POST',
+                'internal',
+                '/cluster/me/bootstrap',
+                config=bootstrap_config,
+                timeout=timeout,
+                authentication=False,
+                retry_policy=bootstrap_retry_policy)
+        except APICallException as bootstrap_error:
+            if "Cannot bootstrap from an already bootstrapped node" in str(bootstrap_error):
+                return "No change required. The Rubrik cluster is already bootstrapped."
+            elif "Unable to establish a connection to the Rubrik cluster." in str(bootstrap_error):
+                raise
+            else:
+                self.log('bootstrap: Connection refused.')
+                raise RubrikException(bootstrap_error)
 
         request_id = api_request['id']
 
@@ -602,22 +834,33 @@ class Bootstrap(Api):
 
         except APICallException:
             # if connection failed, then try to reconnect on the IPv4 address of one of the nodes
-            ipv4_conn = Connect(node_ip=ipv4_addr, api_token='abcd')
-            api_request = ipv4_conn.get(
-                'internal', bootstrap_status_api_endpoint, timeout=timeout, authentication=False)
+            with Connect(node_ip=ipv4_addr, api_token='abcd') as ipv4_conn:
+                api_request = ipv4_conn.get(
+                    'internal', bootstrap_status_api_endpoint, timeout=timeout, authentication=False)
             return api_request
 
         return api_request
 
     @staticmethod
-    def log(log_message):
+    def log(log_message, *args):
         """Create properly formatted debug log messages.
 
         Arguments:
             log_message {str} - - The message to pass to the debug log.
+            args {tuple} - - Optional values merged into `log_message` with %-style formatting.
         """
-        log = logging.getLogger(__name__)
-        log.debug(log_message)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(log_message, *args)
+
+    @staticmethod
+    def _log_enabled():
+        """Internal method used to skip building expensive log messages that would not be emitted.
+
+        Returns:
+            bool - - `True` when messages logged through `log()` are emitted.
+        """
+
+        return _logger.isEnabledFor(logging.DEBUG)
 
     def _header(self):
         """Internal method used to create the a header without authorization used in the API calls.
@@ -649,7 +892,7 @@ class Bootstrap(Api):
 
             }
 
-        self.log("Header: {}".format(header))
+        self.log("Header: %s", header)
         return header
 
     @staticmethod
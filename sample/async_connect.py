@@ -0,0 +1,13 @@
+import asyncio
+import rubrik_cdm
+
+
+async def main():
+    async with rubrik_cdm.AsyncConnect() as rubrik:
+        vm_names = ["python-sdk-demo-1", "python-sdk-demo-2"]
+        snapshots = await asyncio.gather(*[rubrik.on_demand_snapshot(vm, "vmware") for vm in vm_names])
+
+        for api_response, job_status_url in snapshots:
+            await rubrik.job_status(job_status_url)
+
+asyncio.run(main())
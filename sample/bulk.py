@@ -0,0 +1,13 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect(pool_maxsize=20)
+
+vm_names = ["python-sdk-demo-{}".format(number) for number in range(100)]
+kwargs_list = [{"object_name": vm, "object_type": "vmware"} for vm in vm_names]
+
+# Take an on-demand snapshot of each VM using 20 worker threads and at most 10 new calls per second
+results = rubrik.bulk("on_demand_snapshot", kwargs_list, max_workers=20, rate_limit=10)
+
+for vm, result in zip(vm_names, results):
+    if isinstance(result, Exception):
+        print("{}: {}".format(vm, result))
@@ -0,0 +1,8 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+kwargs_list = [{"object_name": vm, "sla_name": "Gold", "object_type": "vmware"} for vm in ["vm01", "vm02", "vm03"]]
+
+for index, result in rubrik.bulk_as_completed("assign_sla", kwargs_list):
+    print(kwargs_list[index]["object_name"], result)
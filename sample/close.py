@@ -0,0 +1,12 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+cluster_version = rubrik.cluster_version()
+
+# Release all pooled connections to the Rubrik cluster
+rubrik.close()
+
+# Alternatively, use the Connect class as a context manager
+with rubrik_cdm.Connect() as rubrik:
+    cluster_version = rubrik.cluster_version()
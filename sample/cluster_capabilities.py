@@ -0,0 +1,10 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+capabilities = rubrik.cluster_capabilities()
+
+print(capabilities.version_tuple)
+
+if capabilities.minimum_version("5.1"):
+    print("The Rubrik cluster is running CDM 5.1 or later.")
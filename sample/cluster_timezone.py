@@ -0,0 +1,5 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+cluster_timezone = rubrik.cluster_timezone()
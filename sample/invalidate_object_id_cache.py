@@ -0,0 +1,12 @@
+import rubrik_cdm
+
+# Cache the IDs resolved by object_id() for 5 minutes
+rubrik = rubrik_cdm.Connect(object_id_cache_ttl=300)
+
+vm_id = rubrik.object_id("python-sdk-demo", "vmware")
+
+# Remove the cached IDs of every vSphere VM
+removed = rubrik.invalidate_object_id_cache(object_type="vmware")
+
+# Remove every cached ID
+removed = rubrik.invalidate_object_id_cache()
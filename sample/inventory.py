@@ -0,0 +1,21 @@
+import rubrik_cdm
+
+# List the vSphere VMs, physical hosts and SLA Domains once and refresh them every 10 minutes
+rubrik = rubrik_cdm.Connect(inventory_refresh_interval=600, inventory_object_types=["vmware", "physical_host", "sla"])
+
+# Refresh the inventory from a background thread so lookups never wait for a listing
+rubrik.inventory.start()
+
+# Answered from the inventory without an API call
+vm_id = rubrik.object_id("python-sdk-demo", "vmware")
+gold_vms = rubrik.get_sla_objects("Gold", "vmware")
+
+sla_id = rubrik.object_id("Gold", "sla")
+for vm in rubrik.inventory.by_sla("vmware", sla_id):
+    print(vm["name"])
+
+# List the vSphere VMs again now
+print(rubrik.inventory.refresh("vmware"))
+print(rubrik.inventory.stats())
+
+rubrik.close()
@@ -0,0 +1,6 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+for page in rubrik.iter_pages("v1", "/host", page_size=200):
+    print(len(page["data"]))
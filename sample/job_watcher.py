@@ -0,0 +1,16 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+
+def snapshot_complete(future):
+    if future.exception() is None:
+        print(future.result()["status"])
+
+
+with rubrik_cdm.JobWatcher(rubrik, max_interval=60) as watcher:
+    for vm in ["python-sdk-demo-1", "python-sdk-demo-2"]:
+        snapshot, job_status_url = rubrik.on_demand_snapshot(vm, "vmware")
+        watcher.watch(job_status_url, deadline=1800, callback=snapshot_complete)
+
+    print(watcher.stats())
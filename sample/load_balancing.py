@@ -0,0 +1,9 @@
+import rubrik_cdm
+
+# Spread API calls across every node of the Rubrik cluster and resend failed API calls to the next node
+rubrik = rubrik_cdm.Connect(load_balancing="round_robin", retry_policy=rubrik_cdm.RetryPolicy())
+
+vm_names = ["python-sdk-demo-1", "python-sdk-demo-2", "python-sdk-demo-3"]
+snapshots = rubrik.bulk("on_demand_snapshot", [{"object_name": vm, "object_type": "vmware"} for vm in vm_names])
+
+print(rubrik.node_pool.stats())
@@ -0,0 +1,15 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect(object_id_cache_ttl=600)
+
+vm_names = ["vm01", "vm02", "vm03"]
+
+# List the vSphere VMs once to resolve every name
+resolved = rubrik.object_ids(vm_names, "vmware")
+
+print(resolved["ids"])
+print("Missing: {}".format(resolved["missing"]))
+print("Duplicates: {}".format(resolved["duplicates"]))
+
+# The resolved IDs are cached so each on_demand_snapshot() call skips the object_id() lookup
+results = rubrik.bulk("on_demand_snapshot", [{"object_name": vm, "object_type": "vmware"} for vm in resolved["ids"]])
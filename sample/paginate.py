@@ -0,0 +1,7 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+# Iterate over every vSphere VM, requesting 500 VMs per API call
+for vm in rubrik.paginate("v1", "/vmware/vm", params={"is_relic": "false"}, page_size=500, prefetch=True):
+    print(vm["name"])
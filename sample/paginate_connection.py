@@ -0,0 +1,22 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+query = """
+ConnectedHosts($status: String, $first: Int, $after: String) {
+  hostConnection(status: $status, first: $first, after: $after) {
+    nodes {
+      id
+      hostname
+    }
+    pageInfo {
+      endCursor
+      hasNextPage
+    }
+  }
+}
+"""
+
+# Iterate over every connected host, requesting 500 hosts per GraphQL query
+for host in rubrik.paginate_connection(query, "hostConnection", "ConnectedHosts", {"status": "Connected"}, page_size=500):
+    print(host["hostname"])
@@ -0,0 +1,26 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+query = """
+NasAssignedSLA($effectiveSlaDomainId: String) {
+  nasShareConnection(effectiveSlaDomainId: $effectiveSlaDomainId) {
+    nodes {
+      id
+      hostname
+    }
+  }
+}
+"""
+
+sla_names = ["Gold", "Silver", "Bronze"]
+operations = [{"query": query, "variables": {"effectiveSlaDomainId": rubrik.object_id(sla, "sla")}} for sla in sla_names]
+
+# Send every query in a single API call
+results = rubrik.query_batch(operations)
+
+for sla, result in zip(sla_names, results):
+    if isinstance(result, Exception):
+        print("{}: {}".format(sla, result))
+    else:
+        print("{}: {} NAS shares".format(sla, len(result["nasShareConnection"]["nodes"])))
@@ -0,0 +1,10 @@
+import rubrik_cdm
+
+# Retry API calls that fail with a transient error up to 5 times, waiting 1, 2, 4 and 8 seconds (with jitter) between attempts
+retry_policy = rubrik_cdm.RetryPolicy(max_attempts=5, backoff_factor=1)
+
+rubrik = rubrik_cdm.Connect(retry_policy=retry_policy)
+
+cluster_version = rubrik.cluster_version()
+
+print(retry_policy.stats())
@@ -0,0 +1,9 @@
+import rubrik_cdm
+
+# Exchange the username and password for a session token once and release it when the connection is closed
+with rubrik_cdm.Connect(use_session_token=True) as rubrik:
+
+    vm_names = ["python-sdk-demo-1", "python-sdk-demo-2", "python-sdk-demo-3"]
+
+    for vm in vm_names:
+        snapshot = rubrik.on_demand_snapshot(vm, "vmware")
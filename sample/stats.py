@@ -0,0 +1,12 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+rubrik.get_sla_objects("Gold", "vmware")
+rubrik.on_demand_snapshot("python-sdk-demo", "vmware")
+
+for endpoint, stats in rubrik.stats().items():
+    print(endpoint, stats["calls"], stats["error_rate"], stats["latency"]["p95"])
+
+# Expose the metrics to the textfile collector of the Prometheus node exporter
+rubrik.metrics.write_prometheus("/var/lib/node_exporter/textfile_collector/rubrik.prom")
@@ -0,0 +1,14 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+# Parse each page of vSphere VMs incrementally so only one VM is held in memory at a time
+for vm in rubrik.paginate("v1", "/vmware/vm", params={"is_relic": "false"}, page_size=5000, stream=True):
+    print(vm["name"])
+
+# Stream a single response and read the fields that follow the data list
+with rubrik.get("v1", "/host", stream=True) as hosts:
+    for host in hosts:
+        print(host["hostname"])
+
+print(hosts.metadata["total"])
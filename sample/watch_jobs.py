@@ -0,0 +1,9 @@
+import rubrik_cdm
+
+rubrik = rubrik_cdm.Connect()
+
+vm_names = ["python-sdk-demo-1", "python-sdk-demo-2", "python-sdk-demo-3"]
+job_status_urls = [rubrik.on_demand_snapshot(vm, "vmware")[1] for vm in vm_names]
+
+# Wait up to one hour for every snapshot to complete
+results = rubrik.watch_jobs(job_status_urls, deadline=3600)
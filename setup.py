@@ -55,6 +55,14 @@ print(cluster_version)
 * [VIDEO: Getting Start with the Rubrik SDK for Python](https://www.youtube.com/watch?v=TQM60X2_r_c&feature=youtu.be)
 """
 
+install_requires = [
+    'requests >= 2.18.4, != 2.22.0',
+    'python-dateutil',
+    'pytz',
+    # concurrent.futures is only included in the standard library on Python 3
+    'futures; python_version < "3"'
+]
+
 
 setuptools.setup(
     name="rubrik_cdm",
@@ -73,11 +81,11 @@ setuptools.setup(
         "Programming Language :: Python :: 2.7",
         "Programming Language :: Python :: 3.6"
     ],
-    install_requires=[
-        'requests >= 2.18.4, != 2.22.0',
-        'python-dateutil',
-        'pytz'
-    ],
+    install_requires=install_requires,
+    extras_require={
+        'async': ['aiohttp'],
+        'fast': ['orjson']
+    },
     tests_require=[
         'pytest'
     ],
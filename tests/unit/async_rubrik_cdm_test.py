@@ -0,0 +1,206 @@
+import asyncio
+import pytest
+import rubrik_cdm
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException, RubrikException
+
+aiohttp = pytest.importorskip("aiohttp")
+
+
+class MockResponse:
+
+    def __init__(self, status, body, reason="OK"):
+        self.status = status
+        self.reason = reason
+        self.headers = {"Content-Type": "application/json"}
+        self.charset = "utf-8"
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class MockSession:
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+@pytest.fixture
+def async_rubrik():
+
+    return rubrik_cdm.AsyncConnect("10.0.1.1", "user", "password")
+
+
+def test_function_name_per_asyncio_task(mocker):
+
+    rubrik = rubrik_cdm.AsyncConnect("10.0.1.1", "user", "password")
+    function_names = []
+
+    async def mock_get(api_version, api_endpoint, timeout=15, authentication=True, params=None):
+        await asyncio.sleep(0)
+        function_names.append(rubrik.function_name)
+        return {"total": 1, "data": [{"id": "sla_id", "name": "Gold"}], "version": "5.0.1-1280"}
+
+    mocker.patch.object(rubrik, "get", side_effect=mock_get)
+
+    async def main():
+        await asyncio.gather(rubrik.object_id("Gold", "sla"), rubrik.cluster_version())
+
+    asyncio.run(main())
+
+    assert sorted(function_names) == ["cluster_version", "object_id"]
+
+
+def test_async_connect_pool_settings():
+    rubrik = rubrik_cdm.AsyncConnect("10.0.1.1", "user", "password", pool_connections=4, pool_maxsize=25, keep_alive=False)
+
+    assert rubrik._session is None
+    assert rubrik._session_settings == {"limit": 100, "limit_per_host": 25, "force_close": True}
+
+
+def test_async_connect_requires_async_with(async_rubrik):
+    with pytest.raises(RubrikException):
+        with async_rubrik:
+            pass
+
+
+def test_async_common_api(async_rubrik, mocker):
+    session = MockSession(response=MockResponse(200, b'{"version": "5.0.1-1280"}'))
+    mocker.patch.object(async_rubrik, "_get_session", return_value=session)
+
+    assert asyncio.run(async_rubrik.get("v1", "/cluster/me/version")) == {"version": "5.0.1-1280"}
+
+    method, url, kwargs = session.requests[0]
+    assert method == "GET"
+    assert url == "https://10.0.1.1/api/v1/cluster/me/version"
+    assert kwargs["headers"]["Authorization"].startswith("Basic ")
+
+
+def test_async_common_api_error_response(async_rubrik, mocker):
+    session = MockSession(response=MockResponse(404, b'{"message": "Not found"}', reason="Not Found"))
+    mocker.patch.object(async_rubrik, "_get_session", return_value=session)
+
+    with pytest.raises(APICallException):
+        asyncio.run(async_rubrik.get("v1", "/cluster/me/version"))
+
+
+def test_async_common_api_client_error(async_rubrik, mocker):
+    session = MockSession(error=aiohttp.ClientError("error"))
+    mocker.patch.object(async_rubrik, "_get_session", return_value=session)
+
+    with pytest.raises(APICallException):
+        asyncio.run(async_rubrik.get("v1", "/cluster/me/version"))
+
+
+def test_async_query_batch(async_rubrik, mocker):
+    session = MockSession(response=MockResponse(200, b'{"data": {"q0_cluster": {"version": "5.3.0"}, "q1_cluster": {"version": "5.3.0"}}}'))
+    mocker.patch.object(async_rubrik, "_get_session", return_value=session)
+
+    query = '{ cluster(id: "me") { version } }'
+    results = asyncio.run(async_rubrik.query_batch([{"query": query}, {"query": query}]))
+
+    assert results == [{"cluster": {"version": "5.3.0"}}, {"cluster": {"version": "5.3.0"}}]
+    assert len(session.requests) == 1
+
+
+def test_async_object_id(async_rubrik, mocker):
+    mock_get = mocker.patch("rubrik_cdm.AsyncConnect.get", new_callable=mocker.AsyncMock)
+    mock_get.return_value = {"total": 1, "data": [{"id": "VirtualMachine:::vm01", "name": "vm01"}]}
+
+    assert asyncio.run(async_rubrik.object_id("vm01", "vmware")) == "VirtualMachine:::vm01"
+
+
+def test_async_on_demand_snapshot(async_rubrik, mocker):
+    mock_get = mocker.patch("rubrik_cdm.AsyncConnect.get", new_callable=mocker.AsyncMock)
+    mock_get.side_effect = [
+        {"total": 1, "data": [{"id": "VirtualMachine:::vm01", "name": "vm01"}]},
+        {"effectiveSlaDomainId": "sla_id"},
+    ]
+    mock_post = mocker.patch("rubrik_cdm.AsyncConnect.post", new_callable=mocker.AsyncMock)
+    mock_post.return_value = {"links": [{"href": "job_status_url"}]}
+
+    api_request, job_status_url = asyncio.run(async_rubrik.on_demand_snapshot("vm01", "vmware"))
+
+    assert job_status_url == "job_status_url"
+    mock_post.assert_awaited_once_with("v1", "/vmware/vm/VirtualMachine:::vm01/snapshot", {"slaId": "sla_id"}, 15)
+
+
+def test_async_on_demand_snapshot_invalid_object_type(async_rubrik):
+    with pytest.raises(InvalidParameterException):
+        asyncio.run(async_rubrik.on_demand_snapshot("vm01", "mssql_db"))
+
+
+def test_async_get_sla_objects(async_rubrik, mocker):
+    mock_get = mocker.patch("rubrik_cdm.AsyncConnect.get", new_callable=mocker.AsyncMock)
+    mock_get.side_effect = [
+        {"total": 1, "data": [{"id": "sla_id", "name": "Gold"}]},
+        {"total": 2, "data": [{"id": "vm01_id", "name": "vm01"}, {"id": "vm02_id", "name": "vm02"}]},
+    ]
+
+    assert asyncio.run(async_rubrik.get_sla_objects("Gold", "vmware")) == {"vm01": "vm01_id", "vm02": "vm02_id"}
+
+
+def test_async_get_sla_objects_pages(async_rubrik, mocker):
+    mocker.patch("rubrik_cdm.AsyncConnect.object_id", new_callable=mocker.AsyncMock, return_value="sla_id")
+    mock_get = mocker.patch("rubrik_cdm.AsyncConnect.get", new_callable=mocker.AsyncMock)
+    mock_get.side_effect = [
+        {"hasMore": True, "total": 3, "data": [{"id": "vm01_id", "name": "vm01"}, {"id": "vm02_id", "name": "vm02"}]},
+        {"hasMore": False, "total": 3, "data": [{"id": "vm03_id", "name": "vm03"}]},
+    ]
+
+    assert asyncio.run(async_rubrik.get_sla_objects("Gold", "vmware", page_size=2)) == {"vm01": "vm01_id", "vm02": "vm02_id", "vm03": "vm03_id"}
+    assert [call[1]["params"] for call in mock_get.call_args_list] == [{"limit": 2, "offset": 0}, {"limit": 2, "offset": 2}]
+
+
+def test_async_get_sla_objects_graphql_connection(async_rubrik, mocker):
+    mocker.patch("rubrik_cdm.AsyncConnect.object_id", new_callable=mocker.AsyncMock, return_value="sla_id")
+    mock_query = mocker.patch("rubrik_cdm.AsyncConnect.query", new_callable=mocker.AsyncMock)
+    mock_query.side_effect = [
+        {"hostConnection": {"nodes": [{"id": "host01_id", "hostname": "host01"}], "pageInfo": {"endCursor": "abc", "hasNextPage": True}}},
+        {"hostConnection": {"nodes": [{"id": "host02_id", "hostname": "host02"}], "pageInfo": {"endCursor": "def", "hasNextPage": False}}},
+    ]
+
+    assert asyncio.run(async_rubrik.get_sla_objects("Gold", "windows_host", page_size=1)) == {"host01": "host01_id", "host02": "host02_id"}
+    assert mock_query.call_args_list[1][0][2]["after"] == "abc"
+
+
+def test_async_common_api_retry_policy(mocker):
+    async_rubrik = rubrik_cdm.AsyncConnect("10.0.1.1", "user", "password", retry_policy=rubrik_cdm.RetryPolicy(jitter=False))
+    session = MockSession(response=MockResponse(200, b'{"version": "5.0.1-1280"}'))
+    session.request = mocker.Mock(side_effect=[
+        MockResponse(503, b'{"message": "Service Unavailable"}', reason="Service Unavailable"),
+        session.response,
+    ])
+    mocker.patch.object(async_rubrik, "_get_session", return_value=session)
+    mock_sleep = mocker.patch("rubrik_cdm.async_api.asyncio.sleep", new_callable=mocker.AsyncMock)
+
+    assert asyncio.run(async_rubrik.get("v1", "/cluster/me/version")) == {"version": "5.0.1-1280"}
+    assert session.request.call_count == 2
+    mock_sleep.assert_awaited_once_with(0.5)
+
+
+def test_async_common_api_records_metrics(async_rubrik, mocker):
+    session = MockSession(response=MockResponse(404, b'{"message": "Not found"}', reason="Not Found"))
+    mocker.patch.object(async_rubrik, "_get_session", return_value=session)
+
+    with pytest.raises(APICallException):
+        asyncio.run(async_rubrik.get("v1", "/vmware/vm/VirtualMachine:::1"))
+
+    stats = async_rubrik.stats()["GET /v1/vmware/vm/{id}"]
+    assert stats["calls"] == 1
+    assert stats["errors_by_class"] == {"404": 1}
+    assert stats["response_bytes"] == 24
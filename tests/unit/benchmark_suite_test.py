@@ -0,0 +1,50 @@
+import shutil
+import pytest
+from benchmarks import suite
+
+
+def test_statistics():
+    stats = suite.statistics([0.4, 0.1, 0.3, 0.2])
+
+    assert stats["min"] == 0.1
+    assert stats["max"] == 0.4
+    assert stats["median"] == pytest.approx(0.25)
+    assert stats["p95"] == 0.4
+    assert stats["rounds"] == 4
+    assert stats["ops"] == pytest.approx(4)
+
+
+def test_measure_min_rounds():
+    calls = []
+
+    samples, result = suite.measure(lambda: calls.append(1) or len(calls), min_rounds=3, max_time=0)
+
+    assert len(samples) == 3
+    assert result == 4
+
+
+def test_compare():
+    baseline = {"benchmarks": [
+        {"name": "get", "stats": {"median": 0.001}},
+        {"name": "object_id[1000]", "stats": {"median": 0.004}},
+    ]}
+    results = [
+        {"name": "get", "stats": {"median": 0.0015}},
+        {"name": "object_id[1000]", "stats": {"median": 0.003}},
+        {"name": "paginate[1000]", "stats": {"median": 0.01}},
+    ]
+
+    comparison = suite.compare(baseline, results, threshold=0.1)
+
+    assert [(item["name"], item["regression"]) for item in comparison] == [("get", True), ("object_id[1000]", False)]
+    assert comparison[0]["change"] == pytest.approx(0.5)
+
+
+@pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl is required to generate a certificate")
+def test_run(capsys):
+    results = suite.run(sizes=[100], min_rounds=1, max_time=0, name_filter="^(get|object_id|paginate)$")
+
+    assert [result["name"] for result in results] == ["get", "object_id[100]", "paginate[100]"]
+    assert results[1]["params"] == {"inventory_size": 100}
+    assert results[1]["extra_info"]["api_calls"] == 1
+    assert results[2]["extra_info"]["items"] == 100
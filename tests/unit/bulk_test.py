@@ -0,0 +1,91 @@
+import threading
+import pytest
+from rubrik_cdm import bulk
+from rubrik_cdm.bulk import RateLimiter
+from rubrik_cdm.exceptions import InvalidParameterException, InvalidTypeException
+
+
+def test_bulk_results_in_input_order(rubrik, mocker):
+
+    def mock_object_id(self, object_name, object_type, timeout=15):
+        if object_name == "missing":
+            raise InvalidParameterException("The vmware object 'missing' was not found on the Rubrik cluster.")
+        return "{}_id".format(object_name)
+
+    mocker.patch('rubrik_cdm.Connect.object_id', autospec=True, side_effect=mock_object_id)
+
+    kwargs_list = [{"object_name": name, "object_type": "vmware"} for name in ["vm01", "missing", "vm03"]]
+
+    results = rubrik.bulk("object_id", kwargs_list, max_workers=3)
+
+    assert results[0] == "vm01_id"
+    assert isinstance(results[1], InvalidParameterException)
+    assert results[2] == "vm03_id"
+
+
+def test_bulk_as_completed(rubrik, mocker):
+
+    mock_object_id = mocker.patch('rubrik_cdm.Connect.object_id', autospec=True)
+    mock_object_id.side_effect = lambda self, object_name, object_type: object_name
+
+    kwargs_list = [{"object_name": "vm{}".format(index), "object_type": "vmware"} for index in range(20)]
+
+    results = dict(rubrik.bulk_as_completed("object_id", kwargs_list, max_workers=4))
+
+    assert results == {index: "vm{}".format(index) for index in range(20)}
+
+
+def test_bulk_function_name_per_thread(rubrik, mocker):
+
+    function_names = []
+    lock = threading.Lock()
+
+    def mock_get(self, api_version, api_endpoint, timeout=15, authentication=True, params=None):
+        with lock:
+            function_names.append(self.function_name)
+        return {"total": 1, "data": [{"id": "string_id", "name": "string"}]}
+
+    mocker.patch('rubrik_cdm.Connect.get', autospec=True, side_effect=mock_get)
+
+    rubrik.function_name = "main_thread"
+
+    rubrik.bulk("object_id", [{"object_name": "string", "object_type": "vcenter"}] * 8, max_workers=2)
+    rubrik.bulk("get_sla_objects", [{"sla": "string", "object_type": "vmware"}] * 4, max_workers=2)
+
+    assert function_names[:8] == ["object_id"] * 8
+    assert set(function_names[8:]) == {"get_sla_objects"}
+    assert rubrik.function_name == "main_thread"
+
+    rubrik.function_name = ""
+
+
+def test_rate_limiter(mocker):
+
+    mocker.patch.object(bulk, "_monotonic", return_value=100.0)
+    mock_sleep = mocker.patch.object(bulk.time, "sleep")
+
+    rate_limiter = RateLimiter(4)
+
+    rate_limiter.wait()
+    rate_limiter.wait()
+    rate_limiter.wait()
+
+    assert [call[0][0] for call in mock_sleep.call_args_list] == [0.25, 0.5]
+
+
+@pytest.mark.parametrize('method_name, kwargs_list, max_workers, rate_limit, error', [
+    (None, [], 10, None, InvalidTypeException),
+    ("not_a_function", [], 10, None, InvalidParameterException),
+    ("_common_api", [], 10, None, InvalidParameterException),
+    ("bulk", [], 10, None, InvalidParameterException),
+    ("object_id", {}, 10, None, InvalidTypeException),
+    ("object_id", ["vm01"], 10, None, InvalidTypeException),
+    ("object_id", [], "10", None, InvalidTypeException),
+    ("object_id", [], 0, None, InvalidParameterException),
+    ("object_id", [], 10, "1", InvalidTypeException),
+    ("object_id", [], 10, 0, InvalidParameterException),
+])
+def test_bulk_invalid_parameters(rubrik, method_name, kwargs_list, max_workers, rate_limit, error):
+
+    with pytest.raises(error):
+        rubrik.bulk(method_name, kwargs_list, max_workers, rate_limit)
@@ -0,0 +1,72 @@
+import pytest
+from rubrik_cdm import cache
+from rubrik_cdm.cache import TTLCache
+from rubrik_cdm.exceptions import InvalidParameterException, InvalidTypeException
+
+
+def test_ttl_cache_disabled():
+    object_cache = TTLCache()
+
+    object_cache.set("key", "value")
+
+    assert object_cache.enabled is False
+    assert object_cache.get("key") is None
+    assert len(object_cache) == 0
+
+
+def test_ttl_cache_hit_and_miss():
+    object_cache = TTLCache(ttl=60)
+
+    assert object_cache.get("key") is None
+    object_cache.set("key", "value")
+
+    assert object_cache.get("key") == "value"
+    assert object_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_ttl_cache_expiry(mocker):
+    mock_monotonic = mocker.patch.object(cache, "_monotonic")
+    mock_monotonic.return_value = 100
+    object_cache = TTLCache(ttl=60)
+
+    object_cache.set("key", "value")
+    mock_monotonic.return_value = 160
+
+    assert object_cache.get("key") is None
+    assert len(object_cache) == 0
+
+
+def test_ttl_cache_lru_eviction():
+    object_cache = TTLCache(ttl=60, max_size=2)
+
+    object_cache.set("first", 1)
+    object_cache.set("second", 2)
+    object_cache.get("first")
+    object_cache.set("third", 3)
+
+    assert object_cache.get("second") is None
+    assert object_cache.get("first") == 1
+    assert object_cache.get("third") == 3
+
+
+def test_ttl_cache_invalidate():
+    object_cache = TTLCache(ttl=60)
+
+    object_cache.set(("vmware", "vm01"), 1)
+    object_cache.set(("sla", "gold"), 2)
+
+    assert object_cache.invalidate(lambda key: key[0] == "sla") == 1
+    assert object_cache.get(("vmware", "vm01")) == 1
+    assert object_cache.invalidate() == 1
+    assert len(object_cache) == 0
+
+
+@pytest.mark.parametrize("ttl, max_size, error", [
+    ("60", 1024, InvalidTypeException),
+    (60, 10.5, InvalidTypeException),
+    (-1, 1024, InvalidParameterException),
+    (60, 0, InvalidParameterException),
+])
+def test_ttl_cache_invalid_settings(ttl, max_size, error):
+    with pytest.raises(error):
+        TTLCache(ttl, max_size)
@@ -0,0 +1,41 @@
+import pytest
+from rubrik_cdm.capabilities import ClusterCapabilities, parse_cdm_version
+from rubrik_cdm.exceptions import InvalidParameterException
+
+
+@pytest.mark.parametrize("version, version_tuple", [
+    ("5.0.1-1280", (5, 0, 1)),
+    ("5.0", (5, 0, 0)),
+    (5.0, (5, 0, 0)),
+    (4.2, (4, 2, 0)),
+    ("5.10.2-p1-2345", (5, 10, 2)),
+])
+def test_parse_cdm_version(version, version_tuple):
+    assert parse_cdm_version(version) == version_tuple
+
+
+def test_parse_cdm_version_invalid():
+    with pytest.raises(InvalidParameterException):
+        parse_cdm_version("latest")
+
+
+def test_cluster_capabilities_minimum_version():
+    capabilities = ClusterCapabilities("5.10.1-1280")
+
+    assert capabilities.minimum_version("5.2") is True
+    assert capabilities.minimum_version("5.10.1") is True
+    assert capabilities.minimum_version("5.10.2") is False
+
+
+@pytest.mark.parametrize("version, api_token, name_field, cloud_native", [
+    ("4.1.2-2366", False, "hostname", False),
+    ("4.2.0-1234", False, "hostname", True),
+    ("5.0.1-1280", True, "name", True),
+])
+def test_cluster_capabilities_features(version, api_token, name_field, cloud_native):
+    capabilities = ClusterCapabilities(version)
+
+    assert capabilities.api_token is api_token
+    assert capabilities.sla_v2 is api_token
+    assert capabilities.physical_host_name_field == name_field
+    assert capabilities.cloud_native_protection is cloud_native
@@ -39,6 +39,58 @@ def test_minimum_installed_cdm_version_not_met(rubrik, mocker):
     assert rubrik.minimum_installed_cdm_version("5.2") is False
 
 
+def test_cluster_version_cached(mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {'version': '5.0.1-1280'}
+
+    rubrik = Connect("10.0.1.1", "user", "password")
+
+    assert rubrik.cluster_version() == "5.0.1-1280"
+    assert rubrik.minimum_installed_cdm_version("5.0") is True
+    assert rubrik.cluster_capabilities().version_tuple == (5, 0, 1)
+    assert mock_get.call_count == 1
+
+    mock_get.return_value = {'version': '5.1.0-1000'}
+
+    assert rubrik.cluster_version(refresh=True) == "5.1.0-1000"
+    assert rubrik.cluster_capabilities().version_tuple == (5, 1, 0)
+    assert mock_get.call_count == 2
+
+
+def test_cluster_version_refresh_interval(mocker):
+
+    mock_monotonic = mocker.patch('rubrik_cdm.cluster._monotonic')
+    mock_monotonic.return_value = 100
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {'version': '5.0.1-1280'}
+
+    rubrik = Connect("10.0.1.1", "user", "password", cluster_version_refresh=60)
+
+    rubrik.cluster_version()
+    mock_monotonic.return_value = 159
+    rubrik.cluster_version()
+
+    assert mock_get.call_count == 1
+
+    mock_monotonic.return_value = 160
+    rubrik.cluster_version()
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize("cluster_version_refresh, error", [
+    ("60", InvalidTypeException),
+    (-1, InvalidParameterException),
+])
+def test_cluster_version_refresh_invalid(cluster_version_refresh, error):
+    with pytest.raises(error):
+        Connect("10.0.1.1", "user", "password", cluster_version_refresh=cluster_version_refresh)
+
+
 def test_cluster_node_ip(rubrik, mocker):
 
     def mock_internal_cluster_me_node():
@@ -504,6 +556,28 @@ def test_configure_timezone(rubrik, mocker):
         "America/Chicago") == mock_patch_v1_cluster_me()
 
 
+def test_cluster_timezone_cached(mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"timezone": {"timezone": "America/Denver"}}
+
+    mock_patch = mocker.patch(
+        'rubrik_cdm.Connect.patch', autospec=True, spec_set=True)
+    mock_patch.return_value = {"timezone": {"timezone": "America/Chicago"}}
+
+    rubrik = Connect("10.0.1.1", "user", "password")
+
+    assert rubrik.cluster_timezone() == "America/Denver"
+    assert rubrik.cluster_timezone() == "America/Denver"
+    assert mock_get.call_count == 1
+
+    rubrik.configure_timezone("America/Chicago")
+
+    assert rubrik.cluster_timezone() == "America/Chicago"
+    assert mock_get.call_count == 2
+
+
 def test_configure_ntp_invalid_type(rubrik):
 
     with pytest.raises(InvalidTypeException):
@@ -1,8 +1,47 @@
+import io
+import json
+import sys
 import pytest
+import requests
 import rubrik_cdm
 
+# The asyncio client and its tests use syntax that is only available on Python 3.7+
+collect_ignore = []
+if sys.version_info < (3, 7):
+    collect_ignore.append("async_rubrik_cdm_test.py")
+
 
 @pytest.fixture(scope='module')
 def rubrik():
 
     return rubrik_cdm.Connect("10.0.1.1", "user", "password", enable_logging=True)
+
+
+def mock_response(mocker, status_code, json_body=None, headers=None):
+    """Return a mocked `requests.Response` whose body is `json_body` encoded as JSON."""
+
+    response = mocker.Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response._content = json.dumps(json_body).encode("utf-8") if json_body is not None else b""
+    response.text = response._content.decode("utf-8")
+    response.json.return_value = json_body if json_body is not None else {}
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+def requests_response(status_code, body, stream=False):
+    """Return a real `requests.Response`. The body is encoded as JSON unless it is already `bytes`, and is only read from the
+    underlying connection when `stream` is True."""
+
+    content = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = "utf-8"
+    if stream:
+        response.raw = io.BytesIO(content)
+    else:
+        response._content = content
+    return response
@@ -0,0 +1,86 @@
+import threading
+import rubrik_cdm
+from rubrik_cdm.context import _ThreadLocalVar
+
+
+def test_function_name_cleared_after_call(rubrik, mocker):
+
+    function_names = []
+
+    def mock_get(self, api_version, api_endpoint, timeout=15, authentication=True, params=None):
+        function_names.append(self._authorization_header()['rk-integration'])
+        return {"total": 1, "data": [{"id": "string_id", "name": "string"}]}
+
+    mocker.patch('rubrik_cdm.Connect.get', autospec=True, side_effect=mock_get)
+
+    rubrik.object_id("string", "vcenter")
+    assert rubrik.function_name == ""
+
+    rubrik.get_all_hosts()
+    assert rubrik.function_name == ""
+
+    assert function_names == ["object_id", "get_all_hosts"]
+
+
+def test_function_name_during_generator_iteration(rubrik, mocker):
+
+    function_names = []
+
+    def mock_get(self, api_version, api_endpoint, timeout=15, authentication=True, params=None):
+        function_names.append(self._authorization_header()['rk-integration'])
+        return {"hasMore": params["offset"] == 0, "data": [{"id": params["offset"]}]}
+
+    mocker.patch('rubrik_cdm.Connect.get', autospec=True, side_effect=mock_get)
+
+    for _ in rubrik.paginate('v1', '/vmware/vm', page_size=1):
+        assert rubrik.function_name == ""
+
+    assert function_names == ["paginate", "paginate"]
+
+
+def test_function_name_per_thread(rubrik):
+
+    ready = [threading.Event(), threading.Event()]
+    both_set = threading.Event()
+    function_names = {}
+
+    def worker(index, function_name):
+        rubrik.function_name = function_name
+        ready[index].set()
+        both_set.wait(5)
+        function_names[function_name] = rubrik._header()['rk-integration']
+
+    threads = [threading.Thread(target=worker, args=(index, name)) for index, name in enumerate(["assign_sla", "on_demand_snapshot"])]
+    for thread in threads:
+        thread.start()
+    for event in ready:
+        event.wait(5)
+    both_set.set()
+    for thread in threads:
+        thread.join()
+
+    assert function_names == {"assign_sla": "assign_sla", "on_demand_snapshot": "on_demand_snapshot"}
+    assert rubrik.function_name == ""
+
+
+def test_scoped_function_names():
+    assert hasattr(rubrik_cdm.Connect.object_id, "__wrapped__")
+    assert not hasattr(rubrik_cdm.Connect.log, "__wrapped__")
+    assert not hasattr(rubrik_cdm.Connect._common_api, "__wrapped__")
+    assert isinstance(rubrik_cdm.Bootstrap.__dict__["log"], staticmethod)
+
+
+def test_thread_local_var():
+    variable = _ThreadLocalVar("")
+
+    token = variable.set("object_id")
+    assert variable.get() == "object_id"
+
+    values = []
+    thread = threading.Thread(target=lambda: values.append(variable.get()))
+    thread.start()
+    thread.join()
+    assert values == [""]
+
+    variable.reset(token)
+    assert variable.get() == ""
@@ -1,6 +1,7 @@
 import pytest
 from rubrik_cdm.exceptions import InvalidParameterException, CDMVersionException, InvalidTypeException
 from rubrik_cdm import Connect
+from .conftest import requests_response
 
 
 def test_on_demand_snapshot_invalid_object_type(rubrik):
@@ -2686,6 +2687,224 @@ def test_object_id_vcenter(rubrik, mocker):
     assert rubrik.object_id("string", "vcenter") == "string_id"
 
 
+def test_object_id_cache(mocker):
+
+    def mock_get_v1_vmware_vcenter():
+        return {
+            "hasMore": False,
+            "data": [
+                {
+                    "id": "string_id",
+                    "name": "string",
+                }
+            ],
+            "total": 1
+        }
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = mock_get_v1_vmware_vcenter()
+
+    rubrik = Connect("10.0.1.1", "user", "password", object_id_cache_ttl=60)
+
+    assert rubrik.object_id("string", "vcenter") == "string_id"
+    assert rubrik.object_id("STRING", "vcenter") == "string_id"
+    assert mock_get.call_count == 1
+    assert rubrik.object_id_cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    assert rubrik.invalidate_object_id_cache(object_type="vmware") == 0
+    assert rubrik.invalidate_object_id_cache("string", "vcenter") == 1
+
+    assert rubrik.object_id("string", "vcenter") == "string_id"
+    assert mock_get.call_count == 2
+
+
+def test_object_id_cache_hit_log_is_deferred(mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": False, "data": [{"id": "string_id", "name": "string"}], "total": 1}
+
+    rubrik = Connect("10.0.1.1", "user", "password", object_id_cache_ttl=60)
+    rubrik.object_id("string", "vcenter")
+    mock_log = mocker.patch.object(rubrik, "log")
+
+    assert rubrik.object_id("string", "vcenter") == "string_id"
+    mock_log.assert_called_once_with("object_id: Using the cached object id for the %s object '%s'.", "vcenter", "string")
+
+
+def test_object_id_cache_disabled_by_default(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": False, "data": [{"id": "string_id", "name": "string"}], "total": 1}
+
+    rubrik.object_id("string", "vcenter")
+    rubrik.object_id("string", "vcenter")
+
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.parametrize("object_type, api_endpoint", [
+    ("vmware_host", "/vmware/host?primary_cluster_id=local&name=string"),
+    ("vcenter", "/vmware/vcenter?primary_cluster_id=local&name=string"),
+    ("ahv_cluster", "/nutanix/cluster?primary_cluster_id=local&name=string"),
+    ("volume_group", "/volume_group?is_relic=false&hostname=string"),
+])
+def test_object_id_name_filter(rubrik, mocker, object_type, api_endpoint):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": False, "data": [{"id": "string_id", "name": "string", "hostname": "string"}], "total": 1}
+
+    assert rubrik.object_id("string", object_type) == "string_id"
+    assert mock_get.call_args[0][2] == api_endpoint
+
+
+@pytest.mark.parametrize("object_type, api_endpoint", [
+    ("vcenter", "/vmware/vcenter?primary_cluster_id=local&name=R%26D%20%231%2B%25"),
+    ("volume_group", "/volume_group?is_relic=false&hostname=R%26D%20%231%2B%25"),
+])
+def test_object_id_name_filter_quoted(rubrik, mocker, object_type, api_endpoint):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": False, "data": [{"id": "string_id", "name": "R&D #1+%", "hostname": "R&D #1+%"}], "total": 1}
+
+    assert rubrik.object_id("R&D #1+%", object_type) == "string_id"
+    assert mock_get.call_args[0][2] == api_endpoint
+
+
+def test_object_id_mssql_availability_group_page_params(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": False, "data": [{"id": "string_id", "name": "string"}], "total": 1}
+
+    assert rubrik.object_id("string", "mssql_availability_group") == "string_id"
+
+    api_endpoint = mock_get.call_args[0][2]
+    assert "limit=" not in api_endpoint
+    assert "offset=" not in api_endpoint
+    assert mock_get.call_args[1]["params"] == {"limit": 100, "offset": 0}
+
+
+def test_object_id_stops_at_duplicate(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"hasMore": True, "data": [{"id": "string_id", "name": "string"}, {"id": "other_id", "name": "STRING"}], "total": 4},
+        {"hasMore": False, "data": [{"id": "last_id", "name": "string"}], "total": 4},
+    ]
+
+    with pytest.raises(InvalidParameterException) as error:
+        rubrik.object_id("string", "vcenter")
+
+    assert "Multiple vcenter objects named 'string'" in str(error.value)
+    assert mock_get.call_count == 1
+
+
+def test_object_id_share(rubrik, mocker):
+
+    object_id = Connect.object_id
+
+    def mock_object_id(self, object_name, object_type, **kwargs):
+        if object_type == "physical_host":
+            return "host_id"
+        return object_id(self, object_name, object_type, **kwargs)
+
+    mocker.patch('rubrik_cdm.Connect.object_id', autospec=True, side_effect=mock_object_id)
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {
+        "hasMore": False,
+        "data": [
+            {"id": "other_host_share_id", "exportPoint": "/share", "hostId": "other_host_id"},
+            {"id": "share_id", "exportPoint": "/share", "hostId": "host_id"},
+        ],
+        "total": 2}
+
+    assert rubrik.object_id("/share", "share", hostname="nas01", share_type="NFS") == "share_id"
+    assert mock_get.call_args[0][2] == "/host/share?share_type=NFS&host_id=host_id&export_point=/share"
+
+
+def test_object_id_smb_share(rubrik, mocker):
+
+    object_id = Connect.object_id
+
+    def mock_object_id(self, object_name, object_type, **kwargs):
+        if object_type == "physical_host":
+            return "host_id"
+        return object_id(self, object_name, object_type, **kwargs)
+
+    mocker.patch('rubrik_cdm.Connect.object_id', autospec=True, side_effect=mock_object_id)
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": False, "data": [{"id": "share_id", "exportPoint": "\\\\nas01\\R&D", "hostId": "host_id"}], "total": 1}
+
+    assert rubrik.object_id("\\\\nas01\\R&D", "share", hostname="nas01", share_type="SMB") == "share_id"
+    assert mock_get.call_args[0][2] == "/host/share?share_type=SMB&host_id=host_id&export_point=%5C%5Cnas01%5CR%26D"
+
+
+def test_object_id_organization_role_id(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {
+        "hasMore": False,
+        "data": [
+            {"id": "Organization:::1", "name": "Org", "roleId": "role_1"},
+            {"id": "Organization:::2", "name": "org", "roleId": "role_2"},
+        ],
+        "total": 2}
+
+    with pytest.raises(InvalidParameterException):
+        rubrik.object_id("org", "organization_role_id")
+
+    mock_get.return_value["data"][0]["name"] = "Organization"
+
+    assert rubrik.object_id("org", "organization_role_id") == "role_2"
+
+
+def test_object_ids(rubrik, mocker):
+
+    pages = [
+        {"hasMore": True, "data": [{"id": "vm01_id", "name": "vm01"}, {"id": "vm02_id", "name": "VM02"}], "total": 4},
+        {"hasMore": False, "data": [{"id": "vm03_id", "name": "vm03"}, {"id": "vm03_clone_id", "name": "vm03"}], "total": 4},
+    ]
+    mock_request = mocker.patch.object(rubrik._session, "request", side_effect=[requests_response(200, page, stream=True) for page in pages])
+
+    assert rubrik.object_ids(["vm01", "vm02", "vm03", "vm04"], "vmware", page_size=2) == {
+        "ids": {"vm01": "vm01_id", "vm02": "vm02_id"},
+        "missing": ["vm04"],
+        "duplicates": {"vm03": ["vm03_id", "vm03_clone_id"]},
+    }
+    assert mock_request.call_count == 2
+    assert "/api/v1/vmware/vm?primary_cluster_id=local&is_relic=false&limit=2&offset=0" in mock_request.call_args_list[0][0][1]
+
+
+def test_object_ids_populates_object_id_cache(mocker):
+
+    rubrik = Connect("10.0.1.1", "user", "password", object_id_cache_ttl=60)
+    mock_request = mocker.patch.object(rubrik._session, "request", return_value=requests_response(
+        200, {"hasMore": False, "data": [{"id": "gold_id", "name": "Gold"}], "total": 1}, stream=True))
+
+    assert rubrik.object_ids(["gold", "Forever"], "sla")["ids"] == {"gold": "gold_id", "Forever": "UNPROTECTED"}
+    assert rubrik.object_id("Gold", "sla") == "gold_id"
+    assert rubrik.object_ids(["GOLD"], "sla")["ids"] == {"GOLD": "gold_id"}
+    assert mock_request.call_count == 1
+
+
+def test_object_ids_invalid_object_type(rubrik):
+
+    with pytest.raises(InvalidParameterException):
+        rubrik.object_ids(["string"], "share")
+
+    with pytest.raises(InvalidTypeException):
+        rubrik.object_ids("string", "vmware")
+
+
 def test_object_id_physical_host_cdm_4_x(rubrik, mocker):
 
     def mock_get_v1_host():
@@ -9225,6 +9444,24 @@ def test_get_sla_objects(rubrik, mocker):
         'object_name': 'sla_id'}
 
 
+def test_get_sla_objects_graphql_connection(rubrik, mocker):
+
+    mocker.patch('rubrik_cdm.Connect.object_id', autospec=True, spec_set=True, return_value="sla_id")
+
+    mock_query = mocker.patch('rubrik_cdm.Connect.query', autospec=True, spec_set=True)
+    mock_query.side_effect = [
+        {"nasShareConnection": {"nodes": [{"id": "share01_id", "hostname": "nas01"}], "pageInfo": {"endCursor": "abc", "hasNextPage": True}}},
+        {"nasShareConnection": {"nodes": [{"id": "share02_id", "hostname": "nas02"}], "pageInfo": {"endCursor": "def", "hasNextPage": False}}},
+    ]
+
+    assert rubrik.get_sla_objects("Gold", "nas_share", page_size=1) == {"nas01": "share01_id", "nas02": "share02_id"}
+    assert [call[0][3] for call in mock_query.call_args_list] == [
+        {"effectiveSlaDomainId": "sla_id", "first": 1, "after": None},
+        {"effectiveSlaDomainId": "sla_id", "first": 1, "after": "abc"},
+    ]
+    assert "pageInfo" in mock_query.call_args_list[0][0][1]
+
+
 def test_get_all_hosts_invalid_parameter(rubrik):
     with pytest.raises(TypeError) as error:
         rubrik.get_all_hosts(timeout=30, param="does not exist")
@@ -9862,3 +10099,56 @@ def test_register_vm_already_registered(rubrik, mocker):
 
     # assert rubrik.register_vm(name='object_name') == '{''status_code'': ''204''}'
     assert rubrik.register_vm(name='object_name') == {"status_code": "204"}
+
+
+def test_date_time_conversion(mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"timezone": {"timezone": "America/Chicago"}}
+
+    rubrik = Connect("10.0.1.1", "user", "password")
+
+    assert rubrik._date_time_conversion("1-15-2014", "1:30 AM") == "2014-01-15T07:30"
+    assert rubrik._date_time_conversion("7-15-2014", "1:30 PM") == "2014-07-15T18:30"
+    assert mock_get.call_count == 1
+
+
+def test_bulk_date_time_conversion(mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+    mock_get.return_value = {"timezone": {"timezone": "Europe/London"}}
+
+    rubrik = Connect("10.0.1.1", "user", "password")
+
+    assert rubrik._bulk_date_time_conversion([("1-15-2014", "1:30 AM"), ("7-15-2014", "11:05 PM")]) == [
+        "2014-01-15T01:30", "2014-07-15T22:05"]
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.parametrize("date, time, error_message", [
+    ("2014-01-15", "1:30 AM", "The date argument '2014-01-15' must be formatd as 'Month-Date-Year' (ex: 8-9-2018)."),
+    ("1-15-2014", "13:30", "The time argument '13:30' must be formatd as 'Hour:Minute AM/PM' (ex: 2:57 AM)."),
+])
+def test_date_time_conversion_invalid_format(rubrik, mocker, date, time, error_message):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get',
+                            autospec=True, spec_set=True)
+
+    with pytest.raises(InvalidParameterException) as error:
+        rubrik._date_time_conversion(date, time)
+
+    assert error.value.args[0] == error_message
+    assert mock_get.call_count == 0
+
+
+def test_get_all_hosts_all_pages(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"hasMore": True, "total": 3, "data": [{"id": 1}, {"id": 2}]},
+        {"hasMore": False, "total": 3, "data": [{"id": 3}]},
+    ]
+
+    assert rubrik.get_all_hosts() == {"hasMore": False, "total": 3, "data": [{"id": 1}, {"id": 2}, {"id": 3}]}
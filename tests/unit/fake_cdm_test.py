@@ -0,0 +1,70 @@
+import shutil
+import pytest
+import rubrik_cdm
+from rubrik_cdm.exceptions import APICallException
+from benchmarks.fake_cdm import FakeCDM, SyntheticInventory
+
+pytestmark = [
+    pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl is required to generate a certificate"),
+    pytest.mark.filterwarnings("ignore::urllib3.exceptions.InsecureRequestWarning"),
+]
+
+
+@pytest.fixture(scope="module")
+def cdm():
+    with FakeCDM(SyntheticInventory(vms=500, hosts=20, slas=3, shares=30)) as cdm:
+        yield cdm
+
+
+@pytest.fixture
+def connection(cdm):
+    with rubrik_cdm.Connect(cdm.node_ip, "admin", "password") as rubrik:
+        yield rubrik
+
+
+def test_synthetic_inventory_is_reproducible():
+    assert SyntheticInventory(vms=100, seed=1).vms == SyntheticInventory(vms=100, seed=1).vms
+    assert SyntheticInventory(vms=100, seed=1).vms != SyntheticInventory(vms=100, seed=2).vms
+
+
+def test_fake_cdm_object_id(cdm, connection):
+    vm = cdm.inventory.vms[250]
+    database = cdm.inventory.mssql_dbs[3]
+
+    assert connection.cluster_version() == "5.3.0-p1"
+    assert connection.object_id(vm["name"], "vmware") == vm["id"]
+    assert connection.object_id(database["name"], "mssql_db", mssql_host=database["rootProperties"]["rootName"],
+                                mssql_instance=database["instanceName"]) == database["id"]
+
+
+def test_fake_cdm_get_sla_objects(cdm, connection):
+    sla_id = next(host["effectiveSlaDomainId"] for host in cdm.inventory.hosts if host["operatingSystemType"] == "Linux" and host["effectiveSlaDomainId"] != "UNPROTECTED")
+    sla = cdm.inventory.by_id[sla_id]
+    hosts = [host for host in cdm.inventory.hosts if host["effectiveSlaDomainId"] == sla["id"] and host["operatingSystemType"] == "Linux"]
+    vms = [vm for vm in cdm.inventory.vms if vm["effectiveSlaDomainId"] == sla["id"]]
+
+    assert connection.get_sla_objects(sla["name"], "linux_and_unix_host", page_size=2) == dict((host["hostname"], host["id"]) for host in hosts)
+    assert connection.get_sla_objects(sla["name"], "vmware") == dict((vm["name"], vm["id"]) for vm in vms)
+
+
+def test_fake_cdm_on_demand_snapshot(cdm, connection):
+    api_request, job_status_url = connection.on_demand_snapshot(cdm.inventory.vms[0]["name"], "vmware", sla_name=cdm.inventory.slas[1]["name"])
+
+    assert api_request["status"] == "QUEUED"
+    assert connection.job_status(job_status_url)["status"] == "SUCCEEDED"
+
+
+def test_fake_cdm_unknown_endpoint(connection):
+    with pytest.raises(APICallException, match="does not implement GET /api/v1/unknown"):
+        connection.get("v1", "/unknown")
+
+
+def test_fake_cdm_latency(cdm, connection):
+    paths = []
+    cdm.latency = lambda method, path: paths.append((method, path)) or 0
+    try:
+        connection.get("v1", "/cluster/me")
+    finally:
+        cdm.latency = 0
+
+    assert paths == [("GET", "/api/v1/cluster/me")]
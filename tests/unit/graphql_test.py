@@ -0,0 +1,121 @@
+import json
+import pytest
+from rubrik_cdm.graphql import merge_operations, split_response
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException, InvalidTypeException
+from .conftest import requests_response
+
+
+NAS_QUERY = """
+NasAssignedSLA($effectiveSlaDomainId: String) {
+    nasShareConnection(effectiveSlaDomainId: $effectiveSlaDomainId) {
+        nodes { id hostname }
+    }
+}
+"""
+
+
+def test_merge_operations():
+    query, variables = merge_operations([
+        {"query": NAS_QUERY, "variables": {"effectiveSlaDomainId": "gold_id"}},
+        {"query": "query Cluster { version: cluster(id: \"me\") { version } }"},
+        {"query": "{ cluster(id: \"me\") @include(if: true) { name } __typename }"},
+    ])
+
+    assert query.startswith("QueryBatch($q0_effectiveSlaDomainId: String) {")
+    assert "q0_nasShareConnection: nasShareConnection(effectiveSlaDomainId: $q0_effectiveSlaDomainId) {" in query
+    assert "q1_version: cluster(id: \"me\") { version }" in query
+    assert "q2_cluster: cluster(id: \"me\") @include(if: true) { name } q2___typename: __typename" in query
+    assert variables == {"q0_effectiveSlaDomainId": "gold_id"}
+
+
+@pytest.mark.parametrize("query", [
+    "Name($id: String)",
+    "{ cluster { version }",
+    "{ ...ClusterFields } fragment ClusterFields on Cluster { version }",
+    "{ cluster ~ }",
+])
+def test_merge_operations_invalid_query(query):
+    with pytest.raises(InvalidParameterException):
+        merge_operations([{"query": query}])
+
+
+def test_merge_operations_names_starting_with_escape_letters():
+    query, variables = merge_operations([{
+        "query": u"\ufeffquery Filesets($first: Int, $effectiveSlaDomainId: String, $updated: Boolean) {"
+                 " filesetConnection(first: $first, effectiveSlaDomainId: $effectiveSlaDomainId, updated: $updated) { nodes { id } }"
+                 " unmanagedObjects { id } }",
+        "variables": {"first": 10, "effectiveSlaDomainId": "gold_id", "updated": True},
+    }])
+
+    assert query == (
+        "QueryBatch($q0_first: Int, $q0_effectiveSlaDomainId: String, $q0_updated: Boolean) {\n"
+        "q0_filesetConnection: filesetConnection(first: $q0_first, effectiveSlaDomainId: $q0_effectiveSlaDomainId, updated: $q0_updated) { nodes { id } }"
+        " q0_unmanagedObjects: unmanagedObjects { id }\n}")
+    assert variables == {"q0_first": 10, "q0_effectiveSlaDomainId": "gold_id", "q0_updated": True}
+
+
+def test_split_response():
+    response = {
+        "data": {"q0_cluster": {"version": "5.3.0"}, "q1_cluster": None, "q2_version": {"version": "5.3.0"}},
+        "errors": [{"message": "Not authorized.", "path": ["q1_cluster"]}],
+    }
+
+    results = split_response(response, 3)
+
+    assert results[0] == {"cluster": {"version": "5.3.0"}}
+    assert isinstance(results[1], APICallException)
+    assert str(results[1]) == "Not authorized."
+    assert results[2] == {"version": {"version": "5.3.0"}}
+
+
+def test_split_response_error_without_path():
+    results = split_response({"error": "Syntax error."}, 2)
+
+    assert [str(result) for result in results] == ["Syntax error.", "Syntax error."]
+
+
+def test_query_batch(rubrik, mocker):
+    mock_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        requests_response(200, {"data": {
+            "q0_nasShareConnection": {"nodes": [{"id": "share01_id", "hostname": "nas01"}]},
+            "q1_nasShareConnection": {"nodes": []},
+        }}),
+        requests_response(200, {"data": {"q0_nasShareConnection": None}, "errors": [{"message": "Invalid SLA.", "path": ["q0_nasShareConnection"]}]}),
+    ])
+
+    results = rubrik.query_batch([
+        {"query": NAS_QUERY, "operation_name": "NasAssignedSLA", "variables": {"effectiveSlaDomainId": "gold_id"}},
+        {"query": NAS_QUERY, "variables": {"effectiveSlaDomainId": "silver_id"}},
+        {"query": NAS_QUERY, "variables": {"effectiveSlaDomainId": "bronze_id"}},
+    ], batch_size=2)
+
+    assert results[:2] == [
+        {"nasShareConnection": {"nodes": [{"id": "share01_id", "hostname": "nas01"}]}},
+        {"nasShareConnection": {"nodes": []}},
+    ]
+    assert isinstance(results[2], APICallException)
+    assert mock_request.call_count == 2
+
+    payload = json.loads(mock_request.call_args_list[0][1]["data"])
+    assert payload["operationName"] == "QueryBatch"
+    assert payload["query"].startswith("query QueryBatch($q0_effectiveSlaDomainId: String, $q1_effectiveSlaDomainId: String) {")
+    assert payload["variables"] == {"q0_effectiveSlaDomainId": "gold_id", "q1_effectiveSlaDomainId": "silver_id"}
+
+
+def test_query_batch_api_call_error(rubrik, mocker):
+    mocker.patch.object(rubrik._session, "request", return_value=requests_response(403, {"message": "Forbidden"}))
+
+    results = rubrik.query_batch([{"query": "{ cluster(id: \"me\") { version } }"}] * 2)
+
+    assert [str(result) for result in results] == ["Forbidden", "Forbidden"]
+
+
+@pytest.mark.parametrize("operations, batch_size, error", [
+    ({"query": NAS_QUERY}, 25, InvalidTypeException),
+    (["{ cluster(id: \"me\") { version } }"], 25, InvalidTypeException),
+    ([{"query": NAS_QUERY, "timeout": 30}], 25, InvalidParameterException),
+    ([{"query": NAS_QUERY}], 0, InvalidParameterException),
+])
+def test_query_batch_invalid_parameters(rubrik, operations, batch_size, error):
+    with pytest.raises(error):
+        rubrik.query_batch(operations, batch_size=batch_size)
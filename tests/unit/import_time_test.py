@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import pytest
+import rubrik_cdm
+
+# Lazy imports, subprocess.run() and -X importtime all require Python 3.7+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7), reason="requires Python 3.7+")
+
+# The maximum number of milliseconds `import rubrik_cdm` may take in a fresh interpreter
+IMPORT_TIME_BUDGET_MS = 100
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_python(code, *options):
+    return subprocess.run(
+        [sys.executable] + list(options) + ["-c", code],
+        cwd=REPOSITORY_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True)
+
+
+def import_time_ms():
+    # Each line of -X importtime is "import time: self [us] | cumulative [us] | module"
+    for line in run_python("import rubrik_cdm", "-X", "importtime").stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "rubrik_cdm":
+            return int(fields[1]) / 1000.0
+
+
+def test_import_does_not_load_dependencies():
+    heavy_modules = ["requests", "aiohttp", "rubrik_cdm.rubrik_cdm", "rubrik_cdm.cloud", "rubrik_cdm.organization", "rubrik_cdm.physical"]
+    code = "import sys, rubrik_cdm; print(','.join(module for module in {} if module in sys.modules))".format(heavy_modules)
+
+    assert run_python(code).stdout.strip() == ""
+
+
+def test_import_time_budget():
+    # Use the fastest of several runs so a busy machine does not fail the benchmark
+    fastest = min(import_time_ms() for _ in range(3))
+
+    assert fastest < IMPORT_TIME_BUDGET_MS, "import rubrik_cdm took {:.1f}ms, the budget is {}ms".format(fastest, IMPORT_TIME_BUDGET_MS)
+
+
+def test_lazy_attributes():
+    assert rubrik_cdm.Connect is rubrik_cdm.rubrik_cdm.Connect
+    assert rubrik_cdm.RetryPolicy is rubrik_cdm.retry.RetryPolicy
+    assert "Connect" in dir(rubrik_cdm)
+
+
+def test_lazy_attribute_missing():
+    with pytest.raises(AttributeError):
+        rubrik_cdm.DoesNotExist
@@ -0,0 +1,189 @@
+import threading
+import pytest
+from rubrik_cdm import Connect
+from rubrik_cdm import inventory
+from rubrik_cdm.inventory import Inventory
+from rubrik_cdm.exceptions import InvalidParameterException, InvalidTypeException
+from .conftest import requests_response
+
+
+def vm(index, sla_id="gold_id", host_id="host_id"):
+    return {"id": "vm{:02d}_id".format(index), "name": "vm{:02d}".format(index), "effectiveSlaDomainId": sla_id, "hostId": host_id}
+
+
+class FakeCluster(object):
+    """Returns the objects of each endpoint, which tests can change between refreshes."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        endpoint = url.split("/api/", 1)[1].split("?")[0]
+        data = self.objects.get(endpoint, [])
+        return requests_response(200, {"hasMore": False, "data": data, "total": len(data)}, stream=True)
+
+
+@pytest.fixture
+def cluster():
+    return FakeCluster({
+        "v1/vmware/vm": [vm(1), vm(2, sla_id="silver_id"), vm(3, host_id="other_host_id"), dict(vm(4), name="VM01")],
+        "v1/sla_domain": [{"id": "gold_id", "name": "Gold"}, {"id": "silver_id", "name": "Silver"}],
+        "v1/host": [{"id": "host_id", "hostname": "linux01", "name": "linux01"}],
+    })
+
+
+@pytest.fixture
+def connection(mocker, cluster):
+    rubrik = Connect("10.0.1.1", "user", "password", inventory_refresh_interval=300)
+    mocker.patch.object(rubrik._session, "request", side_effect=cluster.request)
+    return rubrik
+
+
+def test_inventory_lookups(connection, cluster):
+    inventory = connection.inventory
+
+    assert [item["id"] for item in inventory.find("vmware", "vm01")] == ["vm01_id", "vm04_id"]
+    assert inventory.get("vmware", "vm02_id")["name"] == "vm02"
+    assert [item["id"] for item in inventory.by_sla("vmware", "silver_id")] == ["vm02_id"]
+    assert [item["id"] for item in inventory.by_host("vmware", "other_host_id")] == ["vm03_id"]
+    assert len(inventory.items("vmware")) == 4
+    assert len(cluster.urls) == 1
+    assert "is_relic=false&limit=1000&offset=0" in cluster.urls[0]
+
+
+def test_inventory_refresh(connection, cluster, mocker):
+    mock_monotonic = mocker.patch.object(inventory, "_monotonic", return_value=1000)
+    inventory_ = connection.inventory
+
+    assert inventory_.stats()["vmware"]["objects"] == 0
+    inventory_.items("vmware")
+
+    cluster.objects["v1/vmware/vm"] = [dict(vm(1), name="vm01-renamed"), vm(2), vm(5)]
+
+    mock_monotonic.return_value = 1299
+    assert len(inventory_.items("vmware")) == 4
+
+    mock_monotonic.return_value = 1300
+    assert [item["id"] for item in inventory_.find("vmware", "vm01-renamed")] == ["vm01_id"]
+    assert inventory_.find("vmware", "vm01") == []
+    assert len(cluster.urls) == 2
+
+    stats = inventory_.stats()["vmware"]
+    assert stats == {"refreshes": 2, "added": 5, "removed": 2, "updated": 2, "objects": 3, "age": 0}
+
+    assert inventory_.refresh("vmware") == {"vmware": {"added": 0, "removed": 0, "updated": 0}}
+    assert len(cluster.urls) == 3
+
+
+def test_inventory_invalidate(connection, cluster):
+    connection.inventory.items("sla")
+    connection.inventory.invalidate("sla")
+    connection.inventory.items("sla")
+
+    assert len(cluster.urls) == 2
+
+
+def test_inventory_add_and_remove(connection, cluster):
+    inventory_ = connection.inventory
+    inventory_.items("vmware")
+
+    inventory_.add("vmware", vm(9, sla_id="silver_id"))
+    inventory_.remove("vmware", "vm02_id")
+
+    assert [item["id"] for item in inventory_.by_sla("vmware", "silver_id")] == ["vm09_id"]
+    assert inventory_.get("vmware", "vm02_id") is None
+    assert len(cluster.urls) == 1
+
+
+def test_inventory_background_refresh(connection, cluster):
+    refreshed = threading.Event()
+    refresh = connection.inventory._refresh
+
+    def mock_refresh(object_type, only_if_due=False):
+        changes = refresh(object_type, only_if_due)
+        if object_type == "vmware":
+            refreshed.set()
+        return changes
+
+    connection.inventory._refresh = mock_refresh
+
+    with connection.inventory as inventory_:
+        inventory_.start()
+        assert refreshed.wait(5)
+        assert len(inventory_.items("vmware")) == 4
+
+    assert not inventory_._thread.is_alive()
+
+
+def test_inventory_invalidate_wakes_background_refresh(connection, cluster):
+    refreshed = threading.Event()
+    refresh = connection.inventory._refresh
+
+    def mock_refresh(object_type, only_if_due=False):
+        changes = refresh(object_type, only_if_due)
+        if object_type == "sla":
+            refreshed.set()
+        return changes
+
+    connection.inventory._refresh = mock_refresh
+
+    with connection.inventory as inventory_:
+        inventory_.start()
+        assert refreshed.wait(5)
+
+        refreshed.clear()
+        cluster.objects["v1/sla_domain"].append({"id": "bronze_id", "name": "Bronze"})
+        inventory_.invalidate("sla")
+
+        assert refreshed.wait(5)
+        assert inventory_.find("sla", "Bronze")[0]["id"] == "bronze_id"
+
+
+@pytest.mark.parametrize("kwargs, exception", [
+    ({"object_types": "vmware"}, InvalidTypeException),
+    ({"object_types": ["vmware", "hyper-v"]}, InvalidParameterException),
+    ({"refresh_interval": 0}, InvalidParameterException),
+    ({"page_size": "100"}, InvalidTypeException),
+])
+def test_inventory_invalid_arguments(rubrik, kwargs, exception):
+    with pytest.raises(exception):
+        Inventory(rubrik, **kwargs)
+
+
+def test_inventory_object_type_not_indexed(rubrik):
+    inventory_ = Inventory(rubrik, object_types=["sla"])
+
+    assert inventory_.indexes("vmware") is False
+    with pytest.raises(InvalidParameterException):
+        inventory_.items("vmware")
+
+
+def test_inventory_disabled_by_default(rubrik):
+    assert rubrik.inventory is None
+
+
+def test_object_id_uses_inventory(connection, cluster):
+    assert connection.object_id("vm02", "vmware") == "vm02_id"
+    assert connection.object_id("VM02", "vmware") == "vm02_id"
+    assert len(cluster.urls) == 1
+
+    # Objects that are not in the inventory are looked up on the Rubrik cluster
+    with pytest.raises(InvalidParameterException):
+        connection.object_id("vm01", "vmware")
+    assert "name=vm01" in cluster.urls[-1]
+
+
+def test_get_sla_objects_uses_inventory(connection, cluster):
+    assert connection.get_sla_objects("Gold", "vmware") == {"vm01": "vm01_id", "vm03": "vm03_id", "VM01": "vm04_id"}
+    assert len(cluster.urls) == 2
+
+
+def test_delete_physical_host_updates_inventory(connection, cluster, mocker):
+    mock_delete = mocker.patch("rubrik_cdm.Connect.delete", autospec=True, return_value={"status_code": 204})
+
+    assert connection.delete_physical_host("linux01") == {"status_code": 204}
+    mock_delete.assert_called_once_with(connection, "v1", "/host/host_id", timeout=120)
+    assert connection.delete_physical_host("linux01") == "No change required. The host 'linux01' is not connected to the Rubrik cluster."
+    assert len(cluster.urls) == 1
@@ -0,0 +1,195 @@
+import threading
+import time
+import pytest
+from rubrik_cdm import JobWatcher
+from rubrik_cdm.job_watcher import _Job
+from rubrik_cdm.exceptions import InvalidParameterException, InvalidTypeException, RubrikException
+
+
+def mock_job_statuses(mocker, statuses):
+    """Mock the job status API so each URL returns the next status in its list."""
+
+    lock = threading.Lock()
+
+    def mock_common_api(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, timeout=15, **kwargs):
+        with lock:
+            status = statuses[job_status_url].pop(0) if len(statuses[job_status_url]) > 1 else statuses[job_status_url][0]
+        return {"status": status, "progress": 50}
+
+    return mocker.patch('rubrik_cdm.Connect._common_api', autospec=True, side_effect=mock_common_api)
+
+
+def test_job_watcher(rubrik, mocker):
+
+    mock_job_statuses(mocker, {
+        "job_1": ["QUEUED", "RUNNING", "SUCCEEDED"],
+        "job_2": ["SUCCEEDED"],
+        "job_3": ["RUNNING", "CANCELED"],
+    })
+
+    with JobWatcher(rubrik, min_interval=0.01, max_interval=0.02) as watcher:
+        futures = watcher.watch_all(["job_1", "job_2", "job_3"])
+
+        assert [future.result(timeout=5)["status"] for future in futures] == ["SUCCEEDED", "SUCCEEDED", "CANCELED"]
+
+        stats = watcher.stats()
+
+    assert stats["watched"] == 3
+    assert stats["succeeded"] == 2
+    assert stats["canceled"] == 1
+    assert stats["pending"] == 0
+    assert stats["polls"] == 6
+    assert stats["throughput"] > 0
+
+
+def test_job_watcher_failed_job_callback(rubrik, mocker):
+
+    mock_job_statuses(mocker, {"job_1": ["RUNNING", "FAILED"]})
+    completed = threading.Event()
+
+    with JobWatcher(rubrik, min_interval=0.01) as watcher:
+        future = watcher.watch("job_1", callback=lambda future: completed.set())
+
+        with pytest.raises(RubrikException):
+            future.result(timeout=5)
+
+        assert completed.wait(5)
+        assert watcher.stats()["failed"] == 1
+
+
+def test_job_watcher_deadline(rubrik, mocker):
+
+    mock_job_statuses(mocker, {"job_1": ["RUNNING"]})
+
+    with JobWatcher(rubrik, min_interval=0.01) as watcher:
+        future = watcher.watch("job_1", deadline=0.05)
+
+        with pytest.raises(RubrikException):
+            future.result(timeout=5)
+
+        assert watcher.stats()["timed_out"] == 1
+
+
+def test_job_watcher_invalid_status_response(rubrik, mocker):
+
+    def mock_common_api(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, timeout=15, **kwargs):
+        return {"progress": 50} if job_status_url == "job_1" else {"status": "RUNNING", "progress": 50}
+
+    mocker.patch('rubrik_cdm.Connect._common_api', autospec=True, side_effect=mock_common_api)
+
+    with JobWatcher(rubrik, min_interval=0.01) as watcher:
+        invalid_job = watcher.watch("job_1")
+        running_job = watcher.watch("job_2", deadline=0.2)
+
+        with pytest.raises(KeyError):
+            invalid_job.result(timeout=5)
+        with pytest.raises(RubrikException):
+            running_job.result(timeout=5)
+
+        assert watcher.stats()["failed"] == 1
+        assert watcher.stats()["timed_out"] == 1
+
+
+def test_job_watcher_future_cancelled_by_caller(rubrik, mocker):
+
+    mock_job_statuses(mocker, {"job_1": ["RUNNING", "SUCCEEDED"], "job_2": ["RUNNING", "SUCCEEDED"]})
+
+    with JobWatcher(rubrik, min_interval=0.05) as watcher:
+        cancelled_job = watcher.watch("job_1")
+        assert cancelled_job.cancel()
+        running_job = watcher.watch("job_2")
+
+        assert running_job.result(timeout=5)["status"] == "SUCCEEDED"
+
+        stats = watcher.stats()
+
+    assert cancelled_job.cancelled()
+    assert stats["succeeded"] == 1
+    assert stats["canceled"] == 1
+    assert stats["pending"] == 0
+
+
+def test_job_watcher_future_not_cancelled_once_polled(rubrik, mocker):
+
+    polled = threading.Event()
+    release = threading.Event()
+
+    def mock_common_api(self, call_type, api_version, api_endpoint, config=None, job_status_url=None, timeout=15, **kwargs):
+        polled.set()
+        assert release.wait(5)
+        return {"status": "SUCCEEDED"}
+
+    mocker.patch('rubrik_cdm.Connect._common_api', autospec=True, side_effect=mock_common_api)
+
+    with JobWatcher(rubrik, min_interval=0.01) as watcher:
+        future = watcher.watch("job_1")
+        assert polled.wait(5)
+
+        assert not future.cancel()
+        release.set()
+
+        assert future.result(timeout=5)["status"] == "SUCCEEDED"
+
+        stats = watcher.stats()
+
+    assert stats["succeeded"] == 1
+    assert stats["canceled"] == 0
+
+
+def test_job_watcher_close_cancels_pending_jobs(rubrik, mocker):
+
+    mock_job_statuses(mocker, {"job_1": ["RUNNING"]})
+
+    watcher = JobWatcher(rubrik, min_interval=10, max_interval=10)
+    future = watcher.watch("job_1")
+    while watcher.stats()["polls"] == 0:
+        time.sleep(0.01)
+    watcher.close()
+
+    with pytest.raises(RubrikException):
+        future.result(timeout=5)
+    assert watcher.stats()["canceled"] == 1
+
+    with pytest.raises(RubrikException):
+        watcher.watch("job_2")
+
+
+def test_job_watcher_next_interval(rubrik):
+
+    watcher = JobWatcher(rubrik, min_interval=1, max_interval=30)
+
+    # Without any reported progress the interval doubles after each poll
+    job = _Job("job_1", None, 0, None)
+    assert [watcher._next_interval(job, None, now) for now in [0, 1, 3]] == [1, 2, 4]
+
+    # With reported progress the interval is half of the estimated time remaining
+    job = _Job("job_2", None, 0, None)
+    assert watcher._next_interval(job, 0, 0) == 1
+    assert watcher._next_interval(job, 10, 10) == 30
+    assert watcher._next_interval(job, 60, 20) == 4
+    assert watcher._next_interval(job, 96, 30) == 1
+
+
+@pytest.mark.parametrize('min_interval, max_interval, deadline, error', [
+    ("1", 30, None, InvalidTypeException),
+    (0, 30, None, InvalidParameterException),
+    (10, 5, None, InvalidParameterException),
+    (1, 30, -1, InvalidParameterException),
+])
+def test_job_watcher_invalid_parameters(rubrik, min_interval, max_interval, deadline, error):
+
+    with pytest.raises(error):
+        JobWatcher(rubrik, min_interval, max_interval, deadline)
+
+
+def test_watch_jobs(rubrik, mocker):
+
+    mock_job_statuses(mocker, {
+        "job_1": ["RUNNING", "SUCCEEDED"],
+        "job_2": ["FAILED"],
+    })
+
+    results = rubrik.watch_jobs(["job_1", "job_2"], min_interval=0.01)
+
+    assert results[0]["status"] == "SUCCEEDED"
+    assert isinstance(results[1], RubrikException)
@@ -0,0 +1,86 @@
+import json
+import pytest
+import rubrik_cdm
+from rubrik_cdm import json_codec
+from rubrik_cdm.json_codec import JsonCodec, get_json_codec
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException, RubrikException
+from .conftest import requests_response
+
+
+def test_get_json_codec_default():
+    assert type(get_json_codec()) is JsonCodec
+    assert get_json_codec("json").name == "json"
+
+
+def test_get_json_codec_auto():
+    assert get_json_codec("auto").name in ["orjson", "ujson", "json"]
+
+
+def test_get_json_codec_invalid_name():
+    with pytest.raises(InvalidParameterException):
+        get_json_codec("simplejson")
+
+
+def test_get_json_codec_not_installed(mocker):
+    mocker.patch.object(json_codec.importlib, "import_module", side_effect=ImportError)
+
+    with pytest.raises(RubrikException):
+        get_json_codec("orjson")
+
+    assert get_json_codec("auto").name == "json"
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+def test_json_codec_round_trip(name):
+    pytest.importorskip(name)
+    codec = get_json_codec(name)
+    document = {"data": [{"id": "VirtualMachine:::vm01", "name": "vm01"}], "hasMore": False}
+
+    assert json.loads(codec.dumps(document)) == document
+    assert codec.decode_response(requests_response(200, json.dumps(document).encode())) == document
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+def test_json_codec_dumps_non_ascii(name):
+    pytest.importorskip(name)
+    codec = get_json_codec(name)
+    document = {"name": u"M\u00fcnchen \u6771\u4eac"}
+
+    body = codec.dumps(document)
+
+    if not isinstance(body, bytes):
+        body = body.encode("ascii")
+    assert json.loads(body.decode("utf-8")) == document
+
+
+def test_response_decoded_once(rubrik, mocker):
+    response = mocker.Mock()
+    response.status_code = 200
+    response.json.return_value = {"data": {"vm": "vm01"}}
+    mocker.patch.object(rubrik._session, "request", return_value=response)
+
+    assert rubrik.query("query { vm }") == {"vm": "vm01"}
+    response.json.assert_called_once()
+
+
+def test_response_raw(rubrik, mocker):
+    mocker.patch.object(rubrik._session, "request", return_value=requests_response(200, b'{"total": 0, "data": []}'))
+
+    assert rubrik.get("v1", "/vmware/vm", raw=True) == b'{"total": 0, "data": []}'
+
+
+def test_response_raw_error(rubrik, mocker):
+    mocker.patch.object(rubrik._session, "request", return_value=requests_response(404, b'{"message": "Not found"}'))
+
+    with pytest.raises(APICallException, match="Not found"):
+        rubrik.get("v1", "/vmware/vm", raw=True)
+
+
+def test_connect_json_codec(mocker):
+    pytest.importorskip("orjson")
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", json_codec="orjson")
+    mock_session_request = mocker.patch.object(
+        rubrik._session, "request", return_value=requests_response(200, b'{"id": "request_id"}'))
+
+    assert rubrik.post("v1", "/vmware/vm/snapshot", {"slaId": "Gold"}) == {"id": "request_id"}
+    assert mock_session_request.call_args[1]["data"] == b'{"slaId":"Gold"}'
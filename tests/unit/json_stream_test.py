@@ -0,0 +1,109 @@
+import json
+import pytest
+from rubrik_cdm.json_stream import JsonArrayStream
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException
+from .conftest import requests_response
+
+
+def chunked(document, size):
+    body = document.encode("utf-8")
+    return [body[index:index + size] for index in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64, 4096])
+def test_json_array_stream(size):
+    document = {
+        "hasMore": True,
+        "note": "a \"data\" key inside a string: [1, 2]",
+        "nested": {"data": [0]},
+        "data": [{"id": 1, "name": "vm01 é"}, {"id": 2, "tags": [1, 2, {"data": []}]}, 12345, -1.5e3, "text", None],
+        "total": 6,
+    }
+
+    stream = JsonArrayStream(chunked(json.dumps(document), size))
+
+    assert list(stream) == document["data"]
+    assert stream.count == 6
+    assert stream.metadata == {"hasMore": True, "note": document["note"], "nested": {"data": [0]}, "data": [], "total": 6}
+
+
+@pytest.mark.parametrize("size", [1, 5, 4096])
+def test_json_array_stream_top_level_array(size):
+    stream = JsonArrayStream(chunked(json.dumps([{"id": 1}, {"id": 2}]), size))
+
+    assert list(stream) == [{"id": 1}, {"id": 2}]
+    assert stream.metadata is None
+
+
+def test_json_array_stream_empty_array():
+    stream = JsonArrayStream(chunked('{"data": [], "hasMore": false}', 2))
+
+    assert list(stream) == []
+    assert stream.metadata == {"data": [], "hasMore": False}
+
+
+def test_json_array_stream_without_array():
+    stream = JsonArrayStream(chunked('{"id": "cluster01", "data": "text"}', 4))
+
+    assert list(stream) == []
+    assert stream.metadata == {"id": "cluster01", "data": "text"}
+
+
+def test_json_array_stream_incomplete_response():
+    stream = JsonArrayStream(chunked('{"data": [{"id": 1}, {"id": 2', 4))
+
+    with pytest.raises(APICallException):
+        list(stream)
+
+
+def test_json_array_stream_close():
+    closed = []
+    stream = JsonArrayStream(chunked('{"data": [1, 2, 3]}', 4), close=lambda: closed.append(True))
+
+    with stream:
+        assert next(stream) == 1
+
+    assert closed == [True]
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+def test_get_stream(rubrik, mocker):
+    body = {"hasMore": False, "data": [{"id": "vm01"}, {"id": "vm02"}], "total": 2}
+    mock_request = mocker.patch.object(rubrik._session, "request", return_value=requests_response(200, body, stream=True))
+
+    items = rubrik.get("v1", "/vmware/vm", stream=True)
+
+    assert mock_request.call_args[1]["stream"] is True
+    assert list(items) == body["data"]
+    assert items.metadata["total"] == 2
+
+
+def test_get_stream_error(rubrik, mocker):
+    mocker.patch.object(rubrik._session, "request", return_value=requests_response(
+        403, {"errorType": "user_error", "message": "Not authorized"}, stream=True))
+
+    with pytest.raises(APICallException, match="Not authorized"):
+        rubrik.get("v1", "/vmware/vm", stream=True)
+
+
+def test_get_stream_raw(rubrik):
+    with pytest.raises(InvalidParameterException):
+        rubrik.get("v1", "/vmware/vm", raw=True, stream=True)
+
+
+def test_paginate_stream(rubrik, mocker):
+    pages = [
+        {"hasMore": True, "data": [{"id": 1}, {"id": 2}], "total": 3},
+        {"hasMore": False, "data": [{"id": 3}], "total": 3},
+    ]
+    mock_request = mocker.patch.object(
+        rubrik._session, "request", side_effect=[requests_response(200, page, stream=True) for page in pages])
+
+    assert [item["id"] for item in rubrik.paginate("v1", "/vmware/vm", page_size=2, stream=True)] == [1, 2, 3]
+    assert [call[0][1].split("?")[1] for call in mock_request.call_args_list] == ["limit=2&offset=0", "limit=2&offset=2"]
+
+
+def test_paginate_stream_prefetch(rubrik):
+    with pytest.raises(InvalidParameterException):
+        list(rubrik.paginate("v1", "/vmware/vm", prefetch=True, stream=True))
@@ -0,0 +1,138 @@
+import pytest
+import requests
+import rubrik_cdm
+from rubrik_cdm import api, metrics
+from rubrik_cdm.metrics import MetricsRegistry, endpoint_template
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException, InvalidTypeException
+from .conftest import mock_response
+
+
+@pytest.mark.parametrize("call_type, api_version, api_endpoint, job_status_url, gql_operation_name, template", [
+    ("GET", "v1", "/cluster/me", None, None, "/v1/cluster/me"),
+    ("GET", "v1", "/vmware/vm/VirtualMachine:::4213-a8e1-vm-1234/snapshot", None, None, "/v1/vmware/vm/{id}/snapshot"),
+    ("GET", "v1", "/vmware/vm?name=vm01&limit=10", None, None, "/v1/vmware/vm"),
+    ("PATCH", "internal", "/managed_volume/6f5fbb08-3dea-4b3f-bc14-4c4a2ec8bd06", None, None, "/internal/managed_volume/{id}"),
+    ("DELETE", "v1", "/session/me", None, None, "/v1/session/me"),
+    ("JOB_STATUS", None, None, "https://10.0.1.1/api/v1/vmware/vm/request/CREATE_VMWARE_SNAPSHOT_9f2a:::0", None, "/v1/vmware/vm/request/{id}"),
+    ("QUERY", "internal", "/graphql", None, "NasAssignedSLA", "/internal/graphql:NasAssignedSLA"),
+    ("QUERY", "internal", "/graphql", None, None, "/internal/graphql:anonymous"),
+])
+def test_endpoint_template(call_type, api_version, api_endpoint, job_status_url, gql_operation_name, template):
+
+    assert endpoint_template(call_type, api_version, api_endpoint, job_status_url, gql_operation_name) == template
+
+
+def test_metrics_registry_latency_percentiles():
+    registry = MetricsRegistry(buckets=(0.1, 0.2, 0.4))
+    key = ("GET", "/v1/vmware/vm")
+    for latency, count in [(0.05, 50), (0.15, 45), (0.3, 5)]:
+        for _ in range(count):
+            registry._record(key, latency, 0, 128, 0, None)
+
+    latency = registry.stats()["GET /v1/vmware/vm"]["latency"]
+
+    assert latency["min"] == 0.05
+    assert latency["max"] == 0.3
+    assert latency["mean"] == pytest.approx(0.1075)
+    assert latency["p50"] == pytest.approx(0.1)
+    assert latency["p95"] == pytest.approx(0.2)
+    assert latency["p99"] == pytest.approx(0.3)
+
+
+def test_common_api_records_metrics(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", retry_policy=rubrik_cdm.RetryPolicy(jitter=False))
+    mocker.patch.object(api.time, "sleep")
+    mocker.patch.object(metrics, "_timer", side_effect=[0, 0.25, 1, 1.5])
+    mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 503, {"message": "Unavailable"}),
+        mock_response(mocker, 200, {"id": "VirtualMachine:::1"}),
+        mock_response(mocker, 404, {"message": "Not found"}),
+    ])
+
+    rubrik.put("v1", "/vmware/vm/VirtualMachine:::1", {"configuredSlaDomainId": "sla"})
+    with pytest.raises(APICallException):
+        rubrik.put("v1", "/vmware/vm/VirtualMachine:::2", {"configuredSlaDomainId": "sla"})
+
+    stats = rubrik.stats()["PUT /v1/vmware/vm/{id}"]
+
+    assert stats["calls"] == 2
+    assert stats["retries"] == 1
+    assert stats["errors"] == 1
+    assert stats["error_rate"] == 0.5
+    assert stats["errors_by_class"] == {"404": 1}
+    assert stats["request_bytes"] == 3 * len('{"configuredSlaDomainId": "sla"}')
+    assert stats["response_bytes"] == 26 + 28 + 24
+    assert stats["latency"]["min"] == 0.25
+    assert stats["latency"]["max"] == 0.5
+
+
+def test_common_api_records_transport_errors(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password")
+    mocker.patch.object(rubrik._session, "request", side_effect=requests.exceptions.ConnectTimeout("timed out"))
+
+    with pytest.raises(APICallException):
+        rubrik.get("v1", "/cluster/me")
+
+    assert rubrik.stats()["GET /v1/cluster/me"]["errors_by_class"] == {"ConnectTimeout": 1}
+
+
+def test_connect_metrics_disabled(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", enable_metrics=False)
+    mocker.patch.object(rubrik._session, "request", return_value=mock_response(mocker, 200))
+
+    rubrik.get("v1", "/cluster/me")
+
+    assert rubrik.metrics is None
+    assert rubrik.stats() == {}
+
+
+def test_connect_invalid_enable_metrics():
+
+    with pytest.raises(InvalidTypeException):
+        rubrik_cdm.Connect("10.0.1.1", "user", "password", enable_metrics="yes")
+
+
+def test_metrics_registry_prometheus(tmp_path):
+    registry = MetricsRegistry(buckets=(0.1, 1))
+    registry._record(("GET", "/v1/vmware/vm/{id}"), 0.05, 0, 100, 0, None)
+    registry._record(("GET", "/v1/vmware/vm/{id}"), 2, 0, 50, 2, "503")
+
+    text = registry.prometheus()
+
+    labels = 'method="GET",endpoint="/v1/vmware/vm/{id}"'
+    assert "# TYPE rubrik_cdm_api_call_duration_seconds histogram\n" in text
+    assert "rubrik_cdm_api_calls_total{%s} 2\n" % labels in text
+    assert "rubrik_cdm_api_retries_total{%s} 2\n" % labels in text
+    assert "rubrik_cdm_api_response_bytes_total{%s} 150\n" % labels in text
+    assert 'rubrik_cdm_api_errors_total{%s,error="503"} 1\n' % labels in text
+    assert 'rubrik_cdm_api_call_duration_seconds_bucket{%s,le="0.1"} 1\n' % labels in text
+    assert 'rubrik_cdm_api_call_duration_seconds_bucket{%s,le="1.0"} 1\n' % labels in text
+    assert 'rubrik_cdm_api_call_duration_seconds_bucket{%s,le="+Inf"} 2\n' % labels in text
+    assert "rubrik_cdm_api_call_duration_seconds_sum{%s} 2.05\n" % labels in text
+    assert "rubrik_cdm_api_call_duration_seconds_count{%s} 2\n" % labels in text
+
+    path = tmp_path / "rubrik.prom"
+    registry.write_prometheus(str(path))
+    assert path.read_text() == text
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_metrics_registry_reset():
+    registry = MetricsRegistry()
+    registry._record(("GET", "/v1/cluster/me"), 0.01, 0, 10, 0, None)
+
+    registry.reset()
+
+    assert registry.stats() == {}
+
+
+@pytest.mark.parametrize("buckets, error", [
+    ((), InvalidTypeException),
+    (("0.1", 1), InvalidTypeException),
+    ((1, 0.5), InvalidParameterException),
+    ((0, 1), InvalidParameterException),
+])
+def test_metrics_registry_invalid_buckets(buckets, error):
+
+    with pytest.raises(error):
+        MetricsRegistry(buckets=buckets)
@@ -0,0 +1,120 @@
+import pytest
+import requests
+import rubrik_cdm
+from rubrik_cdm import node_pool
+from rubrik_cdm.node_pool import NodePool
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException, InvalidTypeException
+from .conftest import mock_response
+
+
+def test_node_pool_round_robin():
+    pool = NodePool(["10.0.1.1", "10.0.1.2", "10.0.1.3"])
+
+    assert [pool.acquire() for _ in range(4)] == ["10.0.1.1", "10.0.1.2", "10.0.1.3", "10.0.1.1"]
+
+
+def test_node_pool_least_outstanding():
+    pool = NodePool(["10.0.1.1", "10.0.1.2"], strategy="least_outstanding")
+
+    first = pool.acquire()
+    second = pool.acquire()
+    pool.release(first)
+
+    assert first != second
+    assert pool.acquire() == first
+
+
+def test_node_pool_ejection_and_cooldown(mocker):
+    mock_monotonic = mocker.patch.object(node_pool, "_monotonic", return_value=100)
+    pool = NodePool(["10.0.1.1", "10.0.1.2"], cooldown=30)
+
+    pool.release(pool.acquire(), failed=True)
+
+    assert [pool.acquire() for _ in range(2)] == ["10.0.1.2", "10.0.1.2"]
+    assert pool.stats()["10.0.1.1"] == {"outstanding": 0, "requests": 1, "failures": 1, "ejected": True}
+
+    mock_monotonic.return_value = 130
+    assert "10.0.1.1" in [pool.acquire() for _ in range(2)]
+
+
+def test_node_pool_all_nodes_ejected(mocker):
+    mock_monotonic = mocker.patch.object(node_pool, "_monotonic", return_value=100)
+    pool = NodePool(["10.0.1.1", "10.0.1.2"])
+
+    pool.release(pool.acquire(), failed=True)
+    mock_monotonic.return_value = 110
+    pool.release(pool.acquire(), failed=True)
+
+    assert pool.acquire() == "10.0.1.1"
+
+
+def test_node_pool_update_keeps_node_state():
+    pool = NodePool(["10.0.1.1"])
+    pool.release(pool.acquire(), failed=True)
+
+    pool.update(["10.0.1.1", "10.0.1.2"])
+
+    assert pool.nodes == ["10.0.1.1", "10.0.1.2"]
+    assert pool.stats()["10.0.1.1"]["failures"] == 1
+
+
+def test_node_pool_discovery_due(mocker):
+    mock_monotonic = mocker.patch.object(node_pool, "_monotonic", return_value=100)
+    pool = NodePool(["10.0.1.1"], discovery_interval=300)
+
+    assert pool.discovery_due() is True
+    assert pool.discovery_due() is False
+
+    mock_monotonic.return_value = 400
+    assert pool.discovery_due() is True
+
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"strategy": "random"}, InvalidParameterException),
+    ({"cooldown": -1}, InvalidParameterException),
+    ({"discovery_interval": "300"}, InvalidTypeException),
+    ({"max_failures": 0}, InvalidParameterException),
+])
+def test_node_pool_invalid_parameters(kwargs, error):
+    with pytest.raises(error):
+        NodePool(["10.0.1.1"], **kwargs)
+
+
+def test_connect_load_balancing(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", load_balancing="round_robin")
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 200, {"total": 2, "data": [
+            {"id": "RVM1", "ipAddress": "10.0.1.11", "status": "OK"},
+            {"id": "RVM2", "ipAddress": "10.0.1.12", "status": "OK"},
+            {"id": "RVM3", "ipAddress": "10.0.1.13", "status": "BAD"},
+        ]}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+    ])
+
+    rubrik.get("v1", "/cluster/me/version")
+    rubrik.get("v1", "/cluster/me/version")
+
+    urls = [call[0][1] for call in mock_session_request.call_args_list]
+    assert urls == [
+        "https://10.0.1.1/api/internal/cluster/me/node",
+        "https://10.0.1.12/api/v1/cluster/me/version",
+        "https://10.0.1.11/api/v1/cluster/me/version",
+    ]
+
+
+def test_connect_load_balancing_ejects_failed_node(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", load_balancing="round_robin", node_discovery_interval=0)
+    rubrik.node_pool.update(["10.0.1.11", "10.0.1.12"])
+    mocker.patch.object(rubrik.node_pool, "discovery_due", return_value=False)
+    mocker.patch.object(rubrik._session, "request", side_effect=[
+        requests.exceptions.ConnectionError(),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+    ])
+
+    with pytest.raises(APICallException):
+        rubrik.get("v1", "/cluster/me/version")
+
+    assert rubrik.get("v1", "/cluster/me/version") == {"version": "5.0.1-1280"}
+    assert rubrik.node_pool.stats()["10.0.1.11"]["ejected"] is True
+    assert rubrik.node_pool.stats()["10.0.1.12"]["requests"] == 1
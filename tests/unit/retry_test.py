@@ -0,0 +1,137 @@
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError
+import rubrik_cdm
+from rubrik_cdm import retry
+from rubrik_cdm.retry import RetryPolicy
+from rubrik_cdm.exceptions import APICallException, InvalidParameterException, InvalidTypeException
+from .conftest import mock_response
+
+
+def connection_refused():
+    reason = NewConnectionError(None, "Failed to establish a new connection: [Errno 111] Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/api/v1/cluster/me", reason))
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_retry_policy_backoff_jitter(mocker):
+    mock_uniform = mocker.patch.object(retry.random, "uniform", return_value=1.5)
+    policy = RetryPolicy(backoff_factor=1)
+
+    assert policy.backoff(2) == 1.5
+    mock_uniform.assert_called_once_with(1.0, 2)
+
+
+def test_retry_policy_status_codes():
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.retry_delay("GET", 1, status_code=503) == 0.5
+    assert policy.retry_delay("GET", 1, status_code=404) is None
+    assert policy.retry_delay("GET", 3, status_code=503) is None
+
+    assert policy.stats() == {"retries": 1, "retries_by_reason": {"503": 1}, "exhausted": 1, "total_delay": 0.5}
+
+
+def test_retry_policy_post_idempotency():
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.retry_delay("POST", 1, status_code=502) is None
+    assert policy.retry_delay("POST", 1, status_code=429) == 0.5
+    assert policy.retry_delay("POST", 1, error=retry.TIMEOUT) is None
+    assert policy.retry_delay("POST", 1, error=retry.CONNECTION_ERROR, request_sent=False) == 0.5
+    assert policy.retry_delay("POST", 1, error=retry.CONNECTION_ERROR) is None
+    assert policy.retry_delay("PUT", 1, error=retry.TIMEOUT) == 0.5
+
+
+@pytest.mark.parametrize("retry_after, delay", [("7", 7), ("120", 30), ("not a date", 0.5)])
+def test_retry_policy_retry_after(retry_after, delay):
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.retry_delay("GET", 1, status_code=429, retry_after=retry_after) == delay
+
+
+def test_retry_policy_retry_after_http_date(mocker):
+    mocker.patch.object(retry.time, "time", return_value=782724567)
+    policy = RetryPolicy(jitter=False)
+
+    assert policy.retry_delay("GET", 1, status_code=503, retry_after="Wed, 21 Oct 1994 07:29:37 GMT") == 10
+
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({"max_attempts": 0}, InvalidParameterException),
+    ({"max_attempts": "3"}, InvalidTypeException),
+    ({"backoff_factor": -1}, InvalidParameterException),
+    ({"jitter": "yes"}, InvalidTypeException),
+    ({"retry_errors": ("dns",)}, InvalidParameterException),
+])
+def test_retry_policy_invalid_parameters(kwargs, error):
+    with pytest.raises(error):
+        RetryPolicy(**kwargs)
+
+
+def test_connect_invalid_retry_policy():
+    with pytest.raises(InvalidTypeException):
+        rubrik_cdm.Connect("10.0.1.1", "user", "password", retry_policy={"max_attempts": 3})
+
+
+def test_common_api_retries_status_code(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", retry_policy=RetryPolicy(jitter=False))
+    mock_sleep = mocker.patch("rubrik_cdm.api.time.sleep")
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 503, headers={"Retry-After": "2"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+    ])
+
+    assert rubrik.get("v1", "/cluster/me/version") == {"version": "5.0.1-1280"}
+    assert mock_session_request.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_common_api_retries_exhausted(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", retry_policy=RetryPolicy(max_attempts=2, jitter=False))
+    mocker.patch("rubrik_cdm.api.time.sleep")
+    mock_session_request = mocker.patch.object(
+        rubrik._session, "request", side_effect=requests.exceptions.ReadTimeout())
+
+    with pytest.raises(APICallException, match="did not respond"):
+        rubrik.get("v1", "/cluster/me/version")
+
+    assert mock_session_request.call_count == 2
+    assert rubrik.retry_policy.stats()["exhausted"] == 1
+
+
+def test_common_api_post_retried_when_connection_refused(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", retry_policy=RetryPolicy(jitter=False))
+    mocker.patch("rubrik_cdm.api.time.sleep")
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        connection_refused(),
+        mock_response(mocker, 200, {"id": "request_id"}),
+    ])
+
+    assert rubrik.post("v1", "/vmware/vm/snapshot", {}) == {"id": "request_id"}
+    assert mock_session_request.call_count == 2
+
+
+def test_common_api_post_not_retried_after_read_timeout(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", retry_policy=RetryPolicy(jitter=False))
+    mock_session_request = mocker.patch.object(
+        rubrik._session, "request", side_effect=requests.exceptions.ReadTimeout())
+
+    with pytest.raises(APICallException):
+        rubrik.post("v1", "/vmware/vm/snapshot", {})
+
+    mock_session_request.assert_called_once()
+
+
+def test_common_api_without_retry_policy(rubrik, mocker):
+    mock_session_request = mocker.patch.object(rubrik._session, "request", return_value=mock_response(mocker, 503, {"message": "Service Unavailable"}))
+
+    with pytest.raises(APICallException):
+        rubrik.get("v1", "/cluster/me/version")
+
+    mock_session_request.assert_called_once()
@@ -74,3 +74,271 @@ def test_logging_level(mocker, caplog, logging_level):
         }
         
     assert caplog.records[0].levelno == set_logging[logging_level]
+
+
+def test_connect_session_pool_settings():
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", pool_connections=4, pool_maxsize=25)
+
+    adapter = rubrik._session.get_adapter("https://10.0.1.1")
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 25
+    assert rubrik._session.headers["Connection"] == "keep-alive"
+
+
+def test_connect_session_keep_alive_disabled():
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", keep_alive=False)
+
+    assert rubrik._session.headers["Connection"] == "close"
+
+
+@pytest.mark.parametrize('pool_connections, pool_maxsize, error', [
+    ("10", 10, rubrik_cdm.exceptions.InvalidTypeException),
+    (10, 0, rubrik_cdm.exceptions.InvalidParameterException),
+])
+def test_connect_session_invalid_pool_settings(pool_connections, pool_maxsize, error):
+
+    with pytest.raises(error):
+        rubrik_cdm.Connect("10.0.1.1", "user", "password", pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+
+def test_common_api_uses_session(rubrik, mocker):
+
+    mock_response = mocker.Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {'version': '5.0.1-1280'}
+
+    mock_session_request = mocker.patch.object(rubrik._session, 'request', return_value=mock_response)
+
+    assert rubrik.get('v1', '/cluster/me/version') == {'version': '5.0.1-1280'}
+    mock_session_request.assert_called_once()
+
+
+def test_connect_context_manager_closes_session(mocker):
+
+    with rubrik_cdm.Connect("10.0.1.1", "user", "password") as rubrik:
+        mock_close = mocker.patch.object(rubrik._session, 'close')
+
+    mock_close.assert_called_once_with()
+
+
+def test_prepare_request_endpoint_with_query(rubrik):
+
+    http_method, request_url, data = rubrik._prepare_request(
+        'GET', 'v1', '/vmware/vm?is_relic=false', params={'limit': 100})
+
+    assert request_url == "https://10.0.1.1/api/v1/vmware/vm?is_relic=false&limit=100"
+
+
+def test_paginate_has_more(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"hasMore": True, "data": [{"id": 1}, {"id": 2}]},
+        {"hasMore": True, "data": [{"id": 3}, {"id": 4}]},
+        {"hasMore": False, "data": [{"id": 5}]},
+    ]
+
+    assert [item["id"] for item in rubrik.paginate('v1', '/vmware/vm', page_size=2)] == [1, 2, 3, 4, 5]
+    assert [call[1]["params"] for call in mock_get.call_args_list] == [
+        {"limit": 2, "offset": 0},
+        {"limit": 2, "offset": 2},
+        {"limit": 2, "offset": 4},
+    ]
+
+
+def test_paginate_total(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"total": 3, "data": [{"id": 1}, {"id": 2}]},
+        {"total": 3, "data": [{"id": 3}]},
+    ]
+
+    assert [item["id"] for item in rubrik.paginate('v1', '/host', params={"name": "host"}, page_size=2)] == [1, 2, 3]
+    assert mock_get.call_args_list[1][1]["params"] == {"name": "host", "limit": 2, "offset": 2}
+
+
+def test_paginate_cursor(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"hasMore": True, "nextCursor": "abc", "data": [{"id": 1}]},
+        {"hasMore": False, "data": [{"id": 2}]},
+    ]
+
+    assert [item["id"] for item in rubrik.paginate('internal', '/event', page_size=1)] == [1, 2]
+    assert mock_get.call_args_list[1][1]["params"] == {"limit": 1, "cursor": "abc"}
+
+
+def test_paginate_is_lazy(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.return_value = {"hasMore": True, "data": [{"id": 1}]}
+
+    items = rubrik.paginate('v1', '/vmware/vm', page_size=1)
+
+    assert next(items) == {"id": 1}
+    assert mock_get.call_count == 1
+
+
+def test_iter_pages_prefetch(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"hasMore": True, "data": [{"id": 1}]},
+        {"hasMore": False, "data": [{"id": 2}]},
+    ]
+
+    pages = list(rubrik.iter_pages('v1', '/vmware/vm', page_size=1, prefetch=True))
+
+    assert [page["data"][0]["id"] for page in pages] == [1, 2]
+
+
+def test_iter_pages_prefetch_error(rubrik, mocker):
+
+    mock_get = mocker.patch('rubrik_cdm.Connect.get', autospec=True, spec_set=True)
+    mock_get.side_effect = [
+        {"hasMore": True, "data": [{"id": 1}]},
+        rubrik_cdm.exceptions.APICallException("error"),
+    ]
+
+    pages = rubrik.iter_pages('v1', '/vmware/vm', page_size=1, prefetch=True)
+    next(pages)
+
+    with pytest.raises(rubrik_cdm.exceptions.APICallException):
+        next(pages)
+
+
+@pytest.mark.parametrize('page_size, prefetch, error', [
+    ("100", False, rubrik_cdm.exceptions.InvalidTypeException),
+    (0, False, rubrik_cdm.exceptions.InvalidParameterException),
+    (100, "yes", rubrik_cdm.exceptions.InvalidTypeException),
+])
+def test_iter_pages_invalid_parameters(rubrik, page_size, prefetch, error):
+
+    with pytest.raises(error):
+        next(rubrik.iter_pages('v1', '/vmware/vm', page_size=page_size, prefetch=prefetch))
+
+
+def test_paginate_connection(rubrik, mocker):
+
+    mock_query = mocker.patch('rubrik_cdm.Connect.query', autospec=True, spec_set=True)
+    mock_query.side_effect = [
+        {"hostConnection": {"nodes": [{"id": 1}, {"id": 2}], "pageInfo": {"endCursor": "abc", "hasNextPage": True}}},
+        {"hostConnection": {"nodes": [{"id": 3}], "pageInfo": {"endCursor": "def", "hasNextPage": False}}},
+    ]
+
+    nodes = rubrik.paginate_connection("Hosts($first: Int, $after: String) { ... }", "hostConnection", "Hosts", {"status": "Connected"}, page_size=2)
+
+    assert [node["id"] for node in nodes] == [1, 2, 3]
+    assert [call[0][3] for call in mock_query.call_args_list] == [
+        {"status": "Connected", "first": 2, "after": None},
+        {"status": "Connected", "first": 2, "after": "abc"},
+    ]
+
+
+def test_paginate_connection_edges(rubrik, mocker):
+
+    mock_query = mocker.patch('rubrik_cdm.Connect.query', autospec=True, spec_set=True)
+    mock_query.return_value = {"cluster": {"hostConnection": {
+        "edges": [{"node": {"id": 1}}], "pageInfo": {"endCursor": "abc", "hasNextPage": True}}}}
+
+    # The second page returns the same cursor so no third page is requested
+    assert list(rubrik.paginate_connection("{ ... }", "cluster.hostConnection")) == [{"id": 1}, {"id": 1}]
+    assert mock_query.call_count == 2
+
+
+def test_paginate_connection_missing_connection(rubrik, mocker):
+
+    mocker.patch('rubrik_cdm.Connect.query', autospec=True, spec_set=True, return_value={"hostConnection": None})
+
+    with pytest.raises(rubrik_cdm.exceptions.APICallException):
+        list(rubrik.paginate_connection("{ ... }", "hostConnection"))
+
+
+def test_log_skips_formatting_when_level_disabled(mocker):
+
+    class Payload(object):
+        formatted = False
+
+        def __str__(self):
+            Payload.formatted = True
+            return "payload"
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password")
+    mocker.patch.object(rubrik_cdm.rubrik_cdm._logger, 'isEnabledFor', return_value=False)
+
+    rubrik.log('Config: %s', Payload())
+
+    assert Payload.formatted is False
+    assert rubrik._log_enabled() is False
+
+
+def test_log_payload_size(mocker, caplog):
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", enable_logging=True, log_payload_size=10)
+    caplog.clear()
+
+    rubrik._prepare_request('POST', 'v1', '/vmware/vm/snapshot', config={"slaId": "0123456789abcdef"})
+
+    assert caplog.records[-1].getMessage() == 'Config: {"slaId": ... <19 more characters>'
+
+
+@pytest.mark.parametrize('limit, message', [
+    (None, '{"slaId": "Gold"}'),
+    (20, '{"slaId": "Gold"}'),
+    (5, '{"sla... <12 more characters>'),
+    (0, '<17 characters redacted>'),
+])
+def test_log_payload_limit(limit, message):
+
+    assert str(rubrik_cdm.api._LogPayload('{"slaId": "Gold"}', limit)) == message
+
+
+def test_log_payload_bytes():
+
+    assert str(rubrik_cdm.api._LogPayload(b'{"slaId": "Gold"}')) == '{"slaId": "Gold"}'
+
+
+def test_log_payload_size_invalid():
+
+    with pytest.raises(rubrik_cdm.exceptions.InvalidParameterException):
+        rubrik_cdm.Connect("10.0.1.1", "user", "password", log_payload_size=-1)
+
+
+def test_request_headers_are_cached(mocker):
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password")
+    mock_b64encode = mocker.patch('rubrik_cdm.rubrik_cdm.base64.b64encode', wraps=rubrik_cdm.rubrik_cdm.base64.b64encode)
+
+    first = rubrik._authorization_header()
+    second = rubrik._authorization_header()
+
+    assert first == second
+    assert first is not second
+    mock_b64encode.assert_called_once()
+    assert rubrik._session.headers["User-Agent"] == first["User-Agent"]
+
+
+def test_request_headers_rebuilt_when_platform_changes():
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password")
+    user_agent = rubrik._header()["User-Agent"]
+
+    rubrik._platform_user_agent("Ansible", "2.9")
+
+    assert rubrik._header()["User-Agent"] == user_agent + "--platform_name--Ansible--platform_version--2.9"
+    assert rubrik._session.headers["User-Agent"] == rubrik._header()["User-Agent"]
+
+
+def test_request_headers_rebuilt_when_credentials_change():
+
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password")
+    rubrik._authorization_header()
+
+    rubrik.api_token = "token"
+
+    assert rubrik._authorization_header()["Authorization"] == "Bearer token"
@@ -0,0 +1,105 @@
+import pytest
+import rubrik_cdm
+from rubrik_cdm.exceptions import InvalidParameterException, InvalidTypeException
+from .conftest import mock_response
+
+
+def sent_requests(mock_session_request):
+    return [(call[0][0], call[0][1], call[1]["headers"]["Authorization"]) for call in mock_session_request.call_args_list]
+
+
+def test_session_token_created_once(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", use_session_token=True)
+    basic = rubrik._authorization_header(session_token=False)["Authorization"]
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 200, {"id": "session_id", "token": "token_1"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+    ])
+
+    rubrik.get("v1", "/cluster/me/version")
+    rubrik.get("v1", "/cluster/me/version")
+
+    assert sent_requests(mock_session_request) == [
+        ("POST", "https://10.0.1.1/api/v1/session", basic),
+        ("GET", "https://10.0.1.1/api/v1/cluster/me/version", "Bearer token_1"),
+        ("GET", "https://10.0.1.1/api/v1/cluster/me/version", "Bearer token_1"),
+    ]
+
+
+def test_session_token_refreshed_after_interval(mocker):
+    mock_monotonic = mocker.patch("rubrik_cdm.rubrik_cdm._monotonic", return_value=100)
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", use_session_token=True, session_token_refresh=60)
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 200, {"token": "token_1"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+        mock_response(mocker, 200, {"token": "token_2"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+    ])
+
+    rubrik.get("v1", "/cluster/me/version")
+    mock_monotonic.return_value = 160
+    rubrik.get("v1", "/cluster/me/version")
+
+    assert [request[2] for request in sent_requests(mock_session_request)][1::2] == ["Bearer token_1", "Bearer token_2"]
+
+
+def test_session_token_refreshed_on_401(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", use_session_token=True)
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 200, {"token": "token_1"}),
+        mock_response(mocker, 401, {"message": "Unauthorized"}),
+        mock_response(mocker, 200, {"token": "token_2"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+    ])
+
+    assert rubrik.get("v1", "/cluster/me/version") == {"version": "5.0.1-1280"}
+    assert [request[2] for request in sent_requests(mock_session_request)][1::2] == ["Bearer token_1", "Bearer token_2"]
+
+
+def test_session_token_released_on_close(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", use_session_token=True)
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 200, {"token": "token_1"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+        mock_response(mocker, 204, None),
+    ])
+
+    with rubrik:
+        rubrik.get("v1", "/cluster/me/version")
+
+    assert sent_requests(mock_session_request)[-1] == ("DELETE", "https://10.0.1.1/api/v1/session/me", "Bearer token_1")
+    assert rubrik._session_token is None
+
+
+def test_session_token_close_closes_session(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", "user", "password", use_session_token=True)
+    mock_session_request = mocker.patch.object(rubrik._session, "request", side_effect=[
+        mock_response(mocker, 200, {"token": "token_1"}),
+        mock_response(mocker, 200, {"version": "5.0.1-1280"}),
+        mock_response(mocker, 204, None),
+    ])
+    mock_session_close = mocker.patch.object(rubrik._session, "close")
+
+    rubrik.get("v1", "/cluster/me/version")
+    rubrik.close()
+
+    assert sent_requests(mock_session_request)[-1] == ("DELETE", "https://10.0.1.1/api/v1/session/me", "Bearer token_1")
+    assert rubrik._session_token is None
+    mock_session_close.assert_called_once_with()
+
+
+def test_session_token_not_used_with_api_token(mocker):
+    rubrik = rubrik_cdm.Connect("10.0.1.1", api_token="api_token", use_session_token=True)
+
+    assert rubrik._authorization_header()["Authorization"] == "Bearer api_token"
+
+
+@pytest.mark.parametrize("use_session_token, session_token_refresh, error", [
+    ("yes", 1800, InvalidTypeException),
+    (True, "1800", InvalidTypeException),
+    (True, 0, InvalidParameterException),
+])
+def test_session_token_invalid_parameters(use_session_token, session_token_refresh, error):
+    with pytest.raises(error):
+        rubrik_cdm.Connect("10.0.1.1", "user", "password", use_session_token=use_session_token, session_token_refresh=session_token_refresh)